@@ -14,6 +14,7 @@ limitations under the License. */
 
 #pragma once
 
+#include <cstdint>
 #include <deque>
 #include <memory>
 #include <set>
@@ -97,7 +98,11 @@ class BlockDesc {
 
   void RemoveOpInternal(const OpDesc *op_desc);
 
-  void RemoveVar(const std::string &name) { vars_.erase(name); }
+  void RemoveVar(const std::string &name) {
+    if (vars_.erase(name) > 0) {
+      ++generation_;
+    }
+  }
 
   std::vector<OpDesc *> AllOps() const;
 
@@ -111,10 +116,15 @@ class BlockDesc {
 
   ProgramDesc *Program() const { return this->prog_; }
 
+  // The generation is increased whenever ops or vars are added or removed,
+  // so that the python side can skip synchronizing an unchanged block.
+  uint64_t Generation() const { return generation_; }
+
  private:
   ProgramDesc *prog_;       // not_own
   proto::BlockDesc *desc_;  // not_own
   bool need_update_;
+  uint64_t generation_{0};
 
   std::deque<std::unique_ptr<OpDesc>> ops_;
   std::unordered_map<std::string, std::unique_ptr<VarDesc>> vars_;
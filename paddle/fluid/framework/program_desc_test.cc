@@ -176,5 +176,33 @@ TEST(ProgramDescBind, serialize_and_deserialize) {
               op_origin->Proto()->SerializeAsString());
   }
 }
+
+TEST(BlockDesc, generation) {
+  ProgramDesc program;
+  auto* block = program.MutableBlock(0);
+  uint64_t generation = block->Generation();
+
+  block->Var("X");
+  ASSERT_GT(block->Generation(), generation);
+  generation = block->Generation();
+  // an existing var is not changed
+  block->Var("X")->SetShape({10});
+  ASSERT_EQ(block->Generation(), generation);
+
+  block->AppendOp()->SetType("relu");
+  ASSERT_GT(block->Generation(), generation);
+  generation = block->Generation();
+  // an op changed in place is not a change of the block
+  block->Op(0)->SetType("sigmoid");
+  ASSERT_EQ(block->Generation(), generation);
+
+  block->InsertOp(0);
+  block->RemoveOp(0, 1);
+  ASSERT_EQ(block->Generation(), generation + 2);
+  block->RemoveVar("Y");
+  ASSERT_EQ(block->Generation(), generation + 2);
+  block->RemoveVar("X");
+  ASSERT_EQ(block->Generation(), generation + 3);
+}
 }  // namespace framework
 }  // namespace paddle
@@ -94,6 +94,7 @@ void BindBlockDesc(pybind11::module *m) {
       .def("_insert_op", &pd::BlockDesc::InsertOp,
            pybind11::return_value_policy::reference)
       .def("_remove_op", &pd::BlockDesc::RemoveOp)
+      .def("_generation", &pd::BlockDesc::Generation)
       .def("var",
            [](pd::BlockDesc &self, pybind11::bytes byte_name) {
              std::string name = byte_name;
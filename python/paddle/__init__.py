@@ -27,8 +27,29 @@ except ImportError:
      import paddle from the source directory; please install paddlepaddle*.whl firstly.'''
                      )
 
+import sys
+import importlib
+from paddle.utils.lazy_import import LazyModule
+
+# NOTE: the high-level and optional packages are imported on first access
+#       to make `import paddle` fast, setting the environment variable
+#       PADDLE_LAZY_IMPORT=0 imports them eagerly as before.
+_lazy_import = os.environ.get('PADDLE_LAZY_IMPORT', '1').lower() not in [
+    '0', 'false', 'off'
+]
+
+
+def _import_module(local_name, module_name):
+    if _lazy_import:
+        if module_name not in sys.modules:
+            globals()[local_name] = LazyModule(local_name,
+                                               globals(), module_name)
+    else:
+        globals()[local_name] = importlib.import_module(module_name)
+
+
 import paddle.reader
-import paddle.dataset
+_import_module('dataset', 'paddle.dataset')
 import paddle.batch
 batch = batch.batch
 from .fluid import monkey_patch_variable
@@ -39,12 +60,11 @@ import paddle.framework
 from .framework import VarBase as Tensor
 from .framework import ComplexVariable as ComplexTensor
 import paddle.compat
-import paddle.distributed
+_import_module('distributed', 'paddle.distributed')
 import paddle.sysconfig
 import paddle.tensor
 import paddle.distribution
 import paddle.nn
-import paddle.distributed.fleet
 import paddle.optimizer
 import paddle.metric
 import paddle.device
@@ -274,10 +294,26 @@ from . import static
 from . import amp
 
 # high-level api
-from .hapi import Model
-from .hapi import callbacks
-from .hapi import summary
-import paddle.text
-import paddle.vision
+_import_module('text', 'paddle.text')
+_import_module('vision', 'paddle.vision')
+_import_module('hapi', 'paddle.hapi')
+_lazy_hapi_attrs = ['Model', 'callbacks', 'summary']
+if _lazy_import and sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+        if name in _lazy_hapi_attrs:
+            value = getattr(importlib.import_module('paddle.hapi'), name)
+            globals()[name] = value
+            return value
+        raise AttributeError("module 'paddle' has no attribute '{}'".format(
+            name))
+
+    def __dir__():
+        return sorted(set(globals().keys()) | set(_lazy_hapi_attrs))
+else:
+    # NOTE: module level __getattr__ is not supported before Python 3.7
+    from .hapi import Model
+    from .hapi import callbacks
+    from .hapi import summary
 
 disable_static()
@@ -22,6 +22,7 @@ import shutil
 import six
 import sys
 import importlib
+import numpy as np
 import paddle.dataset
 import six.moves.cPickle as pickle
 import glob
@@ -207,3 +208,64 @@ def _check_exists_and_download(path, url, md5, module_name, download=True):
     else:
         raise ValueError('{} not exists and auto download disabled'.format(
             path))
+
+
+def _load_cached_arrays(cache_prefix, sources, names, decode_fn):
+    """
+    Load arrays decoded from `sources` files from the `.npy` cache files
+    `<cache_prefix>.<name>.npy` by memory mapping. If any cache file does
+    not exist or is older than the source files, call `decode_fn` to
+    decode the arrays as a dict keyed by `names`, and write them to the
+    cache files.
+    """
+    cache_paths = dict((name, '{}.{}.npy'.format(cache_prefix, name))
+                       for name in names)
+    source_mtime = max(os.path.getmtime(source) for source in sources)
+    if all(
+            os.path.isfile(path) and os.path.getmtime(path) >= source_mtime
+            for path in cache_paths.values()):
+        return dict((name, np.load(
+            path, mmap_mode='r')) for name, path in cache_paths.items())
+
+    arrays = decode_fn()
+    cache_dir = os.path.dirname(cache_prefix)
+    if cache_dir and not os.path.isdir(cache_dir):
+        try:
+            os.makedirs(cache_dir)
+        except OSError as exc:
+            if exc.errno != errno.EEXIST:
+                raise
+    for name, path in cache_paths.items():
+        # write to a temporary file and rename, so that processes
+        # loading the cache concurrently never see a partial file
+        tmp_path = '{}.tmp{}'.format(path, os.getpid())
+        with open(tmp_path, 'wb') as f:
+            np.save(f, arrays[name])
+        os.rename(tmp_path, path)
+    return arrays
+
+
+def _pack_sequences(seqs, dtype='int32'):
+    """
+    Pack the variable-length sequences `seqs` into a flat array of all
+    elements and an int64 offsets array of length `len(seqs) + 1`, the
+    i-th sequence is `values[offsets[i]:offsets[i + 1]]`.
+    """
+    offsets = np.zeros([len(seqs) + 1], dtype='int64')
+    if len(seqs) > 0:
+        np.cumsum([len(seq) for seq in seqs], out=offsets[1:])
+    values = np.fromiter(
+        (x for seq in seqs for x in seq), dtype=dtype, count=int(offsets[-1]))
+    return values, offsets
+
+
+def _unpack_sequences(values, offsets):
+    """
+    The inverse of `_pack_sequences`, return the packed sequences as a
+    list of python lists.
+    """
+    values = values.tolist()
+    offsets = offsets.tolist()
+    return [
+        values[begin:end] for begin, end in zip(offsets[:-1], offsets[1:])
+    ]
@@ -266,6 +266,44 @@ def _rename_arg_(op_descs, old_name, new_name, begin_idx=None, end_idx=None):
                     op_desc._rename_output(old_name, new_name)
 
 
+class _VarUseIndex(object):
+    """
+    Incremental index from variable name to the op descs using the variable as
+    input or output, so that renaming a variable only visits the ops using it
+    instead of all the op descs, see `_rename_arg_`.
+    """
+
+    def __init__(self):
+        # {var_name: [(op_idx, op_desc)]}
+        self._var_to_ops = collections.defaultdict(list)
+
+    def add(self, op_desc, op_idx=None):
+        names = set(op_desc.input_arg_names())
+        names.update(op_desc.output_arg_names())
+        for name in names:
+            self._var_to_ops[name].append((op_idx, op_desc))
+
+    def rename(self, old_name, new_name, begin_idx=None, end_idx=None):
+        """
+        Renames `old_name` as `new_name` in the indexed op descs whose op_idx is
+        in [begin_idx, end_idx), or in all the indexed op descs if not specified.
+        """
+        if old_name not in self._var_to_ops:
+            return
+        kept, renamed = [], []
+        for op_idx, op_desc in self._var_to_ops.pop(old_name):
+            if (begin_idx is None or op_idx >= begin_idx) and \
+                    (end_idx is None or op_idx < end_idx):
+                op_desc._rename_input(old_name, new_name)
+                op_desc._rename_output(old_name, new_name)
+                renamed.append((op_idx, op_desc))
+            else:
+                kept.append((op_idx, op_desc))
+        if kept:
+            self._var_to_ops[old_name] = kept
+        self._var_to_ops[new_name].extend(renamed)
+
+
 def _create_op_desc_(op_type, inputs, outputs, attrs):
     """
     Create a C++ OpDesc object with specified inputs, outputs and attributes.
@@ -349,10 +387,10 @@ def _some_in_set_(cands, s):
     """
     if len(cands) == 0:
         return False
-    literal_set = cpt.to_text(s)
-    literal_cands = cpt.to_text(cands)
-    for c in literal_cands:
-        if c in literal_set:
+    # NOTE: only convert the candidates, converting `s` in every call makes
+    #       the callers iterating ops with a growing `s` quadratic.
+    for c in cands:
+        if c in s or cpt.to_text(c) in s:
             return True
     return False
 
@@ -424,18 +462,33 @@ def _addup_repetitive_outputs_(op_descs, block_idx):
     var_rename_count = collections.defaultdict(int)
     renamed_vars = collections.defaultdict(list)
     renamed_var_start_idx = collections.defaultdict(list)
+    # NOTE: renaming a variable by scanning all the op descs before it makes
+    #       this function quadratic, so index the variables of visited op
+    #       descs and pending sum ops, and rename by the indexes.
+    op_index = _VarUseIndex()
+    pending_index = _VarUseIndex()
+    empty_var_name = core.empty_var_name()
+
+    def _accumulate_gradients_(var_name, op_idx):
+        num_pending = len(pending_sum_ops.get(op_idx, []))
+        if len(renamed_vars[var_name]) > _MAX_ADD_NUM_:
+            _accumulate_gradients_by_sum_op_(var_name, renamed_vars,
+                                             pending_sum_ops, op_idx)
+        else:
+            _accumulate_gradients_by_add_ops_(var_name, renamed_vars,
+                                              pending_sum_ops, op_idx)
+        for pending_op in pending_sum_ops[op_idx][num_pending:]:
+            pending_index.add(pending_op)
+
     for idx, op_desc in enumerate(op_descs):
-        for var_name in op_desc.input_arg_names():
+        input_arg_names = op_desc.input_arg_names()
+        for var_name in input_arg_names:
             if "@GRAD" not in var_name:
                 continue
             if len(renamed_vars[var_name]) > 1:
-                if len(renamed_vars[var_name]) > _MAX_ADD_NUM_:
-                    _accumulate_gradients_by_sum_op_(var_name, renamed_vars,
-                                                     pending_sum_ops, idx)
-                else:
-                    _accumulate_gradients_by_add_ops_(var_name, renamed_vars,
-                                                      pending_sum_ops, idx)
+                _accumulate_gradients_(var_name, idx)
 
+        input_arg_names = set(input_arg_names)
         for param_idx, param_name in enumerate(op_desc.output_names()):
             arg_names = op_desc.output(param_name)
             for arg_idx, var_name in enumerate(arg_names):
@@ -443,8 +496,7 @@ def _addup_repetitive_outputs_(op_descs, block_idx):
                     continue
                 #if "@RENAME@" in var_name:
                 #    continue
-                if var_name == core.empty_var_name(
-                ) or var_name in op_desc.input_arg_names():
+                if var_name == empty_var_name or var_name in input_arg_names:
                     # empty variable or inplace op
                     continue
                 if len(renamed_vars[var_name]) == 0:
@@ -462,9 +514,9 @@ def _addup_repetitive_outputs_(op_descs, block_idx):
                         #                             new_name, 0, idx)
                         # rename arg from idx of the first appearance
                         # in backward, not always from 0
-                        _rename_arg_(op_descs, var_name, new_name,
-                                     renamed_var_start_idx[var_name], idx)
-                        _rename_arg_(pending_sum_ops, var_name, new_name)
+                        op_index.rename(var_name, new_name,
+                                        renamed_var_start_idx[var_name], idx)
+                        pending_index.rename(var_name, new_name)
 
                         for p in op_desc.output_names()[:param_idx]:
                             p_arg_names = op_desc.output(p)
@@ -486,27 +538,22 @@ def _addup_repetitive_outputs_(op_descs, block_idx):
                     op_desc.set_output(param_name, arg_names)
                     renamed_vars[var_name].append(new_name)
 
+        op_index.add(op_desc, idx)
+
     for var_name, inputs in six.iteritems(renamed_vars):
         if len(renamed_vars[var_name]) > 1:
-            if len(renamed_vars[var_name]) > _MAX_ADD_NUM_:
-                _accumulate_gradients_by_sum_op_(var_name, renamed_vars,
-                                                 pending_sum_ops, len(op_descs))
-            else:
-                _accumulate_gradients_by_add_ops_(var_name, renamed_vars,
-                                                  pending_sum_ops,
-                                                  len(op_descs))
-
-    # sum_op descs are sorted according to their insert position
-    for key, value in collections.OrderedDict(
-            reversed(list(pending_sum_ops.items()))).items():
-
-        # NOTE(zhiqiu): Since reversed, the idx of op_descs to be inserted will remains correct.
-        # For example, [0, 1, 2], and we want to insert 'a' at idx 1, 'b' at idx 2, and the expected result is [0, 1, 'a', 2, 'b'].
-        # If reversed, we first insert 'b' at idx 2, it becomes [0, 1, 2, 'b'], and then insert 'a' at idx 1, it becomes [0, 1, 'a', 2, 'b'].
-        # If not reverse, we first insert 'a' at idx 1, it becomes [0, 1, 'a', 2], and then insert 'b' at idx 2, it becomes [0, 1, 'a', 'b', 2].
-        idx = key
-        for i, op in enumerate(value):
-            op_descs.insert(idx + i, op)
+            _accumulate_gradients_(var_name, len(op_descs))
+
+    # sum_op descs are inserted before the op desc at their insert position.
+    # NOTE: merge into a new list in one pass, inserting into the list one by
+    #       one is quadratic.
+    if pending_sum_ops:
+        merged_op_descs = []
+        for idx, op_desc in enumerate(op_descs):
+            merged_op_descs.extend(pending_sum_ops.get(idx, []))
+            merged_op_descs.append(op_desc)
+        merged_op_descs.extend(pending_sum_ops.get(len(op_descs), []))
+        op_descs[:] = merged_op_descs
 
     return op_descs
 
@@ -519,13 +566,15 @@ def _remove_no_grad_branch_(op_descs, no_grad_set):
         2. all grad inputs of the grad op are in 'no_grad_set'
     """
 
+    grad_var_suffix = core.grad_var_suffix()
+
     def _op_can_be_removed_(op_desc, no_grad_set):
         out_arg_names = op_desc.output_arg_names()
         if len(out_arg_names) == 0 or _all_in_set_(out_arg_names, no_grad_set):
             return True
         if _all_in_set_([
                 name for name in op_desc.input_arg_names()
-                if name.find(core.grad_var_suffix()) != -1
+                if name.find(grad_var_suffix) != -1
         ], no_grad_set):
             no_grad_set.update(out_arg_names)
             return True
@@ -536,21 +585,23 @@ def _remove_no_grad_branch_(op_descs, no_grad_set):
         op_desc for op_desc in op_descs
         if not _op_can_be_removed_(op_desc, no_grad_set)
     ]
-    # Insert fill_zeros_like_op
-    to_insert = []
-    for idx, op_desc in enumerate(op_descs):
+    # Insert fill_zeros_like_op before the op desc using it.
+    # NOTE: build a new list in one pass, inserting into the list one by one
+    #       is quadratic.
+    new_op_descs = []
+    for op_desc in op_descs:
         for arg in op_desc.input_arg_names():
             # arg is a gradient var name and arg should not have gradient
-            if core.grad_var_suffix() in arg and arg in no_grad_set:
+            if grad_var_suffix in arg and arg in no_grad_set:
                 x_in = _strip_grad_suffix_(arg)
                 # the reason should be: arg can be input of another grad op
                 # and the op is a not-to-remove op
-                to_insert.append((_create_op_desc_(
-                    "fill_zeros_like", {"X": [x_in]}, {"Out": [arg]}, {}), idx))
+                new_op_descs.append(
+                    _create_op_desc_("fill_zeros_like", {"X": [x_in]},
+                                     {"Out": [arg]}, {}))
+        new_op_descs.append(op_desc)
 
-    list([op_descs.insert(p[1], p[0]) for p in reversed(to_insert)])
-
-    return op_descs
+    return new_op_descs
 
 
 def _find_not_need_ops(grad_op_descs, forward_ops, input_grad_names_set):
@@ -603,14 +654,14 @@ def _find_not_need_ops(grad_op_descs, forward_ops, input_grad_names_set):
     var_versions = dict()
 
     def _create_node(name):
-        if name not in var_versions.keys():
+        if name not in var_versions:
             var_versions[name] = [Var(name)]
         else:
             var_versions[name].append(Var(name))
         return var_versions[name][-1]
 
     def _create_or_get_last_version_node(name):
-        if name not in var_versions.keys():
+        if name not in var_versions:
             var_versions[name] = [Var(name)]
         return var_versions[name][-1]
 
@@ -655,10 +706,16 @@ def _find_not_need_ops(grad_op_descs, forward_ops, input_grad_names_set):
         op_list = [special_op_node]
         ready_vars = set(special_op_node.inputs)
         remove_ops = True
-        candidate_ops = [special_op_node]
+        candidate_ops = collections.deque([special_op_node])
+        # NOTE: an op may be reached from several outputs, and visiting it
+        #       again adds nothing new.
+        visited_ops = set()
         while len(candidate_ops) > 0:
-            op_node = candidate_ops.pop(0)
+            op_node = candidate_ops.popleft()
+            if op_node in visited_ops:
+                continue
             if _all_in_set_(op_node.inputs, ready_vars):
+                visited_ops.add(op_node)
                 for out_var in op_node.outputs:
                     candidate_ops.extend(out_var.pendding_ops)
                     op_list.extend(out_var.pendding_ops)
@@ -957,6 +1014,7 @@ def _append_backward_ops_(block,
     # grad_op_descs holds created grad_op, and will be appended to target_block
     grad_op_descs = []
     program = block.program
+    grad_var_suffix = core.grad_var_suffix()
 
     rename_var_map = {}
 
@@ -1027,7 +1085,7 @@ def _append_backward_ops_(block,
             for op_desc in grad_op_desc:
                 input_grad_names = [
                     name for name in op_desc.input_arg_names()
-                    if name.find(core.grad_var_suffix()) != -1
+                    if name.find(grad_var_suffix) != -1
                 ]
                 # some code of gradient ops, like increment, are not very
                 # standard, there is no @GRAD in these ops' inputs.
@@ -1057,9 +1115,10 @@ def _append_backward_ops_(block,
     # remove some backward ops
     not_need_ops = _find_not_need_ops(grad_op_descs, ops, input_grad_names_set)
 
-    grad_op_descs = [
-        op_desc for op_desc in grad_op_descs if op_desc not in not_need_ops
-    ]
+    if not_need_ops:
+        grad_op_descs = [
+            op_desc for op_desc in grad_op_descs if op_desc not in not_need_ops
+        ]
 
     # append op_desc in grad_op_descs to target_block
     op_role_attr_name = core.op_proto_and_checker_maker.kOpRoleAttrName()
@@ -1201,8 +1260,15 @@ def _append_backward_vars_(block, start_op_idx, grad_to_var, grad_info_map):
             if arg in new_vars:
                 _infer_var_data_type_shape_(arg, block)
 
-    for op_idx in reversed(ops_to_remove):
-        block.desc._remove_op(op_idx, op_idx + 1)
+    # remove the consecutive ops at once
+    end_idx = None
+    for i, op_idx in enumerate(reversed(ops_to_remove)):
+        if end_idx is None:
+            end_idx = op_idx + 1
+        if i + 1 == len(ops_to_remove) or \
+                ops_to_remove[-i - 2] != op_idx - 1:
+            block.desc._remove_op(op_idx, end_idx)
+            end_idx = None
 
 
 def _rename_grad_(block, start_op_idx, grad_to_var, target_grad_map):
@@ -17,6 +17,8 @@ from __future__ import print_function
 import copy
 import six
 import warnings
+import collections
+import numpy as np
 
 import functools
 from . import layers
@@ -373,9 +375,15 @@ class ClipGradByGlobalNorm(ClipGradBase):
         ``need_clip`` of ``ClipGradyGlobalNorm`` HAS BEEN DEPRECATED since 2.0. 
         Please use ``need_clip`` in ``ParamAttr`` to speficiy the clip scope.
 
+    In dygraph mode, the dense gradients are coalesced into one flat buffer per dtype, the global
+    norm is reduced over the flat buffers and the gradients are scaled in place.
+
     Args:
         clip_norm (float): The maximum norm value.
         group_name (str, optional): The group name for this clip. Default value is ``default_group``.
+        skip_nonfinite (bool, optional): Whether to skip the update of all the parameters if the
+            global norm is inf or nan in dygraph mode, ``found_nonfinite`` of the clip tells whether
+            the last step is skipped. Default value is False.
 
     Examples:
         .. code-block:: python
@@ -395,52 +403,153 @@ class ClipGradByGlobalNorm(ClipGradBase):
             sdg.step()
     """
 
-    def __init__(self, clip_norm, group_name="default_group"):
+    def __init__(self,
+                 clip_norm,
+                 group_name="default_group",
+                 skip_nonfinite=False):
         super(ClipGradByGlobalNorm, self).__init__()
         self.clip_norm = float(clip_norm)
         self.group_name = group_name
+        self.skip_nonfinite = skip_nonfinite
+        # whether the global norm of the last clipped gradients in dygraph
+        # mode is inf or nan
+        self.found_nonfinite = False
+        # the flat gradient buffers by dtype, kept across steps in dygraph
+        self._flat_grads = {}
+        self._flat_grads_key = None
 
     def __str__(self):
         return "Gradient Clip By GlobalNorm, global_norm=%f" % (self.clip_norm)
 
+    def _coalesce_grads(self, grads_by_dtype):
+        # NOTE: the dense gradients are made views of slices of one flat
+        #       buffer per dtype by the coalesce_tensor op, so that the
+        #       global norm is reduced and the gradients are scaled with
+        #       a few ops per dtype instead of a few ops per gradient. The
+        #       buffers are kept across steps, and a gradient is copied
+        #       into its buffer only if it is not a view of it anymore.
+        key = tuple((dtype, tuple(g.name for g in grads))
+                    for dtype, grads in grads_by_dtype.items())
+        if key != self._flat_grads_key:
+            self._flat_grads = {}
+            self._flat_grads_key = key
+        flat_grads = []
+        for dtype, grads in grads_by_dtype.items():
+            flat_grad = self._flat_grads.get(dtype, None)
+            if flat_grad is None:
+                flat_grad = framework._varbase_creator(dtype=dtype)
+                self._flat_grads[dtype] = flat_grad
+                # NOTE: each gradient segment of the buffer is padded to the
+                #       alignment of the place, and the padding is never
+                #       written by the copies below. Zero the whole buffer
+                #       once when it is allocated, with placeholder outputs
+                #       so that the gradients are not overwritten, then the
+                #       norm of the buffer is the norm of the gradients.
+                framework._dygraph_tracer().trace_op(
+                    type='coalesce_tensor',
+                    inputs={'Input': grads},
+                    outputs={
+                        'Output': [
+                            framework._varbase_creator(dtype=dtype)
+                            for _ in grads
+                        ],
+                        'FusedOutput': flat_grad
+                    },
+                    attrs={
+                        'set_constant': True,
+                        'constant': 0.0,
+                        'dtype': dtype
+                    })
+            framework._dygraph_tracer().trace_op(
+                type='coalesce_tensor',
+                inputs={'Input': grads},
+                outputs={'Output': grads,
+                         'FusedOutput': flat_grad},
+                attrs={'copy_data': True,
+                       'dtype': dtype})
+            flat_grads.append(flat_grad)
+        return flat_grads
+
     @imperative_base.no_grad
     def _dygraph_clip(self, params_grads):
         params_and_grads = []
         sum_square_list = []
+        grads_by_dtype = collections.OrderedDict()
+        sparse_params_grads = []
         for p, g in params_grads:
             if g is None:
                 continue
             if getattr(p, 'need_clip', True) is False:
                 continue
-            merge_grad = g
             if g.type == core.VarDesc.VarType.SELECTED_ROWS:
                 merge_grad = layers.merge_selected_rows(g)
                 merge_grad = layers.get_tensor_from_selected_rows(merge_grad)
-            square = layers.square(merge_grad)
-            sum_square = layers.reduce_sum(square)
+                square = layers.square(merge_grad)
+                sum_square = layers.reduce_sum(square)
+                sum_square_list.append(sum_square)
+                sparse_params_grads.append((p, g))
+            else:
+                grads_by_dtype.setdefault(g.dtype, []).append(g)
+
+        flat_grads = self._coalesce_grads(grads_by_dtype)
+        for flat_grad in flat_grads:
+            if flat_grad.dtype == core.VarDesc.VarType.FP32:
+                sum_square = core.ops.squared_l2_norm(flat_grad)
+            else:
+                sum_square = layers.reduce_sum(layers.square(flat_grad))
             sum_square_list.append(sum_square)
 
         # all parameters have been filterd out
         if len(sum_square_list) == 0:
             return params_grads
 
-        global_norm_var = layers.concat(sum_square_list)
-        global_norm_var = layers.reduce_sum(global_norm_var)
+        if len(sum_square_list) == 1:
+            global_norm_var = sum_square_list[0]
+        else:
+            # the squared sums of different dtypes are added in float32
+            global_norm_var = layers.sums([
+                layers.cast(
+                    x, 'float32') if x.dtype != core.VarDesc.VarType.FP32 else x
+                for x in sum_square_list
+            ])
         global_norm_var = layers.sqrt(global_norm_var)
+
+        if self.skip_nonfinite:
+            self.found_nonfinite = not np.all(
+                np.isfinite(global_norm_var.numpy()))
+            if self.found_nonfinite:
+                # skip the update of all the parameters
+                return []
+
         max_global_norm = layers.fill_constant(
             shape=[1], dtype=global_norm_var.dtype, value=self.clip_norm)
         clip_var = layers.elementwise_div(
             x=max_global_norm,
             y=layers.elementwise_max(
                 x=global_norm_var, y=max_global_norm))
+
+        # the dense gradients are scaled in place through the flat buffers
+        for flat_grad in flat_grads:
+            flat_clip_var = clip_var
+            if flat_grad.dtype != clip_var.dtype:
+                flat_clip_var = layers.cast(clip_var, flat_grad.dtype)
+            framework._dygraph_tracer().trace_op(
+                type='elementwise_mul',
+                inputs={'X': flat_grad,
+                        'Y': flat_clip_var},
+                outputs={'Out': flat_grad},
+                attrs={'axis': -1})
+
+        sparse_grads = dict(
+            (p.name, layers.elementwise_mul(
+                x=g, y=clip_var)) for p, g in sparse_params_grads)
         for p, g in params_grads:
             if g is None:
                 continue
-            if getattr(p, 'need_clip', True) is False:
+            if p.name in sparse_grads:
+                params_and_grads.append((p, sparse_grads[p.name]))
+            else:
                 params_and_grads.append((p, g))
-                continue
-            new_grad = layers.elementwise_mul(x=g, y=clip_var)
-            params_and_grads.append((p, new_grad))
 
         return params_and_grads
 
@@ -0,0 +1,159 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import six
+import numbers
+import numpy as np
+
+import paddle
+from .. import layers
+
+__all__ = []
+
+
+def _is_leaf(field):
+    return isinstance(field, (np.ndarray, np.generic, paddle.Tensor,
+                              numbers.Number))
+
+
+def _flatten_sample(sample, fields=None):
+    """
+    Flatten a (maybe nested) sample into a list of leaf fields in
+    depth-first order, dict values are visited in sorted key order so
+    that every sample of a batch is flattened in the same order.
+    """
+    if fields is None:
+        fields = []
+    if _is_leaf(sample):
+        fields.append(sample)
+    elif isinstance(sample, dict):
+        for key in sorted(sample.keys()):
+            _flatten_sample(sample[key], fields)
+    elif isinstance(sample, (list, tuple)):
+        for field in sample:
+            _flatten_sample(field, fields)
+    else:
+        raise RuntimeError("Unknown data type {}".format(type(sample)))
+    return fields
+
+
+def _sample_fields(sample):
+    # fast path for the most common sample layout: a flat list/tuple
+    # of numpy arrays, which needs no flattening at all
+    if isinstance(sample, np.ndarray):
+        return [sample]
+    if isinstance(sample, (list, tuple)):
+        for field in sample:
+            if not isinstance(field, np.ndarray):
+                break
+        else:
+            return sample
+    return _flatten_sample(sample)
+
+
+class _BatchCollator(object):
+    """
+    Collate samples into batch fields by writing each sample in place.
+
+    Shape and dtype of each field are inferred from the first sample, one
+    contiguous output buffer of shape :code:`[batch_size] + field_shape`
+    is allocated per field, and every sample is copied into its row of the
+    buffer directly, which avoids building per-field Python lists and the
+    extra copy made by :code:`np.stack`. The buffer is reallocated with the
+    promoted dtype if a later sample needs it, as :code:`np.stack` does.
+    """
+
+    def __init__(self, first_sample, batch_size):
+        self._fields = _sample_fields(first_sample)
+        self._batch_size = batch_size
+        self._outputs = []
+        for field in self._fields:
+            if isinstance(field, paddle.Tensor):
+                # paddle.Tensor can not be written in place, gather them
+                # and stack with layers.stack as before
+                self._outputs.append([])
+            else:
+                field = np.asarray(field)
+                self._outputs.append(
+                    np.empty(
+                        (batch_size, ) + field.shape, dtype=field.dtype))
+
+    def _write(self, idx, fields):
+        if len(fields) != len(self._outputs):
+            raise RuntimeError(
+                "sample {} has {} fields, but the first sample of the "
+                "batch has {} fields".format(idx,
+                                              len(fields), len(self._outputs)))
+        for i, (out, field) in enumerate(zip(self._outputs, fields)):
+            if isinstance(out, list):
+                out.append(field)
+                continue
+            field = np.asarray(field)
+            # NOTE: numpy assignment broadcasts silently, check shape
+            #       explicitly to keep the same behavior as np.stack
+            if field.shape != out.shape[1:]:
+                raise ValueError(
+                    "field {} of sample {} has shape {}, but expect shape {} "
+                    "as the first sample".format(i, idx, field.shape,
+                                                 out.shape[1:]))
+            # NOTE: numpy assignment casts silently too, e.g. floats to
+            #       ints or longer strings to shorter ones, promote the
+            #       buffer to the dtype np.stack gives in such case
+            if field.dtype != out.dtype:
+                dtype = np.result_type(out.dtype, field.dtype)
+                if dtype != out.dtype:
+                    promoted = np.empty(out.shape, dtype=dtype)
+                    promoted[:idx] = out[:idx]
+                    self._outputs[i] = out = promoted
+            out[idx] = field
+
+    def collate(self, batch):
+        self._write(0, self._fields)
+        for idx in six.moves.range(1, self._batch_size):
+            self._write(idx, _sample_fields(batch[idx]))
+
+        return [
+            layers.stack(
+                out, axis=0) if isinstance(out, list) else out
+            for out in self._outputs
+        ]
+
+
+def default_collate_fn(batch):
+    """
+    Default batch collating function for :code:`fluid.io.DataLoader`,
+    batch should be a list of samples, and each sample should be a list
+    of fields as follows:
+
+    [[filed1, filed2, ...], [filed1, filed2, ...], ...]
+
+    This default collate function zipped each filed together and stack
+    each filed as the batch field as follows:
+
+    [batch_filed1, batch_filed2, ...]
+
+    Fields are collated into a buffer preallocated by the shape and dtype
+    of the first sample, samples are written into the buffer in place.
+    Sample can also be a nested dict/list/tuple of fields, which will be
+    flattened in depth-first order(dict in sorted key order) as above.
+
+    Args:
+        batch(list of list of numpy array): the batch data, each fields
+              should be a numpy array, each sample should be a list of
+              fileds, and batch should be a list of sample.
+
+    Returns:
+        a list of numpy array: collated batch
+    """
+    return _BatchCollator(batch[0], len(batch)).collate(batch)
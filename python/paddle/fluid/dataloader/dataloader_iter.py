@@ -31,10 +31,11 @@ else:
     import queue
 
 import paddle
-from .. import core, layers
+from .. import core
 from ..framework import in_dygraph_mode
 from ..multiprocess_utils import CleanupFuncRegistrar, _cleanup_mmap, _set_SIGCHLD_handler
 from .fetcher import _IterableDatasetFetcher, _MapDatasetFetcher
+from .collate import default_collate_fn
 
 __all__ = ['get_worker_info']
 
@@ -42,51 +43,103 @@ __all__ = ['get_worker_info']
 # hanging in subprocess data loading
 MP_INDICES_CHECK_INTERVAL = 5
 
+# in adaptive prefetch mode, reader is considered starved if waiting
+# for a batch longer than PREFETCH_STARVED_THRESHOLD seconds, and the
+# outstanding batch number can grow to MAX_PREFETCH_SCALE times of
+# the initial value at most
+PREFETCH_STARVED_THRESHOLD = 0.001
+MAX_PREFETCH_SCALE = 4
+
 _IterableDatasetStopIteration = namedtuple('_IterableDatasetStopIteration',
                                            ['worker_id'])
 
 
-def default_collate_fn(batch):
+class _ResumeIteration(object):
     """
-    Default batch collating function for :code:`fluid.io.DataLoader`,
-    batch should be a list of samples, and each sample should be a list
-    of fields as follows:
-    
-    [[filed1, filed2, ...], [filed1, filed2, ...], ...]
-    
-    This default collate function zipped each filed together and stack
-    each filed as the batch field as follows:
-
-    [batch_filed1, batch_filed2, ...]
-
-    Args:  
-        batch(list of list of numpy array): the batch data, each fields
-              should be a numpy array, each sample should be a list of
-              fileds, and batch should be a list of sample.
-    
-    Returns:
-        a list of numpy array: collated batch
+    Signal put to indices_queue to resume a persistent worker for a new
+    epoch, the worker will put it back to out_queue after all the
+    indices of last epoch put before it are processed.
     """
-    sample = batch[0]
-    # dataset has only 1 field
-    if isinstance(sample, np.ndarray):
-        return [np.stack(batch, axis=0)]
-
-    # batch each field
-    slots = []
-    for items in batch:
-        for i, item in enumerate(items):
-            if len(slots) < len(items):
-                slots.append([item])
-            else:
-                slots[i].append(item)
+    pass
+
+
+class _DataLoaderStats(object):
+    """
+    Accumulated time cost of each DataLoader stage, stages are:
+
+    :attr:`read`: time main process waits on reader for the next batch,
+    high value means the trainer is starved by data loading.
+
+    :attr:`wait`: time reader thread waits on workers' result queue.
+
+    :attr:`fetch`: time of reading samples from dataset in workers.
 
-    if isinstance(slots[0][0], np.ndarray):
-        return [np.stack(slot, axis=0) for slot in slots]
-    elif isinstance(slots[0][0], paddle.Tensor):
-        return [layers.stack(slot, axis=0) for slot in slots]
-    else:
-        raise RuntimeError("Unknown data type {}".format(type(slots[0][0])))
+    :attr:`collate`: time of collating samples into batch in workers.
+
+    Each stage is recorded by only one thread, so no lock is needed.
+    """
+
+    STAGES = ('read', 'wait', 'fetch', 'collate')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        # stage -> [count, total, max]
+        self._records = dict((stage, [0, 0., 0.]) for stage in self.STAGES)
+        self._batch_bytes = 0
+        self.outstanding_capacity = 0
+
+    def record(self, stage, cost):
+        record = self._records[stage]
+        record[0] += 1
+        record[1] += cost
+        record[2] = max(record[2], cost)
+
+    def record_batch_bytes(self, nbytes):
+        # exponential moving average of batch bytes, used to compute
+        # outstanding batch number limit by memory in adaptive prefetch
+        if self._batch_bytes == 0:
+            self._batch_bytes = nbytes
+        else:
+            self._batch_bytes = 0.9 * self._batch_bytes + 0.1 * nbytes
+
+    @property
+    def batch_bytes(self):
+        return self._batch_bytes
+
+    def summary(self):
+        ret = {}
+        for stage, (count, total, max_cost) in self._records.items():
+            ret[stage] = {
+                'count': count,
+                'total': total,
+                'avg': total / count if count > 0 else 0.,
+                'max': max_cost,
+            }
+        ret['batch_bytes'] = int(round(self._batch_bytes))
+        ret['outstanding_capacity'] = self.outstanding_capacity
+        return ret
+
+
+class _TimedCollateFn(object):
+    """
+    Wrap collate_fn to record time cost of last calling.
+    """
+
+    def __init__(self, collate_fn):
+        self.collate_fn = collate_fn
+        self.cost = 0.
+
+    def __call__(self, batch):
+        start = time.time()
+        data = self.collate_fn(batch)
+        self.cost = time.time() - start
+        return data
+
+
+def _batch_bytes(batch):
+    return sum(slot.nbytes for slot in batch if isinstance(slot, np.ndarray))
 
 
 class _DatasetKind(object):
@@ -224,6 +277,10 @@ class _DataLoaderIterBase(object):
         self._worker_init_fn = loader.worker_init_fn
         self._dataset_kind = loader.dataset_kind
         self._pin_memory = loader.pin_memory
+        self._persistent_workers = loader.persistent_workers
+        self._adaptive_prefetch = loader.adaptive_prefetch
+        self._prefetch_memory_limit = loader.prefetch_memory_limit
+        self._stats = loader._stats
 
         # LoDTensorBlockingQueue instance for create_py_reader and a thread
         # to put mini-batch data to self._blocking_queue, mini-batch data
@@ -250,8 +307,9 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
     def __init__(self, loader):
         super(_DataLoaderIterSingleProcess, self).__init__(loader)
 
+        self._timed_collate_fn = _TimedCollateFn(self._collate_fn)
         self._dataset_fetcher = _DatasetKind.create_fetcher(
-            self._dataset_kind, self._dataset, self._collate_fn, True)
+            self._dataset_kind, self._dataset, self._timed_collate_fn, True)
 
         # NOTE: len(self._places) batch data compose as an output
         # iteration, set blocking_queue can cache 2 iteration datas
@@ -284,7 +342,12 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
         try:
             for indices in self._sampler_iter:
                 # read data from dataset in mini-batch
+                start = time.time()
                 batch = self._dataset_fetcher.fetch(indices)
+                collate_cost = self._timed_collate_fn.cost
+                self._stats.record('fetch',
+                                   time.time() - start - collate_cost)
+                self._stats.record('collate', collate_cost)
 
                 # pack as LoDTensorArray
                 array = core.LoDTensorArray()
@@ -331,13 +394,16 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
 
     def __next__(self):
         try:
+            start = time.time()
             if in_dygraph_mode():
-                return self._reader.read_next_var_list()
+                data = self._reader.read_next_var_list()
             else:
                 if self._return_list:
-                    return self._reader.read_next_list()
+                    data = self._reader.read_next_list()
                 else:
-                    return self._reader.read_next()
+                    data = self._reader.read_next()
+            self._stats.record('read', time.time() - start)
+            return data
         except StopIteration:
             self._reader.reset()
             six.reraise(*sys.exc_info())
@@ -351,6 +417,7 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
 def _worker_loop(dataset, dataset_kind, indices_queue, out_queue, done_event,
                  collate_fn, init_fn, worker_id, num_workers,
                  use_shared_memory):
+    collate_fn = _TimedCollateFn(collate_fn)
     try:
         # NOTE: [ mmap files clear ] When the child process exits unexpectedly,
         # some shared memory objects may have been applied for but have not yet
@@ -384,6 +451,15 @@ def _worker_loop(dataset, dataset_kind, indices_queue, out_queue, done_event,
             except queue.Empty:
                 continue
 
+            # ResumeIteration as a new epoch start signal for persistent
+            # workers, re-create fetcher to reset dataset iterator state
+            if isinstance(data, _ResumeIteration):
+                out_queue.put(data)
+                iterator_drained = False
+                fetcher = _DatasetKind.create_fetcher(dataset_kind, dataset,
+                                                      collate_fn, True)
+                continue
+
             # None as poison piil, so worker event should be set
             if data is None:
                 assert done_event.is_set() or iterator_drained, \
@@ -399,15 +475,20 @@ def _worker_loop(dataset, dataset_kind, indices_queue, out_queue, done_event,
                 if init_exception is not None:
                     batch = init_exception
                     init_exception = None
+                    stats = None
                 else:
+                    start = time.time()
                     batch = fetcher.fetch(indices)
+                    # worker stats as (fetch_cost, collate_cost, batch_bytes)
+                    stats = (time.time() - start - collate_fn.cost,
+                             collate_fn.cost, _batch_bytes(batch))
             except Exception as e:
                 if isinstance(
                         e, StopIteration) and dataset_kind == _DatasetKind.ITER:
                     out_queue.put(_IterableDatasetStopIteration(worker_id))
                     iterator_drained = True
                 else:
-                    out_queue.put((idx, e))
+                    out_queue.put((idx, e, None))
             else:
                 if use_shared_memory:
                     # FIXME(dkp): _convert_to_tensor_list only support np.array
@@ -419,10 +500,10 @@ def _worker_loop(dataset, dataset_kind, indices_queue, out_queue, done_event,
                         batch = np_batch
 
                     tensor_list = core._convert_to_tensor_list(batch)
-                    out_queue.put((idx, tensor_list))
+                    out_queue.put((idx, tensor_list, stats))
                     core._remove_tensor_list_mmap_fds(tensor_list)
                 else:
-                    out_queue.put((idx, batch))
+                    out_queue.put((idx, batch, stats))
     except KeyboardInterrupt:
         # NOTE: Main process will raise KeyboardInterrupt anyways, ignore it in child process
         pass
@@ -443,14 +524,6 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         # subprocess wrokers' result queue
         self._data_queue = None
 
-        # data get from _data_queue will be reordered by _rcvd_idx
-        # for data order keeping, data index not equal _rcvd_idx 
-        # will be cached in _task_infos
-        self._send_idx = 0
-        self._rcvd_idx = 0
-        self._batches_outstanding = 0
-        self._task_infos = {}
-
         # indices outstand as _outstanding_capacity at first, and
         # blocking_queue capacity is also _outstanding_capacity.
         # _outstanding_capacity here to make sure each indices_queue
@@ -459,24 +532,77 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         # batches will be composed as an iteration output)
         self._outstanding_capacity = 2 * max(self._num_workers,
                                              len(self._places))
+        # in adaptive prefetch mode, _outstanding_capacity will grow when
+        # reader is starved, and shrink when blocking_queue is full, but
+        # never less than the initial capacity
+        self._min_outstanding_capacity = self._outstanding_capacity
+        if self._stats.outstanding_capacity > 0:
+            self._outstanding_capacity = self._stats.outstanding_capacity
+        self._stats.outstanding_capacity = self._outstanding_capacity
 
         # see _try_put_indices
         self._thread_lock = threading.Lock()
 
         # init workers and indices queues and put 2 indices in each indices queue
         self._init_workers()
+        self._init_epoch()
+        self._shutdown = False
+
+    def _init_epoch(self):
+        # data get from _data_queue will be reordered by _rcvd_idx
+        # for data order keeping, data index not equal _rcvd_idx 
+        # will be cached in _task_infos
+        self._send_idx = 0
+        self._rcvd_idx = 0
+        self._batches_outstanding = 0
+        self._task_infos = {}
+        self._workers_idx_cycle = itertools.cycle(range(self._num_workers))
+
         for _ in range(self._outstanding_capacity):
             self._try_put_indices()
 
         self._init_thread()
-        self._shutdown = False
+
+    def _reset(self):
+        """
+        Reset persistent workers for a new epoch, workers, indices queues
+        and data queue are kept alive, only sampler iterator, reader thread
+        and in-flight batch bookkeeping are reset.
+        """
+        # stop reader thread of last epoch, last epoch may not be drained
+        # if iteration is broken by user
+        self._exit_thread_expectedly()
+        if self._thread is not None:
+            # wake up reader thread which may be blocking on _data_queue
+            self._data_queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+        self._sampler_iter = iter(self._batch_sampler)
+
+        # resume all workers and discard data of last epoch remaining in
+        # _data_queue, _ResumeIteration is put back by each worker after
+        # all the indices before it are processed
+        for i in range(self._num_workers):
+            self._indices_queues[i].put(_ResumeIteration())
+            self._worker_status[i] = True
+        resume_worker_cnt = self._num_workers
+        while resume_worker_cnt > 0:
+            try:
+                data = self._data_queue.get(timeout=self._timeout)
+            except queue.Empty:
+                self._check_failed_workers()
+                continue
+            if isinstance(data, _ResumeIteration):
+                resume_worker_cnt -= 1
+
+        self._init_epoch()
 
     def _init_workers(self):
         # multiprocess worker and indice queue list initial as empty
         self._workers = []
         self._worker_status = []
         self._indices_queues = []
-        self._workers_idx_cycle = itertools.cycle(range(self._num_workers))
 
         # create data_queue for workers
         self._data_queue = multiprocessing.Queue()
@@ -533,11 +659,27 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._thread.daemon = True
         self._thread.start()
 
-    def _shutdown_worker(self, worker_id):
+    def _shutdown_worker(self, worker_id, shutdown=True):
         if self._worker_status[worker_id]:
-            self._indices_queues[worker_id].put(None)
+            # persistent worker is only marked as not available for
+            # current epoch, and will be resumed in next epoch
+            if shutdown:
+                self._indices_queues[worker_id].put(None)
             self._worker_status[worker_id] = False
 
+    def _check_failed_workers(self):
+        failed_workers = []
+        for i, w in enumerate(self._workers):
+            if not w.is_alive() and (self._worker_status[i] or
+                                     self._persistent_workers):
+                failed_workers.append(w)
+                self._shutdown_worker(i)
+        if len(failed_workers) > 0:
+            self._exit_thread_unexpectedly()
+            pids = ', '.join(str(w.pid) for w in failed_workers)
+            raise RuntimeError("DataLoader {} workers exit unexpectedly, " \
+                        "pids: {}".format(len(failed_workers), pids))
+
     def _try_shutdown_all(self):
         if not self._shutdown:
             try:
@@ -549,6 +691,10 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                 # indices_queue
                 self._workers_done_event.set()
                 for i in range(self._num_workers):
+                    # persistent workers marked as not available in last
+                    # epoch are still alive and need to be shutdown
+                    if self._persistent_workers:
+                        self._worker_status[i] = True
                     self._shutdown_worker(i)
 
                 for w in self._workers:
@@ -639,23 +785,16 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                 #    exception handling.
                 # 2. if get data timeout and check workers all alive, continue to
                 #    get data again
+                start = time.time()
                 data = self._data_queue.get(timeout=self._timeout)
+                self._stats.record('wait', time.time() - start)
             except Exception as e:
                 # check if thread done event set when waiting data
                 if self._thread_done_event.is_set():
                     continue
 
                 # check failed workers
-                failed_workers = []
-                for i, w in enumerate(self._workers):
-                    if self._worker_status[i] and not w.is_alive():
-                        failed_workers.append(w)
-                        self._shutdown_worker(i)
-                if len(failed_workers) > 0:
-                    self._exit_thread_unexpectedly()
-                    pids = ', '.join(str(w.pid) for w in failed_workers)
-                    raise RuntimeError("DataLoader {} workers exit unexpectedly, " \
-                                "pids: {}".format(len(failed_workers), pids))
+                self._check_failed_workers()
 
                 # get(timeout) will call _poll(timeout) and may raise IOError
                 if isinstance(e, queue.Empty) or isinstance(e, IOError):
@@ -667,6 +806,10 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                               "workers' result queue.".format(e))
                 six.reraise(*sys.exc_info())
             else:
+                # None is put by _reset to wake up reader thread to exit
+                if data is None:
+                    continue
+
                 if self._dataset_kind == _DatasetKind.ITER and isinstance(
                         data, _IterableDatasetStopIteration):
                     # if a worker get StopIteraion, we shutdown this worker,
@@ -674,12 +817,19 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     # is discard, outstanding batch number should be decrease
                     # and another indices should be put for other workers
                     # may still working.
-                    self._shutdown_worker(data.worker_id)
+                    self._shutdown_worker(
+                        data.worker_id,
+                        shutdown=not self._persistent_workers)
                     self._batches_outstanding -= 1
                     self._try_put_indices()
                     continue
 
-                idx, batch = data
+                idx, batch, stats = data
+                if stats is not None:
+                    self._stats.record('fetch', stats[0])
+                    self._stats.record('collate', stats[1])
+                    self._stats.record_batch_bytes(stats[2])
+
                 if idx == self._rcvd_idx:
                     del self._task_infos[idx]
                     return batch
@@ -688,8 +838,6 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     continue
 
     def _try_put_indices(self):
-        assert self._batches_outstanding <= self._outstanding_capacity, \
-                    "too many indices have been put to queue"
         # In multi-process mode for IterableDataset, _try_put_indices will
         # be called both in main process(for our implement has blocking queue,
         # and blocking queue read is in main process) and thread, which may
@@ -700,6 +848,11 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         # function which is not in data reading pipeline, this lock almost no
         # influence on performance
         with self._thread_lock:
+            # _outstanding_capacity may be shrinked in adaptive prefetch
+            # mode, stop putting indices until outstanding batches drained
+            if self._batches_outstanding >= self._outstanding_capacity:
+                return
+
             try:
                 indices = next(self._sampler_iter)
             except StopIteration:
@@ -733,6 +886,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                 self._thread_done_event.set()
                 self._blocking_queue.close()
 
+            start = time.time()
             if in_dygraph_mode():
                 data = self._reader.read_next_var_list()
             else:
@@ -745,11 +899,18 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                         data = data[0]
                 else:
                     data = self._reader.read_next()
+            read_cost = time.time() - start
+            self._stats.record('read', read_cost)
             self._on_output_batch()
+            if self._adaptive_prefetch:
+                self._adapt_outstanding_capacity(read_cost)
             return data
         except StopIteration:
             self._reader.reset()
-            self._try_shutdown_all()
+            # keep persistent workers alive for next epoch, they will
+            # be shutdown when this iterator is released
+            if not self._persistent_workers:
+                self._try_shutdown_all()
             six.reraise(*sys.exc_info())
 
     # python2 compatibility
@@ -760,3 +921,23 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         for _ in range(len(self._places)):
             self._batches_outstanding -= 1
             self._try_put_indices()
+
+    def _max_outstanding_capacity(self):
+        capacity = self._min_outstanding_capacity * MAX_PREFETCH_SCALE
+        batch_bytes = self._stats.batch_bytes
+        if self._prefetch_memory_limit is not None and batch_bytes > 0:
+            capacity = min(capacity,
+                           int(self._prefetch_memory_limit // batch_bytes))
+        return max(capacity, self._min_outstanding_capacity)
+
+    def _adapt_outstanding_capacity(self, read_cost):
+        if read_cost > PREFETCH_STARVED_THRESHOLD:
+            # reader is starved, put more indices to keep workers busy
+            if self._outstanding_capacity < self._max_outstanding_capacity():
+                self._outstanding_capacity += 1
+                self._try_put_indices()
+        elif self._blocking_queue.size() >= self._blocking_queue.capacity():
+            # data is produced faster than consumed, reduce memory
+            if self._outstanding_capacity > self._min_outstanding_capacity:
+                self._outstanding_capacity -= 1
+        self._stats.outstanding_capacity = self._outstanding_capacity
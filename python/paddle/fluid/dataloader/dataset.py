@@ -15,9 +15,9 @@
 from __future__ import print_function
 
 from .. import framework
-import paddle.dataset.common
+from paddle.reader.decorator import _check_shuffle_mode, _shuffle_samples
 
-__all__ = ["Dataset", "IterableDataset", "TensorDataset"]
+__all__ = ["Dataset", "IterableDataset", "TensorDataset", "ShuffleDataset"]
 
 
 class Dataset(object):
@@ -275,3 +275,61 @@ class TensorDataset(Dataset):
 
     def __len__(self):
         return self.tensors[0].shape[0]
+
+
+class ShuffleDataset(IterableDataset):
+    """
+    Iterable dataset which shuffles samples of another iterable dataset
+    in a streaming way with a buffer of :attr:`buf_size` samples.
+
+    Args:
+        dataset(IterableDataset): the iterable dataset to shuffle.
+        buf_size(int): the size of shuffle buffer.
+        mode(str): the shuffle mode, 'window' to keep the buffer full and
+            yield a random sample in the buffer for every sample of
+            :attr:`dataset`, 'block' to shuffle and yield every
+            :attr:`buf_size` samples, or 'global' to spill every
+            :attr:`buf_size` shuffled samples to disk and merge them, which
+            shuffles all samples with bounded memory. Default 'window'.
+        spill_dir(str): the directory to spill samples in 'global' mode.
+            Default None, the system temporary directory.
+
+    Returns:
+        Dataset: an IterableDataset yields shuffled samples.
+
+    Examples:
+
+        .. code-block:: python
+
+            import numpy as np
+            from paddle.io import IterableDataset, ShuffleDataset
+
+            class RangeDataset(IterableDataset):
+                def __init__(self, num_samples):
+                    self.num_samples = num_samples
+
+                def __iter__(self):
+                    for i in range(self.num_samples):
+                        yield np.array([i])
+
+            dataset = ShuffleDataset(RangeDataset(100), buf_size=10)
+            for sample in dataset:
+                print(sample)
+
+    When :attr:`num_workers > 0` in :code:`paddle.io.DataLoader`, samples
+    yielded by :attr:`dataset` in each worker are shuffled in the worker.
+    """
+
+    def __init__(self, dataset, buf_size, mode='window', spill_dir=None):
+        assert isinstance(dataset, IterableDataset), \
+                "dataset should be an IterableDataset"
+        _check_shuffle_mode(mode)
+        self.dataset = dataset
+        self.buf_size = buf_size
+        self.mode = mode
+        self.spill_dir = spill_dir
+
+    def __iter__(self):
+        return iter(
+            _shuffle_samples(
+                iter(self.dataset), self.buf_size, self.mode, self.spill_dir))
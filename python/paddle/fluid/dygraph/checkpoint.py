@@ -15,6 +15,9 @@
 from __future__ import print_function
 
 import os
+import sys
+import atexit
+import threading
 import collections
 import functools
 from ..framework import Variable, default_main_program, in_dygraph_mode, dygraph_only, Parameter, ParamBase, _varbase_creator, _dygraph_tracer
@@ -30,6 +33,7 @@ from paddle.fluid.dygraph.io import _construct_program_holders, _construct_param
 __all__ = [
     'save_dygraph',
     'load_dygraph',
+    'wait_async_save',
 ]
 
 
@@ -52,8 +56,250 @@ def _parse_load_config(configs):
     return inner_config
 
 
+def _replace_file(src, dst):
+    if six.PY2 and os.name == 'nt' and os.path.exists(dst):
+        os.remove(dst)
+    if six.PY2:
+        os.rename(src, dst)
+    else:
+        os.replace(src, dst)
+
+
+def _save_to_file(obj, file_name):
+    """
+    Pickle `obj` to `file_name` atomically, that is, to a temporary file in
+    the same directory and then rename it, so that a checkpoint is never left
+    partially written if the process is killed while saving.
+    """
+    dir_name = os.path.dirname(file_name)
+    if dir_name and not os.path.exists(dir_name):
+        try:
+            os.makedirs(dir_name)
+        except OSError:
+            # created by another saving thread or process
+            if not os.path.isdir(dir_name):
+                raise
+    # NOTE: the temporary file is unique to the thread, as the same file may
+    #       be saved by the background saving thread and the caller at once
+    tmp_file_name = '{}.tmp{}.{}'.format(file_name,
+                                         os.getpid(),
+                                         threading.current_thread().ident)
+    try:
+        with open(tmp_file_name, 'wb') as f:
+            pickle.dump(obj, f, protocol=2)
+        _replace_file(tmp_file_name, file_name)
+    finally:
+        if os.path.exists(tmp_file_name):
+            os.remove(tmp_file_name)
+
+
+class CheckpointFuture(object):
+    """
+    The result of an asynchronous checkpoint saved by `AsyncCheckpointSaver`,
+    which is done when all its files are written.
+    """
+
+    def __init__(self, file_names):
+        self.file_names = file_names
+        self._done = threading.Event()
+        self._exc_info = None
+
+    def _set_done(self, exc_info=None):
+        self._exc_info = exc_info
+        self._done.set()
+
+    def done(self):
+        """
+        Returns whether the checkpoint is written or failed.
+        """
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """
+        Waits until the checkpoint is written, and returns whether it's done.
+
+        Args:
+            timeout(float|None): The maximum seconds to wait. None means to
+                wait until it's done. Default: None.
+
+        Returns:
+            bool: whether the checkpoint is done.
+        """
+        # NOTE: Event.wait without timeout can't be interrupted in Python 2
+        while timeout is None and not self._done.wait(1):
+            pass
+        return self._done.wait(timeout)
+
+    def exception(self, timeout=None):
+        """
+        Waits until the checkpoint is done, and returns the exception raised
+        while writing it, or None if it succeeds.
+        """
+        if not self.wait(timeout):
+            raise RuntimeError("Saving checkpoint {} is not done in {} seconds.".
+                               format(self.file_names, timeout))
+        return self._exc_info[1] if self._exc_info else None
+
+    def result(self, timeout=None):
+        """
+        Waits until the checkpoint is done, and returns the list of files
+        written, or raises the exception raised while writing them.
+        """
+        if self.exception(timeout) is not None:
+            six.reraise(*self._exc_info)
+        return self.file_names
+
+
+class AsyncCheckpointSaver(object):
+    """
+    Saves checkpoints in a background thread, so that training continues
+    while they are written.
+
+    The states are snapshotted into numpy arrays on host by the caller before
+    `save` returns, so they can be updated by training right after. Files are
+    written in order of `save` and atomically renamed. At most `max_pending`
+    checkpoints are waiting or being written, `save` blocks until one of them
+    is done if more are requested, which also bounds the host memory used by
+    snapshots.
+
+    Args:
+        max_pending(int): The maximum number of checkpoints waiting or being
+            written. Default: 1.
+    """
+
+    def __init__(self, max_pending=1):
+        if not isinstance(max_pending, six.integer_types) or max_pending < 1:
+            raise ValueError(
+                "max_pending of AsyncCheckpointSaver should be a positive "
+                "integer, but received {}.".format(max_pending))
+        self.max_pending = max_pending
+        self._slots = threading.Semaphore(max_pending)
+        self._queue = collections.deque()
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def save(self, files):
+        """
+        Writes the checkpoint files in background.
+
+        Args:
+            files(list): A list of (obj, file_name) pairs, where obj will be
+                pickled to file_name. obj should not be modified after `save`.
+
+        Returns:
+            CheckpointFuture: the future done when all the files are written.
+        """
+        future = CheckpointFuture([file_name for _, file_name in files])
+        self._slots.acquire()
+        with self._cond:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run)
+                self._thread.daemon = True
+                self._thread.start()
+            self._queue.append((files, future))
+            self._cond.notify()
+        return future
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                files, future = self._queue[0]
+            try:
+                for obj, file_name in files:
+                    _save_to_file(obj, file_name)
+                exc_info = None
+            except Exception:
+                exc_info = sys.exc_info()
+                warnings.warn("Failed to save checkpoint {}: {}".format(
+                    future.file_names, exc_info[1]))
+            with self._cond:
+                self._queue.popleft()
+                self._cond.notify_all()
+            future._set_done(exc_info)
+            self._slots.release()
+
+    def wait(self):
+        """
+        Waits until all the checkpoints saved are done.
+        """
+        with self._cond:
+            futures = [future for _, future in self._queue]
+        for future in futures:
+            future.wait()
+
+
+_async_saver = None
+_async_saver_lock = threading.Lock()
+
+
+def _get_async_saver():
+    global _async_saver
+    with _async_saver_lock:
+        if _async_saver is None:
+            _async_saver = AsyncCheckpointSaver()
+            # write the pending checkpoints before the interpreter exits
+            atexit.register(_async_saver.wait)
+        return _async_saver
+
+
+def _save_checkpoint(files, async_save=False):
+    """
+    Saves the checkpoint files, a list of (obj, file_name) pairs, and returns
+    a CheckpointFuture if `async_save` is True, otherwise None.
+    """
+    if async_save:
+        return _get_async_saver().save(files)
+    # NOTE: the checkpoints saved in background before are written first,
+    #       so that they never overwrite this newer one
+    wait_async_save()
+    for obj, file_name in files:
+        _save_to_file(obj, file_name)
+
+
+def _pack_state_dict(state_dict, model_path):
+    base_name = os.path.basename(model_path)
+    assert base_name != "", "The input model_path MUST be format of dirname/filename [dirname\\filename in Windows system], but received filename is empty string."
+
+    suffix = ".pdparams"
+    assert len(state_dict) > 0, "state_dict is empty, no need to save"
+
+    param_num = 0
+    for k, v in state_dict.items():
+        if isinstance(v, ParamBase):
+            param_num += 1
+
+    if param_num == 0:
+        suffix = ".pdopt"
+
+    model_dict = {}
+    name_table = {}
+    for k, v in state_dict.items():
+        if isinstance(v, (Variable, core.VarBase)):
+            model_dict[k] = v.numpy()
+            name_table[k] = v.name
+        else:
+            model_dict[k] = v
+    model_dict["StructuredToParameterName@@"] = name_table
+
+    return model_dict, model_path + suffix
+
+
+def wait_async_save():
+    """
+    Waits until all the checkpoints saved by `save_dygraph` or
+    `paddle.Model.save` with `async_save=True` are written.
+
+    Returns:
+        None
+    """
+    if _async_saver is not None:
+        _async_saver.wait()
+
+
 @dygraph_only
-def save_dygraph(state_dict, model_path):
+def save_dygraph(state_dict, model_path, async_save=False):
     '''
     :api_attr: imperative
 
@@ -64,9 +310,13 @@ def save_dygraph(state_dict, model_path):
     Args:
         state_dict(dict) : The state dict to be saved.
         model_path(str) : the file prefix to save the state_dict. The format is "dirname/file_prefix". If file_prefix is empty str. A exception will be raised
+        async_save(bool, optional) : Whether to write the file in a background thread. The state_dict
+            is copied to host before returning, and at most one checkpoint is being written at the same
+            time, later saving waits for it. Use `wait_async_save` to wait until all are written. Saving with
+            `async_save=False` also waits for them, so that the latest checkpoint is kept. Default: False.
 
     Returns:
-        None
+        CheckpointFuture: the future done when the file is written if `async_save` is True, otherwise None.
 
     Examples:
         .. code-block:: python
@@ -85,39 +335,15 @@ def save_dygraph(state_dict, model_path):
                 state_dict = adam.state_dict()
                 fluid.save_dygraph( state_dict, "paddle_dy")
 
-    '''
-
-    base_name = os.path.basename(model_path)
-    assert base_name != "", "The input model_path MUST be format of dirname/filename [dirname\\filename in Windows system], but received filename is empty string."
-
-    suffix = ".pdparams"
-    assert len(state_dict) > 0, "state_dict is empty, no need to save"
-
-    param_num = 0
-    for k, v in state_dict.items():
-        if isinstance(v, ParamBase):
-            param_num += 1
-
-    if param_num == 0:
-        suffix = ".pdopt"
+                # write in background while training continues
+                future = fluid.save_dygraph(
+                    emb.state_dict(), "paddle_dy_async", async_save=True)
+                future.wait()
 
-    model_dict = {}
-    name_table = {}
-    for k, v in state_dict.items():
-        if isinstance(v, (Variable, core.VarBase)):
-            model_dict[k] = v.numpy()
-            name_table[k] = v.name
-        else:
-            model_dict[k] = v
-    model_dict["StructuredToParameterName@@"] = name_table
-
-    file_name = model_path + suffix
-    dir_name = os.path.dirname(file_name)
-    if dir_name and not os.path.exists(dir_name):
-        os.makedirs(dir_name)
+    '''
 
-    with open(file_name, 'wb') as f:
-        pickle.dump(model_dict, f, protocol=2)
+    model_dict, file_name = _pack_state_dict(state_dict, model_path)
+    return _save_checkpoint([(model_dict, file_name)], async_save)
 
 
 # NOTE(chenweihang): load_dygraph will deprecated in future, we don't 
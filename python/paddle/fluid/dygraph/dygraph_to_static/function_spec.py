@@ -171,6 +171,30 @@ class FunctionSpec(object):
 
         return pack_sequence_as(input_with_spec, inputs)
 
+    def find_static_inputs_with_spec(self, input_with_spec, main_program):
+        """
+        Finds the feed layers constructed by `to_static_inputs_with_spec` in a main
+        program reloaded from ProgramDesc.
+
+        Args:
+            input_with_spec(tuple): input arguments by replacing argument with InputSpec.
+            main_program(Program): main program containing the feed layers.
+        """
+        flat_input_spec = flatten(input_with_spec)
+
+        inputs = []
+        block = main_program.global_block()
+        for i, var_spec in enumerate(flat_input_spec):
+            if isinstance(var_spec, paddle.static.InputSpec):
+                feed_layer = block.var(var_spec.name or "feed_%s" % i)
+                # Note: `is_data` is not saved in ProgramDesc.
+                feed_layer.is_data = True
+            else:
+                feed_layer = var_spec
+            inputs.append(feed_layer)
+
+        return pack_sequence_as(input_with_spec, inputs)
+
     def _verify_input_spec(self, input_spec):
         """
         Verifies the `input_spec` and its element type is valid.
@@ -373,3 +397,49 @@ def _replace_spec_name(name, input_spec):
         return processed_specs
     else:
         return input_spec
+
+
+def bucket_input_spec(input_with_spec, policy):
+    """
+    Maps each InputSpec in `input_with_spec` by the shape bucketing `policy`, so
+    that the inputs differing only in bucketed dims share one program with dynamic
+    dims. The policies are as followed:
+        1. None, keep the InputSpec unchanged.
+        2. 'batch', replace the first dim with -1.
+        3. 'all', replace all dims with -1.
+        4. A callable, which receives an InputSpec and returns the mapped InputSpec.
+    InputSpec of 0-d shape is kept unchanged by 'batch' and 'all'.
+
+    For example:
+
+        # foo(x) is called with x of shape [4, 10] and [8, 10]
+        foo = to_static(foo, shape_bucketing='batch')
+        # both calls share one program with input x of shape [-1, 10]
+
+    Args:
+        input_with_spec(list): nested structure containing InputSpec.
+        policy(str|callable|None): the shape bucketing policy.
+
+    Returns:
+        Same structure with input_with_spec by replacing InputSpec with mapped one.
+    """
+    if policy is None:
+        return input_with_spec
+
+    def _bucket(spec):
+        if not isinstance(spec, paddle.static.InputSpec):
+            return spec
+        if callable(policy):
+            return policy(spec)
+        shape = list(spec.shape)
+        # a 0-d spec has no dim to bucket
+        if len(shape) == 0:
+            return spec
+        if policy == 'batch':
+            shape[0] = -1
+        else:
+            shape = [-1] * len(shape)
+        return paddle.static.InputSpec(shape, spec.dtype, spec.name)
+
+    flat_specs = [_bucket(spec) for spec in flatten(input_with_spec)]
+    return pack_sequence_as(input_with_spec, flat_specs)
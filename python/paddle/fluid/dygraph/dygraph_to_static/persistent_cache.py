@@ -0,0 +1,434 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import os
+import sys
+import six
+import pickle
+import hashlib
+import inspect
+import threading
+import numpy as np
+
+import paddle.version as fluid_version
+from paddle.fluid import core
+from paddle.fluid.dygraph.dygraph_to_static import logging_utils
+from paddle.fluid.dygraph.dygraph_to_static.origin_info import Location
+from paddle.fluid.dygraph.dygraph_to_static.origin_info import OriginInfo
+from paddle.fluid.dygraph.dygraph_to_static.origin_info import global_origin_info_map
+from paddle.fluid.dygraph.dygraph_to_static.utils import unwrap
+from paddle.fluid.wrapped_decorator import signature_safe_contextmanager
+
+__all__ = []
+
+# Bump it when the format of cached entries changes.
+CACHE_FORMAT_VERSION = 1
+# The environment variable to enable the persistent cache by default.
+CACHE_DIR_ENV = 'PADDLE_DY2STATIC_CACHE_DIR'
+
+_CODE_DIR = 'code'
+_PROGRAM_DIR = 'program'
+
+
+def _md5(text):
+    if isinstance(text, six.text_type):
+        text = text.encode('utf-8')
+    return hashlib.md5(text).hexdigest()
+
+
+def is_primitive(value):
+    if isinstance(value, (list, tuple)):
+        return all(is_primitive(v) for v in value)
+    return value is None or isinstance(value, (
+        bool, float) + six.integer_types + six.string_types)
+
+
+class _Uncacheable(Exception):
+    """
+    Raised if the program may depend on a value without a stable repr.
+    """
+    pass
+
+
+# the python attributes of Layer managed by itself, parameters, buffers and
+# sublayers are part of the signature in other ways
+_LAYER_INTERNAL_ATTRS = frozenset([
+    '_full_name', '_helper', '_parameters', '_buffers',
+    '_non_persistable_buffer_names_set', '_sub_layers', '_loaddict_holder',
+    '_forward_pre_hooks', '_forward_post_hooks', '_init_in_dynamic_mode'
+])
+
+# the max depth of nested values in the stable repr
+_MAX_REPR_DEPTH = 8
+
+
+def _stable_repr(value, depth=0):
+    """
+    Returns a repr of `value` which is the same in every process if the value
+    is the same, or raises _Uncacheable if there is no such repr.
+    """
+    if depth > _MAX_REPR_DEPTH:
+        raise _Uncacheable("too deeply nested value")
+    if is_primitive(value) or isinstance(value, core.VarDesc.VarType):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return '{}({})'.format(
+            type(value).__name__,
+            ', '.join(_stable_repr(v, depth + 1) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return 'set({})'.format(
+            sorted(_stable_repr(v, depth + 1) for v in value))
+    if isinstance(value, dict):
+        return 'dict({})'.format(
+            sorted((_stable_repr(k, depth + 1), _stable_repr(v, depth + 1))
+                   for k, v in six.iteritems(value)))
+    if isinstance(value, (np.ndarray, np.generic)):
+        value = np.ascontiguousarray(value)
+        if value.dtype.hasobject:
+            raise _Uncacheable("numpy array of objects")
+        return 'ndarray({}, {}, {})'.format(value.dtype.str, value.shape,
+                                            _md5(value.tobytes()))
+    if inspect.isroutine(value) or inspect.isclass(value):
+        name = getattr(value, '__qualname__', value.__name__)
+        # lambdas and local functions can't be told apart by name
+        if '<' not in name:
+            return '{}.{}'.format(getattr(value, '__module__', None), name)
+        raise _Uncacheable("local function {}".format(name))
+    if isinstance(value, core.VarBase):
+        # NOTE: parameters, buffers and sublayers are registered by Layer,
+        #       tensors in other attributes are captured as they are.
+        raise _Uncacheable("tensor not registered in Layer")
+    cls = type(value)
+    init = getattr(cls, '__init__', None)
+    if inspect.isfunction(getattr(init, '__func__', init)) and \
+            hasattr(value, '__dict__'):
+        # python objects keeping their states in __dict__, such as ParamAttr
+        return '{}.{}({})'.format(cls.__module__, cls.__name__,
+                                  _stable_repr(vars(value), depth + 1))
+    raise _Uncacheable("{} object".format(type(value).__name__))
+
+
+def _source_file(obj):
+    try:
+        return inspect.getsourcefile(unwrap(obj))
+    except TypeError:
+        return None
+
+
+class VariableRef(object):
+    """
+    Refers to a Variable by name in the cached outputs of program.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+
+_recorder = threading.local()
+
+
+@signature_safe_contextmanager
+def record_source_files():
+    """
+    Records the source files of all functions converted by `convert_to_static`
+    in the context, which are used to validate the cached programs.
+    """
+    prev_files = getattr(_recorder, 'files', None)
+    files = set()
+    _recorder.files = files
+    try:
+        yield files
+    finally:
+        _recorder.files = prev_files
+        # Note: the program traced in an outer context depends on the
+        # functions converted in the inner one too.
+        if prev_files is not None:
+            prev_files.update(files)
+
+
+def record_source_file(func):
+    files = getattr(_recorder, 'files', None)
+    if files is not None:
+        path = _source_file(func)
+        if path is not None:
+            files.add(path)
+
+
+class PersistentCache(object):
+    """
+    On-disk cache of transformed static code and traced programs, so that
+    they can be reloaded instead of being rebuilt in later processes.
+
+    Each entry is a pickled dict saved to `<cache_dir>/<kind>/<md5 of key>.pkl`
+    atomically. The key of an entry consists of cache format version, Paddle
+    version and Python version, and
+        1. for code, the source code of the dygraph function.
+        2. for program, the source code of the decorated function, the input
+           spec, and the parameters and python attributes of the class instance.
+
+    A program entry also records the md5 of all the source files of functions
+    converted during tracing, it's dropped if any of these files changes.
+    The values of the globals referenced by the decorated function are part
+    of the key too. A program is not cached if the class instance has any
+    attribute, or the function refers to any global, which has no stable
+    repr, it's traced as usual instead.
+
+    Note:
+        The entries are loaded by `pickle`, which can run arbitrary code, so
+        only use a cache directory written by trusted processes.
+
+    Args:
+        cache_dir(str): the directory to save the cached entries.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        # {path: (mtime, size, md5)}
+        self._file_md5s = dict()
+        self.hits = 0
+        self.misses = 0
+
+    def _version_key(self):
+        return "format:{}, paddle:{}-{}, python:{}".format(
+            CACHE_FORMAT_VERSION, fluid_version.full_version,
+            fluid_version.commit, sys.version_info[:2])
+
+    def _path(self, kind, key):
+        return os.path.join(self.cache_dir, kind, _md5(key) + '.pkl')
+
+    def _file_md5(self, path):
+        stat = os.stat(path)
+        with self._lock:
+            cached = self._file_md5s.get(path, None)
+        if cached is not None and cached[:2] == (stat.st_mtime, stat.st_size):
+            return cached[2]
+        with open(path, 'rb') as f:
+            md5 = hashlib.md5(f.read()).hexdigest()
+        with self._lock:
+            self._file_md5s[path] = (stat.st_mtime, stat.st_size, md5)
+        return md5
+
+    def _load(self, kind, key):
+        entry = self._load_entry(kind, key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def _load_entry(self, kind, key):
+        path = self._path(kind, key)
+        if not os.path.isfile(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+            # Note: compare the full key in case of md5 collision.
+            if entry.get('key') != key:
+                return None
+            for file_path, md5 in six.iteritems(entry.get('files', {})):
+                if not os.path.isfile(file_path) or \
+                        self._file_md5(file_path) != md5:
+                    logging_utils.warn(
+                        "The cached entry {} is dropped because {} is changed.".
+                        format(path, file_path))
+                    return None
+            return entry
+        except Exception as e:
+            logging_utils.warn("Failed to load the cached entry {}: {}".format(
+                path, e))
+            return None
+
+    def _save(self, kind, key, entry, files=()):
+        path = self._path(kind, key)
+        try:
+            entry['key'] = key
+            entry['files'] = dict(
+                (file_path, self._file_md5(file_path)) for file_path in files
+                if os.path.isfile(file_path))
+            dir_name = os.path.dirname(path)
+            if not os.path.isdir(dir_name):
+                os.makedirs(dir_name)
+            tmp_path = '{}.tmp{}.{}'.format(path,
+                                            os.getpid(),
+                                            threading.current_thread().ident)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(entry, f, protocol=2)
+            os.rename(tmp_path, path)
+        except (IOError, OSError, pickle.PicklingError) as e:
+            logging_utils.warn("Failed to save the cached entry {}: {}".format(
+                path, e))
+
+    def code_key(self, source_code):
+        return "{}, source:{}".format(self._version_key(), _md5(source_code))
+
+    def load_code(self, source_code):
+        """
+        Returns the cached entry of transformed code for `source_code`, a dict
+        with keys `code` and `origin_info`, or None if not cached.
+        """
+        return self._load(_CODE_DIR, self.code_key(source_code))
+
+    def save_code(self, source_code, static_code, origin_info_map, dygraph_func,
+                  static_func):
+        """
+        Saves the transformed `static_code` of `source_code` and the original
+        information map between `static_func` and `dygraph_func`.
+        """
+        try:
+            origin_info = _dump_origin_info_map(origin_info_map, dygraph_func,
+                                                static_func)
+        except (IOError, OSError, TypeError) as e:
+            logging_utils.warn(
+                "Failed to get the source of {}, skip caching its code: {}".
+                format(dygraph_func, e))
+            return
+        entry = {'code': static_code, 'origin_info': origin_info}
+        self._save(_CODE_DIR, self.code_key(source_code), entry)
+
+    def program_key(self, func_spec, input_spec, class_instance):
+        """
+        Returns the key of the program of `func_spec`, or None if the program
+        may depend on values which can't be keyed, e.g. python attributes of
+        `class_instance` without a stable repr, so it should not be cached.
+        """
+        try:
+            return "{}, function:{}, globals:{}, input_spec:{}, instance:{}".format(
+                self._version_key(),
+                _md5(func_spec.code),
+                _globals_signature(func_spec.dygraph_function), input_spec,
+                _layer_signature(class_instance))
+        except _Uncacheable as e:
+            logging_utils.warn(
+                "The program of {} is not cached persistently because it may "
+                "depend on a value which can't be keyed: {}".format(func_spec,
+                                                                   e))
+            return None
+
+    def load_program(self, key):
+        """
+        Returns the cached entry of program for `key`, or None if not cached
+        or the source files it depends on are changed.
+        """
+        return self._load(_PROGRAM_DIR, key)
+
+    def save_program(self, key, entry, files):
+        self._save(_PROGRAM_DIR, key, entry, files)
+
+
+def _globals_signature(func):
+    """
+    Returns a string identifying the values of the globals referenced by
+    `func`, e.g. constants imported from other modules. Modules, functions
+    and classes are skipped, the source files of the converted functions
+    are checked when the cached program is loaded.
+    """
+    func = getattr(unwrap(func), '__func__', unwrap(func))
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return None
+    names = set()
+    codes = [code]
+    while codes:
+        code = codes.pop()
+        names.update(code.co_names)
+        codes.extend(c for c in code.co_consts if inspect.iscode(c))
+    signature = []
+    for name in sorted(names):
+        if name not in func.__globals__:
+            continue
+        value = func.__globals__[name]
+        if inspect.ismodule(value) or inspect.isroutine(value) or \
+                inspect.isclass(value):
+            continue
+        signature.append((name, _stable_repr(value)))
+    return _md5(repr(signature))
+
+
+def _layer_signature(layer):
+    """
+    Returns a string identifying the parameters, buffers and python attributes
+    of `layer` and its sublayers, which may affect the traced program. Raises
+    _Uncacheable if any attribute has no stable repr.
+    """
+    if layer is None:
+        return None
+    signature = []
+    for prefix, sublayer in [('', layer)] + list(layer.named_sublayers()):
+        attrs = sorted((name, _stable_repr(value))
+                       for name, value in six.iteritems(sublayer.__dict__)
+                       if name not in _LAYER_INTERNAL_ATTRS)
+        variables = [(name, var.name, tuple(var.shape), str(var.dtype),
+                      var.stop_gradient)
+                     for name, var in list(sublayer._parameters.items()) +
+                     list(sublayer._buffers.items()) if var is not None]
+        signature.append((prefix, type(sublayer).__module__,
+                          type(sublayer).__name__, attrs, variables))
+    return _md5(repr(signature))
+
+
+def _dump_origin_info_map(origin_info_map, dygraph_func, static_func):
+    """
+    Converts the original information map into line numbers relative to the
+    beginning of functions, because the functions may be moved in files.
+    """
+    dygraph_file = _source_file(dygraph_func)
+    static_offset = inspect.getsourcelines(static_func)[1] - 1
+    dygraph_offset = inspect.getsourcelines(unwrap(dygraph_func))[1] - 1
+
+    infos = []
+    for (_, static_lineno), info in six.iteritems(origin_info_map):
+        if info.location.filepath != dygraph_file:
+            continue
+        infos.append((static_lineno - static_offset,
+                      info.location.lineno - dygraph_offset,
+                      info.location.col_offset, info.function_name,
+                      info.source_code))
+    return infos
+
+
+def load_origin_info_map(infos, dygraph_func, static_func):
+    """
+    Restores the original information map dumped by `_dump_origin_info_map`
+    for the functions reloaded, and updates the global map.
+    """
+    dygraph_file = _source_file(dygraph_func)
+    static_file = _source_file(static_func)
+    static_offset = inspect.getsourcelines(static_func)[1] - 1
+    dygraph_offset = inspect.getsourcelines(unwrap(dygraph_func))[1] - 1
+
+    for static_lineno, lineno, col_offset, function_name, source_code in infos:
+        location = Location(dygraph_file, dygraph_offset + lineno, col_offset)
+        global_origin_info_map[(static_file, static_offset + static_lineno)] = \
+            OriginInfo(location, function_name, source_code)
+
+
+_persistent_cache = None
+if os.environ.get(CACHE_DIR_ENV):
+    _persistent_cache = PersistentCache(os.environ[CACHE_DIR_ENV])
+
+
+def set_cache_dir(cache_dir):
+    global _persistent_cache
+    if cache_dir is None:
+        _persistent_cache = None
+    else:
+        _persistent_cache = PersistentCache(cache_dir)
+
+
+def get_persistent_cache():
+    return _persistent_cache
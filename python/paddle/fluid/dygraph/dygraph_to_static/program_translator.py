@@ -16,10 +16,12 @@ from __future__ import print_function
 
 import collections
 import gast
+import hashlib
 import inspect
 import six
 import textwrap
 import threading
+import time
 import weakref
 
 from paddle.fluid import framework
@@ -27,6 +29,7 @@ from paddle.fluid import in_dygraph_mode
 from paddle.fluid.dygraph import layers
 from paddle.fluid.data_feeder import check_type
 from paddle.fluid.layers.utils import flatten
+from paddle.fluid.layers.utils import pack_sequence_as
 from paddle.fluid.dygraph.base import param_guard
 from paddle.fluid.dygraph.base import switch_to_static_graph
 from paddle.fluid.dygraph.dygraph_to_static import DygraphToStaticAst
@@ -36,6 +39,13 @@ from paddle.fluid.dygraph.dygraph_to_static.origin_info import attach_origin_inf
 from paddle.fluid.dygraph.dygraph_to_static.origin_info import create_and_update_origin_info_map
 from paddle.fluid.dygraph.dygraph_to_static.origin_info import update_op_callstack_with_origin_info
 from paddle.fluid.dygraph.dygraph_to_static.partial_program import partial_program_from
+from paddle.fluid.dygraph.dygraph_to_static.persistent_cache import VariableRef
+from paddle.fluid.dygraph.dygraph_to_static.persistent_cache import get_persistent_cache
+from paddle.fluid.dygraph.dygraph_to_static.persistent_cache import is_primitive
+from paddle.fluid.dygraph.dygraph_to_static.persistent_cache import load_origin_info_map
+from paddle.fluid.dygraph.dygraph_to_static.persistent_cache import record_source_file
+from paddle.fluid.dygraph.dygraph_to_static.persistent_cache import record_source_files
+from paddle.fluid.dygraph.dygraph_to_static.persistent_cache import set_cache_dir
 from paddle.fluid.dygraph.dygraph_to_static.utils import ast_to_func
 from paddle.fluid.dygraph.dygraph_to_static.utils import ast_to_source_code
 from paddle.fluid.dygraph.dygraph_to_static.utils import func_to_source_code
@@ -43,6 +53,7 @@ from paddle.fluid.dygraph.dygraph_to_static.utils import type_name
 from paddle.fluid.dygraph.dygraph_to_static.utils import unwrap
 from paddle.fluid.dygraph.dygraph_to_static.utils import make_hashable
 from paddle.fluid.dygraph.dygraph_to_static.function_spec import FunctionSpec
+from paddle.fluid.dygraph.dygraph_to_static.function_spec import bucket_input_spec
 from paddle.fluid.dygraph.dygraph_to_static.function_spec import get_buffers, get_parameters
 from paddle.fluid.wrapped_decorator import signature_safe_contextmanager
 
@@ -52,17 +63,88 @@ __all__ = ['ProgramTranslator', 'convert_to_static']
 # Once exceeding the threshold, we will raise warning to users to make sure the conversion is as expected.
 MAX_TRACED_PROGRAM_COUNT = 10
 
+# The max number of converted functions and transformed ast kept in FunctionCache.
+FUNCTION_CACHE_CAPACITY = 1024
+# The max number of programs cached for each decorated function.
+PROGRAM_CACHE_CAPACITY = 64
+# The max total number of ops of the programs cached for each decorated function,
+# None means the cache is only bounded by the number of programs.
+PROGRAM_CACHE_MAX_OP_COUNT = None
+
+# The policies to map the InputSpec of actual inputs before looking up ProgramCache,
+# so that inputs differing only in the bucketed dims share one program with
+# dynamic dims.
+SHAPE_BUCKETING_POLICIES = ['batch', 'all']
+
+
+class LRUCache(object):
+    """
+    A simple LRU cache holding at most `capacity` entries, the least recently used
+    entry is evicted when the cache is full. It's not thread-safe, and the callers
+    should hold a lock.
+
+    Args:
+        capacity(int): the max entry number of the cache.
+    """
+
+    def __init__(self, capacity):
+        self._capacity = capacity
+        self._cache = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        value = self._cache.pop(key, None)
+        if value is None:
+            self.misses += 1
+            return default
+        # move to the end as the most recently used entry
+        self._cache[key] = value
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        self._cache.pop(key, None)
+        self._cache[key] = value
+        while len(self._cache) > self._capacity:
+            self._cache.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._cache.clear()
+
+    def __contains__(self, key):
+        return key in self._cache
+
+    def __len__(self):
+        return len(self._cache)
+
+    def stats(self):
+        return {
+            'size': len(self._cache),
+            'capacity': self._capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
 
 class FunctionCache(object):
     """
     Caches the transformed functions to avoid redundant conversions of the same function.
+    Both caches are bounded LRU caches holding at most `capacity` entries.
+
+    Args:
+        capacity(int): the max entry number of each cache, default FUNCTION_CACHE_CAPACITY.
     """
 
-    def __init__(self):
+    def __init__(self, capacity=None):
+        capacity = capacity or FUNCTION_CACHE_CAPACITY
         # Caches the converted static functions. {dygraph_func: static_func}
-        self._converted_static_func_caches = dict()
-        # Caches the converted ast node for same source code. {source_code: ast_root}
-        self._code_to_ast_caches = dict()
+        self._converted_static_func_caches = LRUCache(capacity)
+        # Caches the converted ast node for same source code. {md5(source_code): ast_root}
+        self._code_to_ast_caches = LRUCache(capacity)
         self._dygraph_to_static = DygraphToStaticAst()
 
     def convert_with_cache(self, func):
@@ -74,7 +156,7 @@ class FunctionCache(object):
 
         if static_func is None:
             static_func = self._convert(func)
-            self._converted_static_func_caches[func] = static_func
+            self._converted_static_func_caches.set(func, static_func)
 
         return static_func
 
@@ -106,23 +188,55 @@ class FunctionCache(object):
         #  Consider this case: source_code in self._code_to_ast_caches,
         #  but actually they are methods in different classes.
         #  Maybe use (__class__, source_code) as key
-        if source_code in self._code_to_ast_caches:
-            root_wrapper = self._code_to_ast_caches[source_code]
-        else:
+        # Note: key by the digest of source code to avoid holding the full text.
+        code_key = hashlib.md5(source_code.encode('utf-8')).hexdigest()
+        root_wrapper = self._code_to_ast_caches.get(code_key, None)
+        persistent_cache = get_persistent_cache()
+        if root_wrapper is None and persistent_cache is not None:
+            static_func = self._load_from_persistent_cache(
+                persistent_cache, func, source_code)
+            if static_func is not None:
+                return static_func
+
+        is_transformed = root_wrapper is None
+        if is_transformed:
             root = gast.parse(source_code)
             root = attach_origin_info(root, func)
             root_wrapper = self._dygraph_to_static.get_static_ast(root)
-            self._code_to_ast_caches[source_code] = root_wrapper
+            self._code_to_ast_caches.set(code_key, root_wrapper)
 
         # Get static function from AST
         static_func, file_name = ast_to_func(root_wrapper.node, func)
 
-        create_and_update_origin_info_map(root_wrapper.node, static_func)
+        origin_info_map = create_and_update_origin_info_map(
+            root_wrapper.node, static_func, is_global=False)
+        if is_transformed and persistent_cache is not None:
+            persistent_cache.save_code(source_code,
+                                       ast_to_source_code(root_wrapper.node),
+                                       origin_info_map, func, static_func)
+        return static_func
+
+    def _load_from_persistent_cache(self, persistent_cache, func, source_code):
+        """
+        Loads the static function from the transformed code cached on disk, which
+        skips the transformation of AST.
+        """
+        entry = persistent_cache.load_code(source_code)
+        if entry is None:
+            return None
+        static_func, file_name = ast_to_func(gast.parse(entry['code']), func)
+        load_origin_info_map(entry['origin_info'], func, static_func)
         return static_func
 
     def exist(self, func):
         return func in self._converted_static_func_caches
 
+    def stats(self):
+        return {
+            'converted_func': self._converted_static_func_caches.stats(),
+            'code_to_ast': self._code_to_ast_caches.stats(),
+        }
+
 
 _CACHE_LOCK = threading.Lock()
 _FUNCTION_CACHE = FunctionCache()
@@ -135,6 +249,7 @@ def convert_to_static(function):
     Args:
         function(callable): The function with dygraph layers that will be converted into static layers.
     """
+    record_source_file(function)
     with _CACHE_LOCK:
         static_func = _FUNCTION_CACHE.convert_with_cache(function)
         return static_func
@@ -224,14 +339,31 @@ class StaticFunction(object):
 
     """
 
-    def __init__(self, function, input_spec=None):
+    def __init__(self,
+                 function,
+                 input_spec=None,
+                 shape_bucketing=None,
+                 cache_capacity=None):
         """
         Initializes a `StaticFunction`.
 
         Args:
             function(callable): A function or method that will be converted into static program.
             input_spec(list[InputSpec]): list of InputSpec to specify the `shape/dtype/name` information for each input argument, default None.
+            shape_bucketing(str|callable): the policy to map the InputSpec of inputs before looking up cached programs,
+                one of None, 'batch', 'all' or a callable mapping InputSpec, see `bucket_input_spec`. Default None.
+            cache_capacity(int): the max number of cached programs, default PROGRAM_CACHE_CAPACITY.
         """
+        if not (shape_bucketing is None or callable(shape_bucketing) or
+                shape_bucketing in SHAPE_BUCKETING_POLICIES):
+            raise ValueError(
+                "shape_bucketing should be None, a callable or one of {}, but received {}.".
+                format(SHAPE_BUCKETING_POLICIES, shape_bucketing))
+        if cache_capacity is not None and cache_capacity <= 0:
+            raise ValueError(
+                "cache_capacity should be positive, but received {}.".format(
+                    cache_capacity))
+
         # save the instance `self` while decorating a method of class.
         if inspect.ismethod(function):
             self._dygraph_function = getattr(function, '__func__')
@@ -241,8 +373,10 @@ class StaticFunction(object):
             self._class_instance = None
 
         self._input_spec = input_spec
+        self._shape_bucketing = shape_bucketing
+        self._cache_capacity = cache_capacity
         self._function_spec = FunctionSpec(function, input_spec)
-        self._program_cache = ProgramCache()
+        self._program_cache = ProgramCache(capacity=cache_capacity)
         self._descriptor_cache = weakref.WeakKeyDictionary()
         # Note: Hold a reference to ProgramTranslator for switching `enable_to_static`.
         self._program_trans = ProgramTranslator()
@@ -282,7 +416,8 @@ class StaticFunction(object):
         return self._descriptor_cache[instance]
 
     def _clone(self):
-        return self.__class__(self._dygraph_function, self._input_spec)
+        return self.__class__(self._dygraph_function, self._input_spec,
+                              self._shape_bucketing, self._cache_capacity)
 
     def __call__(self, *args, **kwargs):
         """
@@ -376,6 +511,8 @@ class StaticFunction(object):
             args, kwargs = self._function_spec.unified_args_and_kwargs(args,
                                                                        kwargs)
         input_with_spec = self._function_spec.args_to_input_spec(args, kwargs)
+        input_with_spec = bucket_input_spec(input_with_spec,
+                                            self._shape_bucketing)
 
         # 2. generate cache key
         cache_key = CacheKey(self._function_spec, input_with_spec,
@@ -391,6 +528,14 @@ class StaticFunction(object):
         """
         return len(self._program_cache)
 
+    def get_cache_stats(self):
+        """
+        Returns the statistics of cached programs for the decorated function, a dict of
+        `size`, `capacity`, `op_count`, `max_op_count`, `hits`, `misses`, `evictions`
+        and `trace_time` in seconds.
+        """
+        return self._program_cache.stats()
+
     @property
     def code(self):
         """
@@ -571,6 +716,37 @@ class ConcreteProgram(object):
         # verify the instance is initialized in imperative mode.
         _verify_init_in_dynamic_mode(class_instance)
 
+        persistent_cache = get_persistent_cache()
+        if persistent_cache is None:
+            return ConcreteProgram._trace(func_spec, input_spec, class_instance)
+
+        # Reloads the program traced by previous processes if cached on disk.
+        cache_key = persistent_cache.program_key(func_spec, input_spec,
+                                                 class_instance)
+        if cache_key is None:
+            return ConcreteProgram._trace(func_spec, input_spec, class_instance)
+        entry = persistent_cache.load_program(cache_key)
+        if entry is not None:
+            try:
+                return ConcreteProgram._from_cache_entry(
+                    entry, func_spec, input_spec, class_instance)
+            except Exception as e:
+                logging_utils.warn(
+                    "Failed to reload the cached program of {}, trace it again: {}".
+                    format(func_spec, e))
+
+        with record_source_files() as source_files:
+            if class_instance is not None:
+                record_source_file(type(class_instance))
+            concrete_program = ConcreteProgram._trace(func_spec, input_spec,
+                                                      class_instance)
+        entry = concrete_program._to_cache_entry()
+        if entry is not None:
+            persistent_cache.save_program(cache_key, entry, source_files)
+        return concrete_program
+
+    @staticmethod
+    def _trace(func_spec, input_spec, class_instance):
         # Transforms dygraph function into static function and caches it.
         dygraph_function = func_spec.dygraph_function
         static_func = convert_to_static(dygraph_function)
@@ -621,14 +797,107 @@ class ConcreteProgram(object):
             main_program=main_program,
             startup_program=startup_program)
 
+    def _to_cache_entry(self):
+        """
+        Returns a picklable dict to save the program into persistent cache, or None
+        if the outputs contain objects other than Variable and python primitives.
+        """
+        block = self.main_program.global_block()
+        flat_outputs = []
+        for out in flatten(self.outputs) if self.outputs is not None else []:
+            if isinstance(out, framework.Variable):
+                if not block.has_var(out.name):
+                    return None
+                flat_outputs.append(VariableRef(out.name))
+            elif is_primitive(out):
+                flat_outputs.append(out)
+            else:
+                return None
+
+        return {
+            'main_program': self.main_program.desc.serialize_to_string(),
+            'startup_program': self.startup_program.desc.serialize_to_string(),
+            # Note: stop_gradient of Variable is not saved in ProgramDesc.
+            'stop_gradients': [[
+                name for name, var in six.iteritems(b.vars) if var.stop_gradient
+            ] for b in self.main_program.blocks],
+            'outputs': None if self.outputs is None else
+            pack_sequence_as(self.outputs, flat_outputs)
+        }
+
+    @staticmethod
+    def _from_cache_entry(entry, func_spec, input_spec, class_instance):
+        """
+        Rebuilds the ConcreteProgram from the entry returned by `_to_cache_entry`.
+        """
+        main_program = framework.Program.parse_from_string(entry[
+            'main_program'])
+        startup_program = framework.Program.parse_from_string(entry[
+            'startup_program'])
+        main_program.random_seed = framework.default_main_program().random_seed
+        startup_program.random_seed = framework.default_startup_program(
+        ).random_seed
+        for block, names in zip(main_program.blocks, entry['stop_gradients']):
+            names = set(names)
+            for name, var in six.iteritems(block.vars):
+                var.stop_gradient = name in names
+
+        inputs = func_spec.find_static_inputs_with_spec(input_spec,
+                                                        main_program)
+        if class_instance:
+            inputs = tuple([class_instance] + list(inputs))
+
+        outputs = entry['outputs']
+        if outputs is not None:
+            block = main_program.global_block()
+            flat_outputs = [
+                block.var(out.name) if isinstance(out, VariableRef) else out
+                for out in flatten(outputs)
+            ]
+            outputs = pack_sequence_as(outputs, flat_outputs)
+
+        all_parameters_and_buffers = list(
+            get_parameters(class_instance).values()) + list(
+                get_buffers(class_instance).values())
+
+        return ConcreteProgram(
+            inputs=inputs,
+            outputs=outputs,
+            parameters=all_parameters_and_buffers,
+            function=func_spec.dygraph_function,
+            main_program=main_program,
+            startup_program=startup_program)
+
 
 class ProgramCache(object):
     """
     Wrapper class for the program functions defined by dygraph function.
+
+    It's a thread-safe LRU cache, holding at most `capacity` programs, and
+    at most `max_op_count` ops of all cached main programs if specified,
+    which is an approximation of the memory held by the programs. The least
+    recently used program is evicted when the cache is full, but the most
+    recent one is always kept.
+
+    Args:
+        capacity(int): the max number of cached programs, default PROGRAM_CACHE_CAPACITY.
+        max_op_count(int): the max total number of ops of cached programs, default
+            PROGRAM_CACHE_MAX_OP_COUNT.
     """
 
-    def __init__(self):
+    def __init__(self, capacity=None, max_op_count=None):
         self._caches = collections.OrderedDict()
+        self._capacity = capacity or PROGRAM_CACHE_CAPACITY
+        self._max_op_count = max_op_count or PROGRAM_CACHE_MAX_OP_COUNT
+        self._op_counts = dict()
+        self._total_op_count = 0
+        # Note: Use RLock because building a program may trace other decorated
+        # functions, which may share this cache.
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.trace_time = 0.0
 
     def _build_once(self, cache_key):
         concrete_program = ConcreteProgram.from_func_spec(
@@ -637,45 +906,101 @@ class ProgramCache(object):
             class_instance=cache_key.class_instance)
         return concrete_program, partial_program_from(concrete_program)
 
+    def _is_full(self):
+        if len(self._caches) > self._capacity:
+            return True
+        return self._max_op_count is not None and \
+            self._total_op_count > self._max_op_count
+
+    def _evict(self):
+        while len(self._caches) > 1 and self._is_full():
+            key, _ = self._caches.popitem(last=False)
+            self._total_op_count -= self._op_counts.pop(key)
+            self.evictions += 1
+
     def __getitem__(self, item):
         if not isinstance(item, CacheKey):
             raise ValueError('type(item) should be CacheKey, but received %s' %
                              type_name(item))
 
-        if item not in self._caches:
-            self._caches[item] = self._build_once(item)
+        with self._lock:
+            value = self._caches.pop(item, None)
+            if value is not None:
+                # move to the end as the most recently used program
+                self._caches[item] = value
+                self.hits += 1
+                return value
+
+            self.misses += 1
+            start = time.time()
+            value = self._build_once(item)
+            self.trace_time += time.time() - start
+
+            self._caches[item] = value
+            op_count = sum(
+                len(block.ops) for block in value[0].main_program.blocks)
+            self._op_counts[item] = op_count
+            self._total_op_count += op_count
+            self._evict()
+
             # Note: raise warnings if number of traced program is more than `max_tracing_count`
-            current_tracing_count = len(self._caches)
+            current_tracing_count = self.misses
             if current_tracing_count > MAX_TRACED_PROGRAM_COUNT:
                 logging_utils.warn(
                     "Current traced program number: {} > `max_tracing_count`:{}. Too much cached programs will bring expensive overhead. "
                     "The reason may be: (1) passing tensors with different shapes, (2) passing python objects instead of tensors.".
                     format(current_tracing_count, MAX_TRACED_PROGRAM_COUNT))
 
-        return self._caches[item]
+            return value
 
     def get_program(self, item):
         if not isinstance(item, CacheKey):
             raise ValueError(
                 "Input item's type should be FunctionSpec, but received %s" %
                 type_name(item))
-        if item not in self._caches:
-            raise RuntimeError(
-                "Failed to find program for input item, please decorate input function by `@paddle.jit.to_static`."
-            )
-        return self._caches[item]
+        with self._lock:
+            if item not in self._caches:
+                raise RuntimeError(
+                    "Failed to find program for input item, please decorate input function by `@paddle.jit.to_static`."
+                )
+            return self._caches[item]
 
     def last(self):
-        assert len(
-            self._caches) >= 1, "No valid cached program in ProgramCache."
-        key = next(reversed(self._caches.keys()))
-        return key, self._caches[key]
+        with self._lock:
+            assert len(
+                self._caches) >= 1, "No valid cached program in ProgramCache."
+            key = next(reversed(self._caches.keys()))
+            return key, self._caches[key]
 
     def __len__(self):
         return len(self._caches)
 
     def concrete_programs(self):
-        return [cp for key, (cp, _) in six.iteritems(self._caches)]
+        with self._lock:
+            return [cp for key, (cp, _) in six.iteritems(self._caches)]
+
+    def clear(self):
+        with self._lock:
+            self._caches.clear()
+            self._op_counts.clear()
+            self._total_op_count = 0
+
+    def stats(self):
+        """
+        Returns a dict of the size, capacity, op count, hits, misses, evictions and
+        total tracing time in seconds of the cache.
+        """
+        with self._lock:
+            return {
+                'size': len(self._caches),
+                'capacity': self._capacity,
+                'op_count': self._total_op_count,
+                'max_op_count': self._max_op_count,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'trace_time': self.trace_time,
+            }
 
 
 def synchronized(func):
@@ -1047,3 +1372,38 @@ class ProgramTranslator(object):
 
         """
         return self._program_cache
+
+    def set_cache_dir(self, cache_dir):
+        """
+        Sets the directory of the persistent cache, which saves the transformed code
+        and traced programs of decorated functions on disk, and reloads them in later
+        processes instead of transforming and tracing again. An entry is keyed by
+        the source code, Paddle version and input spec, and is dropped if any source
+        file of the functions converted while tracing changes. The cache can also be
+        enabled by the environment variable `PADDLE_DY2STATIC_CACHE_DIR`.
+
+        The python attributes of the Layer and the globals referenced by the decorated
+        function are part of the key too, a program is not cached if any of them has
+        no stable representation, e.g. a lambda or an unregistered Tensor.
+
+        Note:
+            The cached entries are loaded by `pickle`, which can run arbitrary code,
+            so only use a cache directory written by trusted processes.
+
+        Args:
+            cache_dir(str|None): the directory of the persistent cache, None to disable it.
+
+        Returns:
+            None.
+
+        Examples:
+            .. code-block:: python
+
+                import paddle.fluid as fluid
+
+                prog_trans = fluid.dygraph.ProgramTranslator()
+                prog_trans.set_cache_dir('./dy2static_cache')
+        """
+        check_type(cache_dir, "cache_dir", six.string_types + (type(None), ),
+                   "ProgramTranslator.set_cache_dir")
+        set_cache_dir(cache_dir)
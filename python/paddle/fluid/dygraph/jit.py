@@ -155,7 +155,10 @@ def copy_decorator_attrs(original_func, decorated_obj):
     return decorated_obj
 
 
-def declarative(function=None, input_spec=None):
+def declarative(function=None,
+                input_spec=None,
+                shape_bucketing=None,
+                cache_capacity=None):
     """
     Converts imperative dygraph APIs into declarative function APIs. Decorator
     @declarative handles the Program and Executor of static mode and returns
@@ -168,6 +171,15 @@ def declarative(function=None, input_spec=None):
         function (callable): callable imperative function.
         input_spec(list[InputSpec]): list of InputSpec to specific the shape/dtype/name
             information of each input Tensor.
+        shape_bucketing(str|callable, optional): the policy to map the shape of
+            inputs before looking up cached programs, so that inputs differing only
+            in the mapped dims share one program with dynamic dims. 'batch' makes
+            the first dim dynamic, 'all' makes all dims dynamic, and a callable
+            receives an InputSpec and returns the mapped one. Default None, a new
+            program is traced for each distinct input shape.
+        cache_capacity(int, optional): the max number of cached programs of the
+            function, the least recently used one is evicted when exceeded.
+            Default None, which means 64.
 
     Returns:
         Tensor(s): containing the numerical result.
@@ -207,7 +219,10 @@ def declarative(function=None, input_spec=None):
         static_layer = copy_decorator_attrs(
             original_func=python_func,
             decorated_obj=StaticFunction(
-                function=python_func, input_spec=input_spec))
+                function=python_func,
+                input_spec=input_spec,
+                shape_bucketing=shape_bucketing,
+                cache_capacity=cache_capacity))
 
         return static_layer
 
@@ -236,6 +251,10 @@ class _SaveLoadConfig(object):
         self._separate_params = False
         # used for `paddle.load`
         self._keep_name_table = False
+        self._use_mmap = True
+        # used for `paddle.save`
+        self._use_binary_format = False
+        self._shard_size = None
 
         # NOTE: Users rarely use following configs, so these configs are not open to users,
         # reducing user learning costs, but we retain the configuration capabilities
@@ -313,6 +332,48 @@ class _SaveLoadConfig(object):
                 % type(value))
         self._keep_name_table = value
 
+    @property
+    def use_mmap(self):
+        return self._use_mmap
+
+    @use_mmap.setter
+    def use_mmap(self, value):
+        if value is None:
+            return
+        if not isinstance(value, bool):
+            raise TypeError(
+                "The config `use_mmap` should be bool value, but received input's type is %s."
+                % type(value))
+        self._use_mmap = value
+
+    @property
+    def use_binary_format(self):
+        return self._use_binary_format
+
+    @use_binary_format.setter
+    def use_binary_format(self, value):
+        if value is None:
+            return
+        if not isinstance(value, bool):
+            raise TypeError(
+                "The config `use_binary_format` should be bool value, but received input's type is %s."
+                % type(value))
+        self._use_binary_format = value
+
+    @property
+    def shard_size(self):
+        return self._shard_size
+
+    @shard_size.setter
+    def shard_size(self, value):
+        if value is None:
+            return
+        if not isinstance(value, six.integer_types) or value <= 0:
+            raise ValueError(
+                "The config `shard_size` should be positive integer, but received %s."
+                % value)
+        self._shard_size = value
+
 
 def _parse_save_configs(configs):
     supported_configs = ['output_spec']
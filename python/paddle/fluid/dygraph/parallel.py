@@ -16,6 +16,7 @@ import os
 import six
 import numpy as np
 import warnings
+import weakref
 from collections import OrderedDict
 
 from paddle.fluid import core
@@ -280,13 +281,121 @@ def scale_loss(loss):
     return scaled_loss
 
 
+# NOTE: dense gradients are allreduced in buckets of at most this many bytes
+_DEFAULT_COMM_BUFFER_SIZE = 128 * 1024 * 1024
+
+
+def _grad_alignment(place=None):
+    """
+    The alignment in bytes of each gradient in the flat buffer built by the
+    coalesce_tensor op, i.e. platform::Alignment, which is the minimum chunk
+    size of the allocator.
+    """
+    if place is None:
+        place = framework._current_expected_place()
+    if isinstance(place, core.CPUPlace):
+        return 1 << 12
+    return 1 << 8
+
+
+def _aligned_bytes(bytes, alignment):
+    remaining = bytes % alignment
+    return bytes if remaining == 0 else bytes + alignment - remaining
+
+
+class _GradBucket(object):
+    """
+    A group of dense gradients of the same dtype, which are allreduced as
+    one flat tensor.
+
+    The flat tensor is kept across steps, and the gradients are made views
+    of their slices by the coalesce_tensor op, so that they are updated in
+    place by the allreduce of the flat tensor, no coalesced buffer has to
+    be allocated and no split is needed after the allreduce.
+    """
+
+    def __init__(self, dtype):
+        self.dtype = dtype
+        self.param_names = []
+        self.numel = 0
+        self._buffer = None
+
+    def add(self, param_name, numel):
+        self.param_names.append(param_name)
+        self.numel += numel
+
+    @framework.dygraph_only
+    def coalesce(self, grad_vars):
+        if self._buffer is None:
+            self._buffer = framework._varbase_creator(dtype=self.dtype)
+        # NOTE: the copy of a gradient that is already a view of the buffer
+        #       is skipped, the gradient is copied into the buffer only when
+        #       backward has created a new tensor for it.
+        framework._dygraph_tracer().trace_op(
+            type='coalesce_tensor',
+            inputs={'Input': grad_vars},
+            outputs={'Output': grad_vars,
+                     'FusedOutput': self._buffer},
+            attrs={'copy_data': True,
+                   'dtype': self.dtype})
+        return self._buffer
+
+    @framework.dygraph_only
+    def allreduce(self, grad_vars, strategy):
+        buffer = self.coalesce(grad_vars)
+        if isinstance(framework._current_expected_place(), core.CPUPlace):
+            # allreduced by gloo on CPU
+            core.ops.c_allreduce_sum(buffer, buffer, 'use_calc_stream', True,
+                                     'ring_id', 0)
+        else:
+            buffer._allreduce(strategy)
+
+
+def _build_grad_buckets(params_and_grads, comm_buffer_size, alignment=None):
+    """
+    Assign the dense gradients to buckets in order, a new bucket is started
+    when the dtype changes or the bucket would exceed `comm_buffer_size`
+    bytes, a single gradient larger than `comm_buffer_size` has its own
+    bucket. The size of each gradient includes its alignment padding in the
+    flat buffer.
+    """
+    if alignment is None:
+        alignment = _grad_alignment()
+    buckets = []
+    bucket = None
+    bucket_bytes = 0
+    for param, g_var in params_and_grads:
+        numel = int(np.prod(g_var.shape))
+        bytes = _aligned_bytes(numel * core.size_of_dtype(g_var.dtype),
+                               alignment)
+        if bucket is None or bucket.dtype != g_var.dtype or \
+                bucket_bytes + bytes > comm_buffer_size:
+            bucket = _GradBucket(g_var.dtype)
+            bucket_bytes = 0
+            buckets.append(bucket)
+        bucket.add(param.name, numel)
+        bucket_bytes += bytes
+    return buckets
+
+
+def _get_grad_buckets(params_and_grads):
+    # NOTE: the buckets are kept by the DataParallel owning the parameters,
+    #       parameters out of any DataParallel are bucketed on every call.
+    for param, _ in params_and_grads:
+        owner = getattr(param, '_data_parallel', None)
+        owner = owner() if owner is not None else None
+        if owner is not None:
+            return owner._get_grad_buckets(params_and_grads)
+    return _build_grad_buckets(params_and_grads, _DEFAULT_COMM_BUFFER_SIZE)
+
+
 @no_grad
 def apply_collective_grads(parameters):
     if not ParallelEnv().world_size > 1:
         return
 
     grad_var_set = set()
-    grad_vars = []
+    params_and_grads = []
     sparse_grad_vars = []
     strategy = _build_default_parallel_strategy()
     for param in parameters:
@@ -296,7 +405,7 @@ def apply_collective_grads(parameters):
             if g_var._is_sparse():
                 sparse_grad_vars.append(g_var)
                 continue
-            grad_vars.append(g_var)
+            params_and_grads.append((param, g_var))
             assert g_var not in grad_var_set
             grad_var_set.add(g_var)
 
@@ -305,31 +414,17 @@ def apply_collective_grads(parameters):
         for grad_var in sparse_grad_vars:
             grad_var._allreduce(strategy)
 
+    if not params_and_grads:
+        return
+
     # FIXME(zcd): the type of the var should be LoDTensor, i.e
     # the gradients should be dense, otherwise, the following
     # logic should be updated.
-    # 128 MB as a group
-    mega_bytes = 128 * 1024 * 1024
-    group_idx = 0
-    memory_counter = 0
-    grad_var_groups = OrderedDict()
-    dtype = grad_vars[0].dtype
-    for g_var in grad_vars:
-        # NOTE: the dtype of the same group should be the same.
-        bytes = np.prod(g_var.shape) * core.size_of_dtype(g_var.dtype)
-        if memory_counter < mega_bytes and dtype == g_var.dtype:
-            memory_counter += bytes
-        else:
-            memory_counter = bytes
-            group_idx += 1
-        grad_var_groups.setdefault(group_idx, []).append(g_var)
-
-    coalesced_grads_and_vars = _coalesce_tensors(grad_var_groups)
-
-    for coalesced_grad, _, _ in coalesced_grads_and_vars:
-        coalesced_grad._allreduce(strategy)
-
-    _split_tensors(coalesced_grads_and_vars)
+    grad_vars = dict(
+        (param.name, g_var) for param, g_var in params_and_grads)
+    for bucket in _get_grad_buckets(params_and_grads):
+        bucket.allreduce([grad_vars[name] for name in bucket.param_names],
+                         strategy)
 
 
 class DataParallel(layers.Layer):
@@ -355,6 +450,9 @@ class DataParallel(layers.Layer):
         layers(Layer): The module that should be executed by data parallel.
         strategy(ParallelStrategy, optional): (deprecated) The strategy of data parallelism, 
             contains environment configuration related to parallel execution. Default: None.
+        comm_buffer_size(int, optional): The maximum size in MB of a bucket of gradients,
+            the dense gradients of a bucket are kept in one persistent flat buffer and are
+            allreduced together. Default: 128.
             
     Returns:
         Layer: The data paralleled module.
@@ -411,12 +509,24 @@ class DataParallel(layers.Layer):
                 # train()
     """
 
-    def __init__(self, layers, strategy=None):
+    def __init__(self, layers, strategy=None, comm_buffer_size=128):
         super(DataParallel,
               self).__init__(layers.full_name() + "_data_parallel")
 
         self._layers = layers
 
+        if comm_buffer_size <= 0:
+            raise ValueError(
+                "comm_buffer_size should be positive, but received %s." %
+                comm_buffer_size)
+        self._comm_buffer_size = int(comm_buffer_size * 1024 * 1024)
+        self._grad_buckets_key = None
+        self._grad_buckets = None
+        # NOTE: a weak reference, so that the parameters, which may be
+        #       shared with other models, don't keep this model alive.
+        for param in layers.parameters():
+            param._data_parallel = weakref.ref(self)
+
         # NOTE(chenweihang): The ParallelStrategy here is not strictly a strategy. 
         # It just stores some environment variables, which can be constructed by 
         # ParallelEnv. Here it is set as an optional argument.
@@ -429,6 +539,18 @@ class DataParallel(layers.Layer):
     def forward(self, *inputs, **kwargs):
         return self._layers(*inputs, **kwargs)
 
+    def _get_grad_buckets(self, params_and_grads):
+        # NOTE: only the buckets of the latest set of gradients are kept, they
+        #       are rebuilt, and so are the flat buffers, only when the set
+        #       of gradients produced by backward, or their shapes, change.
+        key = tuple((param.name, g_var.dtype, tuple(g_var.shape))
+                    for param, g_var in params_and_grads)
+        if key != self._grad_buckets_key:
+            self._grad_buckets = _build_grad_buckets(params_and_grads,
+                                                     self._comm_buffer_size)
+            self._grad_buckets_key = key
+        return self._grad_buckets
+
     @deprecated(
         since="2.0.0", reason="This method does not need to be called anymore.")
     def scale_loss(self, loss):
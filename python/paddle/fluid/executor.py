@@ -19,6 +19,8 @@ import os
 import multiprocessing
 import sys
 import warnings
+import weakref
+import collections
 import numpy as np
 from .wrapped_decorator import signature_safe_contextmanager
 import six
@@ -37,6 +39,10 @@ from .incubate.checkpoint import auto_checkpoint as acp
 __all__ = ['Executor', 'global_scope', 'scope_guard']
 
 g_scope = core.Scope()
+# the max number of prepared programs cached in an Executor
+PROGRAM_CACHE_CAPACITY = 128
+# the max number of checked feed (shape, dtype) kept for a cached program
+MAX_CHECKED_FEED_SIGNATURES = 64
 InferNativeConfig = core.NativeConfig
 InferAnalysisConfig = core.AnalysisConfig
 
@@ -383,19 +389,93 @@ def _to_name_str(var):
         return _to_str(var)
 
 
+def _get_program_version(program):
+    if isinstance(program, compiler.CompiledProgram):
+        program = program._program
+    return getattr(program, '_mutation_version', 0)
+
+
 def _get_strong_program_cache_key(program, feed, fetch_list):
-    return str(id(program)) + _get_program_cache_key(feed, fetch_list)
+    return (id(program), _get_program_version(program)
+            ) + _get_program_cache_key(feed, fetch_list)
 
 
 def _get_program_cache_key(feed, fetch_list):
-    feed_var_names = []
     if isinstance(feed, dict):
-        feed_var_names = list(feed.keys())
+        feed_var_names = tuple(feed)
     elif isinstance(feed, list) or isinstance(feed, tuple):
-        for i, each in enumerate(feed):
-            feed_var_names += list(each.keys())
-    fetch_var_names = list(map(_to_name_str, fetch_list))
-    return str(feed_var_names + fetch_var_names)
+        feed_var_names = tuple(name for each in feed for name in each)
+    else:
+        feed_var_names = ()
+    fetch_var_names = tuple(map(_to_name_str, fetch_list))
+    return (feed_var_names, fetch_var_names)
+
+
+class _ProgramCache(object):
+    """
+    Bounded LRU cache of programs prepared by Executor.
+
+    The cache is keyed by :code:`_get_strong_program_cache_key`, each entry
+    holds a weak reference to the program it is built from, so an entry of
+    a released program will never be returned even if the id of the
+    program is reused by a new one, and it will be removed from the cache
+    lazily. Least recently used entry is evicted when the cache is full.
+
+    Args:
+        capacity(int): the max entry number of the cache.
+    """
+
+    def __init__(self, capacity=None):
+        self._capacity = capacity or PROGRAM_CACHE_CAPACITY
+        self._cache = collections.OrderedDict()
+        # keys of entries whose program is released, appended by weakref
+        # callback, which may be called in any time by gc, so entries are
+        # not removed in the callback directly
+        self._dead_keys = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _remove_dead_entries(self):
+        while self._dead_keys:
+            self._cache.pop(self._dead_keys.pop(), None)
+
+    def get(self, key, program):
+        self._remove_dead_entries()
+        entry = self._cache.pop(key, None)
+        if entry is None or entry[0]() is not program:
+            self.misses += 1
+            return None
+        # move to the end as the most recently used entry
+        self._cache[key] = entry
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key, program, value):
+        self._remove_dead_entries()
+        dead_keys = self._dead_keys
+        program_ref = weakref.ref(program, lambda ref: dead_keys.append(key))
+        self._cache.pop(key, None)
+        self._cache[key] = (program_ref, value)
+        while len(self._cache) > self._capacity:
+            self._cache.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._cache.clear()
+        del self._dead_keys[:]
+
+    def __len__(self):
+        return len(self._cache)
+
+    def stats(self):
+        return {
+            'size': len(self._cache),
+            'capacity': self._capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
 
 
 def _as_lodtensor(data, place, dtype=None):
@@ -446,6 +526,64 @@ def _as_lodtensor(data, place, dtype=None):
     return tensor
 
 
+class _CompiledFeed(object):
+    """
+    Feed plan of a program cached by Executor.
+
+    Feed targets are collected from the feed ops of the program once.
+    Shape and dtype of a numpy feed are checked by
+    :code:`check_feed_shape_type` only when a new (shape, dtype) signature
+    of the feed target is met, later feeds with a checked signature are
+    copied into a LoDTensor kept for the feed target directly, whose
+    buffer is reused if the shape is unchanged. Other kinds of feed data
+    are converted and checked as :code:`Executor._feed_data` on each call.
+
+    Args:
+        program(Program): the program with feed ops prepended.
+        place(Place): the place to put feed data.
+    """
+
+    def __init__(self, program, place):
+        self._place = place
+        # (feed target name, col of feed op, feed target var)
+        self._feed_targets = []
+        global_block = program.global_block()
+        for op in global_block.ops:
+            if op.desc.type() == 'feed':
+                feed_target_name = op.desc.output('Out')[0]
+                self._feed_targets.append(
+                    (feed_target_name, op.desc.attr('col'),
+                     global_block.var(feed_target_name)))
+            else:
+                break
+        self._tensors = {}
+        self._checked_signatures = set()
+
+    def feed(self, feed, feed_var_name, scope):
+        for feed_target_name, col, var in self._feed_targets:
+            cur_feed = feed[feed_target_name]
+            if isinstance(cur_feed, np.ndarray):
+                signature = (col, cur_feed.shape, cur_feed.dtype)
+                tensor = self._tensors.get(col, None)
+                if tensor is None:
+                    tensor = core.LoDTensor()
+                    self._tensors[col] = tensor
+                tensor.set(cur_feed, self._place)
+                if signature not in self._checked_signatures:
+                    check_feed_shape_type(var, tensor)
+                    # avoid unbounded growth with feeds of varying shapes
+                    if len(self._checked_signatures
+                           ) >= MAX_CHECKED_FEED_SIGNATURES:
+                        self._checked_signatures.clear()
+                    self._checked_signatures.add(signature)
+            else:
+                if not isinstance(cur_feed, core.LoDTensor):
+                    cur_feed = _as_lodtensor(cur_feed, self._place, var.dtype)
+                check_feed_shape_type(var, cur_feed)
+                tensor = cur_feed
+            core.set_feed_variable(scope, tensor, feed_var_name, col)
+
+
 class FetchHandler(object):
     def __init__(self, var_dict=None, period_secs=60):
         assert var_dict != None
@@ -554,11 +692,12 @@ class Executor(object):
             self.place = expected_place
         else:
             self.place = place
-        self.program_caches = dict()
-        self.ctx_caches = dict()
-        self.scope_caches = dict()
+        # program, ctx, scope and feed plan cached for use_program_cache,
+        # stored as a (program, ctx, scope, compiled_feed) tuple in one
+        # entry to be evicted together
+        self.program_caches = _ProgramCache()
         self.var_caches = dict()
-        self.pruned_program_caches = dict()
+        self.pruned_program_caches = _ProgramCache()
         p = core.Place()
         p.set_place(self.place)
         self._default_executor = core.Executor(p)
@@ -568,23 +707,21 @@ class Executor(object):
         self._auto_checkpoint_name = unique_name.generate(
             "__auto_checkpoint_executor__")
 
-    def _get_scope_cache(self, program_cache_key):
-        return self.scope_caches.get(program_cache_key, None)
-
-    def _get_ctx_cache(self, program_cache_key):
-        return self.ctx_caches.get(program_cache_key, None)
-
-    def _get_program_cache(self, program_cache_key):
-        return self.program_caches.get(program_cache_key, None)
+    def _get_program_cache(self, program_cache_key, program):
+        return self.program_caches.get(program_cache_key, program)
 
-    def _add_program_cache(self, program_cache_key, program):
-        self.program_caches[program_cache_key] = program
+    def _add_program_cache(self, program_cache_key, program, cached_program,
+                           ctx, scope, compiled_feed):
+        self.program_caches.set(program_cache_key, program,
+                                (cached_program, ctx, scope, compiled_feed))
 
-    def _get_pruned_program_cache(self, program_cache_key):
-        return self.pruned_program_caches.get(program_cache_key, None)
+    def _get_pruned_program_cache(self, program_cache_key, program):
+        return self.pruned_program_caches.get(program_cache_key, program)
 
-    def _add_pruned_program_cache(self, program_cache_key, program):
-        self.pruned_program_caches[program_cache_key] = program
+    def _add_pruned_program_cache(self, program_cache_key, program,
+                                  pruned_program):
+        self.pruned_program_caches.set(program_cache_key, program,
+                                       pruned_program)
 
     def _get_pruned_program_scope_cache(self, program_cache_key):
         return self.pruned_program_scope_caches.get(program_cache_key, None)
@@ -592,11 +729,16 @@ class Executor(object):
     def _add_pruned_program_scope_cache(self, program_cache_key, program):
         self.pruned_program_scope_caches[program_cache_key] = program
 
-    def _add_ctx_cache(self, ctx_cache_key, ctx):
-        self.ctx_caches[ctx_cache_key] = ctx
-
-    def _add_scope_cache(self, scope_cache_key, scope):
-        self.scope_caches[scope_cache_key] = scope
+    def _cache_stats(self):
+        """
+        Get size, capacity, hits, misses and evictions of the program cache
+        used by :code:`use_program_cache` and the pruned program cache used
+        by :code:`use_prune`.
+        """
+        return {
+            'program_cache': self.program_caches.stats(),
+            'pruned_program_cache': self.pruned_program_caches.stats(),
+        }
 
     def _add_feed_fetch_ops(self, program, feed, fetch_list, feed_var_name,
                             fetch_var_name):
@@ -1148,7 +1290,8 @@ class Executor(object):
         if use_prune:
             cache_key = _get_strong_program_cache_key(program, feed,
                                                       _origin_fetch_list)
-            cached_pruned_program = self._get_pruned_program_cache(cache_key)
+            cached_pruned_program = self._get_pruned_program_cache(
+                cache_key, _origin_program)
             if cached_pruned_program is None:
                 if isinstance(program, compiler.CompiledProgram):
                     program_scope_cache = self._get_pruned_program_scope_cache(
@@ -1163,7 +1306,8 @@ class Executor(object):
                             str(id(_origin_program)), program)
                 pruned_program = self._prune_program(program, feed, fetch_list,
                                                      optimize_ops)
-                self._add_pruned_program_cache(cache_key, pruned_program)
+                self._add_pruned_program_cache(cache_key, _origin_program,
+                                               pruned_program)
             else:
                 pruned_program = cached_pruned_program
 
@@ -1258,17 +1402,14 @@ class Executor(object):
 
         if use_program_cache:
             cache_key = _get_strong_program_cache_key(program, feed, fetch_list)
-            cached_program = self._get_program_cache(cache_key)
-            cached_ctx = self._get_ctx_cache(cache_key)
-            cached_scope = self._get_scope_cache(cache_key)
-            if cached_program is None:
+            cached = self._get_program_cache(cache_key, program)
+            if cached is None:
                 cached_program = self._add_feed_fetch_ops(
                     program=program,
                     feed=feed,
                     fetch_list=fetch_list,
                     feed_var_name=feed_var_name,
                     fetch_var_name=fetch_var_name)
-                self._add_program_cache(cache_key, cached_program)
                 fetch_list_str = list(map(_to_name_str, fetch_list))
                 cached_ctx = self._default_executor.prepare(
                     cached_program.desc, 0, fetch_list_str, False)
@@ -1280,8 +1421,13 @@ class Executor(object):
                 cached_scope = scope.new_scope()
                 self._default_executor.create_variables(cached_program.desc,
                                                         cached_scope, 0)
-                self._add_ctx_cache(cache_key, cached_ctx)
-                self._add_scope_cache(cache_key, cached_scope)
+                compiled_feed = _CompiledFeed(cached_program, self.place)
+                self._add_program_cache(cache_key, program, cached_program,
+                                        cached_ctx, cached_scope,
+                                        compiled_feed)
+            else:
+                (cached_program, cached_ctx, cached_scope,
+                 compiled_feed) = cached
             program = cached_program
             ctx = cached_ctx
             scope = cached_scope
@@ -1293,7 +1439,10 @@ class Executor(object):
                 feed_var_name=feed_var_name,
                 fetch_var_name=fetch_var_name)
 
-        self._feed_data(program, feed, feed_var_name, scope)
+        if use_program_cache:
+            compiled_feed.feed(feed, feed_var_name, scope)
+        else:
+            self._feed_data(program, feed, feed_var_name, scope)
         if hasattr(program, 'lr_sheduler'):
             assert isinstance(program.lr_sheduler,
                               _LRScheduler), "must be _LRScheduler"
@@ -2528,10 +2528,56 @@ class Block(object):
 
     def __init__(self, program, idx):
         self.desc = program.desc.block(idx)
-        self.vars = collections.OrderedDict()  # var_name --> var
-        self.ops = list()  # operator list
+        self._vars = collections.OrderedDict()  # var_name --> var
+        self._ops = list()  # operator list
         self.program = program
         self.removed_vars = collections.OrderedDict()
+        # (data_info, param_info) if the python side is built lazily
+        self._lazy_build = None
+        # the generation of the desc when the python side was last synced
+        self._synced_generation = None
+
+    @property
+    def vars(self):
+        if self._lazy_build is not None:
+            self._build()
+        return self._vars
+
+    @property
+    def ops(self):
+        if self._lazy_build is not None:
+            self._build()
+        return self._ops
+
+    def _build_lazily(self, data_info=None, param_info=None):
+        """
+        Defer building the python Variables and Operators of this block from
+        its desc until `vars` or `ops` is accessed, then set the information
+        of data variables and of parameters like `_copy_data_info_from` and
+        `_copy_param_info_from`.
+
+        Args:
+            data_info(tuple|None): the information of data variables of the
+                origin block, got by `_get_data_info`.
+            param_info(list|None): the information of parameters of the
+                origin block, got by `_get_param_info`.
+
+        Returns:
+            None
+        """
+        self._lazy_build = (data_info, param_info)
+
+    def _build(self):
+        data_info, param_info = self._lazy_build
+        self._lazy_build = None
+        # building the python side doesn't change the program
+        mutation_version = self.program._mutation_version
+        self._sync_with_cpp()
+        self.program._mutation_version = mutation_version
+        if param_info is not None:
+            self._set_param_info(param_info)
+        if data_info is not None:
+            self._set_data_info(data_info)
 
     def __str__(self):
         return self._to_readable_code()
@@ -2905,6 +2951,7 @@ class Block(object):
                 attrs=kwargs.get("attrs", None))
 
             self.ops.append(op)
+            self.program._mutation_version += 1
 
         return op
 
@@ -2922,6 +2969,7 @@ class Block(object):
         op_desc = self.desc._insert_op(index)
         op = Operator(block=self, desc=op_desc, *args, **kwargs)
         self.ops.insert(index, op)
+        self.program._mutation_version += 1
         return op
 
     def _remove_op(self, index):
@@ -2937,6 +2985,7 @@ class Block(object):
         self._sync_with_cpp()
         self.desc._remove_op(index, index + 1)
         del self.ops[index]
+        self.program._mutation_version += 1
 
     def _slice_ops(self, start, end):
         """
@@ -2973,6 +3022,7 @@ class Block(object):
                 outputs=kwargs.get("outputs", None),
                 attrs=kwargs.get("attrs", None))
             self.ops.insert(0, op)
+            self.program._mutation_version += 1
 
         return op
 
@@ -2981,66 +3031,47 @@ class Block(object):
         Sync from the desc on the c++ end. This method is used to synchronize
         the c++ desc instance generated by backward.
         """
+        # NOTE: no op or var has been added or removed since the last sync,
+        #       so that an unchanged block is not walked.
+        generation = self.desc._generation()
+        if generation == self._synced_generation:
+            return
+
         # sync variables from cpp
+        var_names_in_cpp = set()
         for var in self.desc.all_vars():
+            var_names_in_cpp.add(var.name())
             if not self.has_var(var.name()):
                 self.create_var(name=var.name(), desc=var, type=var.type())
 
         # sync variables removed from c++ end
         for var in list(self.vars.keys()):
-            if not self.desc.find_var(cpt.to_bytes(var)):
+            if var not in var_names_in_cpp:
                 self.vars.pop(var)
 
         # sync operators from cpp
-        ops_in_cpp = []
-        for op_idx in range(0, self.desc.op_size()):
-            ops_in_cpp.append(self.desc.op(op_idx))
-
-        if len(self.ops) != 0:
-            first_op_in_python = self.ops[0].desc
-            last_op_in_python = self.ops[len(self.ops) - 1].desc
-            start_index = None
-            end_index = None
-            for index in range(len(ops_in_cpp)):
-                if first_op_in_python == ops_in_cpp[index]:
-                    start_index = index
-                if last_op_in_python == ops_in_cpp[index]:
-                    end_index = index
-            assert start_index is not None
-            assert end_index is not None
-            assert start_index <= end_index
-        else:
-            start_index = 0
-            end_index = -1
-
-        # sync ops append to the head of cpp_ops
-        for index in range((start_index - 1 - 1), -1, -1):
-            op_desc = ops_in_cpp[index]
-            op = Operator(self, op_desc)
-            self.ops.insert(0, op)
-
-        # sync ops append to the end of cpp_ops
-        for index in range((end_index + 1), len(ops_in_cpp)):
-            op_desc = ops_in_cpp[index]
-            op = Operator(self, op_desc)
-            self.ops.append(op)
-
-        # sync ops removed from c++ end
-        if end_index != -1 and end_index < len(self.ops):
-            ops_in_cpp_index = 0
-            ops_in_python_index = 0
-            while ops_in_python_index < len(
-                    self.ops) and ops_in_cpp_index < len(ops_in_cpp):
-                if self.ops[ops_in_python_index].desc != ops_in_cpp[
-                        ops_in_cpp_index]:
-                    del self.ops[ops_in_python_index]
-                else:
-                    ops_in_cpp_index += 1
-                    ops_in_python_index += 1
-
-        assert len(self.ops) == len(ops_in_cpp)
-        for index in range(len(self.ops)):
-            assert self.ops[index].desc == ops_in_cpp[index]
+        # NOTE: op descs are matched to the python ops by a desc-to-Operator
+        #       map, so that the ops added or removed anywhere on the c++ end
+        #       are synchronized in one linear pass, and the unchanged ops
+        #       keep their python instances.
+        op_size = self.desc.op_size()
+        if len(self.ops) == op_size and all(
+                op.desc is self.desc.op(op_idx)
+                for op_idx, op in enumerate(self.ops)):
+            self._synced_generation = generation
+            return
+        desc_to_op = dict((op.desc, op) for op in self.ops)
+        ops = []
+        for op_idx in range(op_size):
+            op_desc = self.desc.op(op_idx)
+            op = desc_to_op.get(op_desc, None)
+            if op is None:
+                op = Operator(self, op_desc)
+            ops.append(op)
+        self.ops[:] = ops
+        self._synced_generation = generation
+        # the ops are changed on the c++ end, e.g. by backward or transpilers
+        self.program._mutation_version += 1
 
     def _copy_param_info_from(self, other):
         """
@@ -3059,9 +3090,35 @@ class Block(object):
         if not isinstance(other, Block):
             raise TypeError(
                 "_copy_param_info_from should be invoked with Block")
-        for p in other.iter_parameters():
+        self._set_param_info(Block._get_param_info(other.iter_parameters()))
+
+    @staticmethod
+    def _get_param_info(params):
+        """
+        Get the information of parameters to be copied, which doesn't refer
+        to the parameters.
+
+        Args:
+            params(iterable): the parameters.
+
+        Returns:
+            list: the name and the attributes of each parameter.
+        """
+        param_info = []
+        for p in params:
             assert isinstance(p, Parameter)
-            v = self.vars.get(p.name, None)
+            param_info.append((p.name, {
+                'stop_gradient': p.stop_gradient,
+                'trainable': p.trainable,
+                'optimize_attr': dict(p.optimize_attr),
+                'regularizer': p.regularizer,
+                'error_clip': p.error_clip
+            }))
+        return param_info
+
+    def _set_param_info(self, param_info):
+        for name, attrs in param_info:
+            v = self.vars.get(name, None)
             if v is None:
                 # if the Parameter is pruned, v may be None
                 continue
@@ -3073,12 +3130,8 @@ class Block(object):
                     dtype=v.dtype,
                     type=v.type,
                     lod_level=v.lod_level,
-                    stop_gradient=p.stop_gradient,
-                    trainable=p.trainable,
-                    optimize_attr=p.optimize_attr,
-                    regularizer=p.regularizer,
-                    error_clip=p.error_clip,
-                    name=v.name)
+                    name=v.name,
+                    **attrs)
             else:
                 new_p = Parameter(
                     block=self,
@@ -3087,14 +3140,58 @@ class Block(object):
                     type=v.type,
                     lod_level=v.lod_level
                     if v.type == core.VarDesc.VarType.LOD_TENSOR else None,
-                    stop_gradient=p.stop_gradient,
-                    trainable=p.trainable,
-                    optimize_attr=p.optimize_attr,
-                    regularizer=p.regularizer,
-                    error_clip=p.error_clip,
-                    name=v.name)
+                    name=v.name,
+                    **attrs)
             self.vars[new_p.name] = new_p
 
+    def _copy_data_info_from(self, other_vars):
+        """
+        Copy the information of data variables from the variables of the other
+        block.
+
+        Args:
+            other_vars(dict): the variables of the other block by name.
+
+        Returns:
+            None
+        """
+        self._set_data_info(Block._get_data_info(other_vars))
+
+    @staticmethod
+    def _get_data_info(other_vars):
+        """
+        Get the information of data variables to be copied, which doesn't
+        refer to the variables.
+
+        Args:
+            other_vars(dict): the variables by name.
+
+        Returns:
+            tuple: the names of the variables which are data, which need
+                check feed and which stop gradient.
+        """
+        data_names = set()
+        check_feed_names = set()
+        stop_gradient_names = set()
+        for name, var in six.iteritems(other_vars):
+            if var.is_data:
+                data_names.add(name)
+            if var.desc.need_check_feed():
+                check_feed_names.add(name)
+            if var.stop_gradient:
+                stop_gradient_names.add(name)
+        return data_names, check_feed_names, stop_gradient_names
+
+    def _set_data_info(self, data_info):
+        data_names, check_feed_names, stop_gradient_names = data_info
+        for var in list(self.vars.values()):
+            if var.name in data_names:
+                var.is_data = True
+            if var.name in check_feed_names:
+                var.desc.set_need_check_feed(True)
+            if var.name in stop_gradient_names:
+                var.stop_gradient = True
+
     def _clone_variable(self, var, force_persistable=True):
         """
         Clone a variable into current block.
@@ -4012,6 +4109,12 @@ class Program(object):
         self._current_role = core.op_proto_and_checker_maker.OpRole.Forward
         self.__op_role_var = []
 
+        # version of this program, increased when ops are added or removed,
+        # used by Executor to invalidate cached prepared programs.
+        # NOTE: not `_version`, which is the method returning the version of
+        # the ProgramDesc.
+        self._mutation_version = 0
+
         # for distribute training
         # _is_distributed = True if under distributed training
         self._is_distributed = False
@@ -4320,6 +4423,7 @@ class Program(object):
             1. :code:`Program.clone()` method DOES NOT clone :ref:`api_paddle_io_DataLoader` . 
             2. Recommend you to use :code:`clone` before using :code:`Opimizer.minimize` . 
             3. This API has no effect in Dygraph Mode.
+            4. The Tensors and Operators of each Block of the new Program are created on the first access of the Block. 
 
         Create a new Program with forward content of original one when ``for_test=True``.
         Create a new Program as same as the original one when ``for_test=False``.
@@ -4496,11 +4600,11 @@ class Program(object):
             forward_prog = Program()
             forward_prog.desc, pruned_origin_block_id_map = core.prune_backward(
                 self.desc)
+            # NOTE: _inference_optimize only reads the desc of forward_prog
             forward_prog.blocks = [
                 Block(forward_prog, i)
                 for i in six.moves.range(forward_prog.desc.num_blocks())
             ]
-            forward_prog._sync_with_cpp()
             p = forward_prog._inference_optimize(prune_read_op=False)
         else:
             p = Program()
@@ -4517,12 +4621,24 @@ class Program(object):
             if hasattr(self, 'lr_sheduler'):
                 p.lr_sheduler = self.lr_sheduler
 
-            #NOTE(zhiqiu): we sync the cloned program, to update its program by
-            # its desc.
-            p._sync_with_cpp()
-
-        p._copy_param_info_from(self)
-        p._copy_data_info_from(self, pruned_origin_block_id_map)
+        # NOTE: building the python Variables and Operators of a large program
+        # costs much more than copying its desc, and a cloned program is often
+        # only run by the executor, so they are built on the first access of
+        # each block. The information to be copied from the origin variables
+        # is taken here, so that it is not affected by later changes of the
+        # origin program, e.g. by Optimizer.minimize, and the cloned program
+        # doesn't refer to the origin variables.
+        if not pruned_origin_block_id_map:
+            pruned_origin_block_id_map = {
+                i: i
+                for i in six.moves.range(p.desc.num_blocks())
+            }
+        for i, block in enumerate(p.blocks):
+            origin_block = self.blocks[pruned_origin_block_id_map[i]]
+            param_info = Block._get_param_info(origin_block.iter_parameters()) \
+                if i == 0 else None
+            block._build_lazily(
+                Block._get_data_info(origin_block.vars), param_info)
         p._copy_dist_param_info_from(self)
         return p
 
@@ -4685,7 +4801,8 @@ class Program(object):
         res.blocks = [
             Block(res, i) for i in six.moves.range(res.desc.num_blocks())
         ]
-        res._sync_with_cpp()
+        for block in res.blocks:
+            block._build_lazily()
         return res
 
     @staticmethod
@@ -5025,14 +5142,7 @@ class Program(object):
         # The reverse is not true, due to backward pruning.
         for i, block in enumerate(self.blocks):
             other_block = other.blocks[pruned_origin_block_id_map[i]]
-            for var in list(block.vars.values()):
-                other_var = other_block.var(var.name)
-                if other_var.is_data:
-                    var.is_data = True
-                if other_var.desc.need_check_feed():
-                    var.desc.set_need_check_feed(True)
-                if other_var.stop_gradient:
-                    var.stop_gradient = True
+            block._copy_data_info_from(other_block.vars)
 
     def list_vars(self):
         """
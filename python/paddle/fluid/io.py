@@ -18,8 +18,11 @@ import os
 import errno
 import warnings
 import six
+import json
+import struct
 import logging
 import pickle
+import threading
 import contextlib
 from functools import reduce
 
@@ -42,6 +45,8 @@ from .reader import *
 from . import dataloader
 from .dataloader import *
 from . import core
+from .proto import framework_pb2
+from .data_feeder import convert_dtype
 from .. import compat as cpt
 
 batch = paddle.batch
@@ -190,6 +195,177 @@ def _clone_var_in_block_(block, var):
             persistable=True)
 
 
+# NOTE: [ Parallel save/load of variables ]
+# When `num_threads` > 1 is given to save_vars/load_vars and variables
+# are saved in separate files, LoDTensor variables are read from or set
+# to the scope directly in a thread pool, without running save/load ops
+# by executor. The file of each variable has the same format as written
+# by `save` op, so files can also be loaded by `load` op. Variables are
+# split into `num_threads` chunks with balanced bytes, each chunk is
+# written by a thread, and a manifest of all saved variables is written
+# atomically after all the variable files are written and synced.
+_MANIFEST_FILENAME = "__manifest__"
+
+
+def _split_var_chunks(items, sizes, num_chunks):
+    # greedily put the largest item to the smallest chunk
+    chunks = [[] for _ in six.moves.range(num_chunks)]
+    chunk_sizes = [0] * num_chunks
+    for i in sorted(
+            six.moves.range(len(items)), key=lambda i: sizes[i],
+            reverse=True):
+        idx = chunk_sizes.index(min(chunk_sizes))
+        chunks[idx].append(items[i])
+        chunk_sizes[idx] += sizes[i]
+    return [chunk for chunk in chunks if len(chunk) > 0]
+
+
+def _run_in_threads(func, chunks):
+    errors = []
+
+    def _worker(chunk):
+        try:
+            for item in chunk:
+                func(item)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [
+        threading.Thread(
+            target=_worker, args=(chunk, )) for chunk in chunks
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if len(errors) > 0:
+        raise errors[0]
+
+
+def _write_lod_tensor(file_path, array, lod, dtype):
+    with open(file_path, 'wb') as f:
+        # uint32 version of LoDTensor and LoD information
+        f.write(struct.pack('<I', 0))
+        f.write(struct.pack('<Q', len(lod)))
+        for level in lod:
+            level = np.array(level, dtype=np.uint64)
+            f.write(struct.pack('<Q', level.nbytes))
+            f.write(level.tobytes())
+        # uint32 version of Tensor, tensor desc and tensor data
+        f.write(struct.pack('<I', 0))
+        desc = framework_pb2.VarType.TensorDesc()
+        desc.data_type = dtype
+        desc.dims.extend(array.shape)
+        desc_bytes = desc.SerializeToString()
+        f.write(struct.pack('<i', len(desc_bytes)))
+        f.write(desc_bytes)
+        array.tofile(f)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _read_lod_tensor(file_path):
+    with open(file_path, 'rb') as f:
+        version, lod_level = struct.unpack('<IQ', f.read(12))
+        if version != 0:
+            raise RuntimeError("Tensor version %u is not supported." %
+                               version)
+        lod = []
+        for _ in six.moves.range(lod_level):
+            size = struct.unpack('<Q', f.read(8))[0]
+            lod.append(
+                np.frombuffer(
+                    f.read(size), dtype=np.uint64).tolist())
+        version, desc_size = struct.unpack('<Ii', f.read(8))
+        if version != 0:
+            raise RuntimeError("Tensor version %u is not supported." %
+                               version)
+        desc = framework_pb2.VarType.TensorDesc.FromString(f.read(desc_size))
+        shape = list(desc.dims)
+        dtype = convert_dtype(desc.data_type)
+        array = np.fromfile(
+            f, dtype=dtype, count=int(np.prod(shape))).reshape(shape)
+    return array, lod
+
+
+def _write_manifest(dirname, manifest):
+    manifest_path = os.path.join(dirname, _MANIFEST_FILENAME)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f)
+        f.flush()
+        os.fsync(f.fileno())
+    # NOTE: os.rename can not overwrite existing file on Windows
+    if os.path.exists(manifest_path) and os.name == 'nt':
+        os.remove(manifest_path)
+    os.rename(tmp_path, manifest_path)
+
+
+def _read_manifest(dirname):
+    manifest_path = os.path.join(dirname, _MANIFEST_FILENAME)
+    if not os.path.isfile(manifest_path):
+        return None
+    with open(manifest_path, 'r') as f:
+        return json.load(f)
+
+
+def _save_vars_parallel(dirname, vars, num_threads):
+    scope = global_scope()
+    items = []
+    sizes = []
+    manifest = {'vars': {}}
+    for each_var in vars:
+        var = scope.find_var(each_var.name)
+        assert var is not None, "can't not find var: " + each_var.name
+        tensor = var.get_tensor()
+        shape = tensor.shape()
+        items.append((each_var.name, tensor))
+        sizes.append(int(np.prod(shape)))
+        manifest['vars'][each_var.name] = {
+            'dtype': convert_dtype(tensor._dtype()),
+            'shape': shape,
+        }
+
+    def _save(item):
+        name, tensor = item
+        _write_lod_tensor(
+            os.path.join(dirname, name),
+            np.array(tensor), tensor.lod(), tensor._dtype())
+
+    if not os.path.isdir(dirname):
+        os.makedirs(dirname)
+    _run_in_threads(_save, _split_var_chunks(items, sizes, num_threads))
+    _write_manifest(dirname, manifest)
+
+
+def _load_vars_parallel(executor, dirname, vars, num_threads):
+    scope = global_scope()
+    manifest = _read_manifest(dirname)
+    items = []
+    sizes = []
+    for each_var in vars:
+        if manifest is not None and each_var.name not in manifest['vars']:
+            raise RuntimeError(
+                "Variable [ {} ] is not found in the manifest of {}, the "
+                "checkpoint may be incomplete.".format(each_var.name, dirname))
+        file_path = os.path.join(dirname, each_var.name)
+        if not os.path.isfile(file_path):
+            raise RuntimeError("Variable [ {} ] can not find at {}".format(
+                each_var.name, file_path))
+        # NOTE: create variables in main thread, scope is not thread safe
+        tensor = scope.var(each_var.name).get_tensor()
+        items.append((file_path, tensor))
+        sizes.append(os.path.getsize(file_path))
+
+    def _load(item):
+        file_path, tensor = item
+        array, lod = _read_lod_tensor(file_path)
+        tensor.set(array, executor.place)
+        tensor.set_lod(lod)
+
+    _run_in_threads(_load, _split_var_chunks(items, sizes, num_threads))
+
+
 @signature_safe_contextmanager
 def _load_program_scope(main=None, startup=None, scope=None):
     prog = main if main else paddle.fluid.Program()
@@ -226,7 +402,8 @@ def save_vars(executor,
               main_program=None,
               vars=None,
               predicate=None,
-              filename=None):
+              filename=None,
+              num_threads=1):
     """
     :api_attr: Static Graph
 
@@ -257,6 +434,12 @@ def save_vars(executor,
         filename(str, optional): If you prefer to save all variables in a single file,
                                  use `filename` to specify it. Otherwise, let `filename` be None.
                                  Default: None
+        num_threads(int, optional): The number of threads to save variables concurrently.
+                                 If it is larger than 1 and `filename` is None, LoDTensor
+                                 variables are read from scope and written to separate files
+                                 by a thread pool directly, and a manifest file is written
+                                 after all the variables are saved.
+                                 Default: 1
 
     Returns:
         str: When saving parameters to a file, returns None.
@@ -309,7 +492,8 @@ def save_vars(executor,
             main_program=main_program,
             dirname=dirname,
             vars=list(filter(predicate, main_program.list_vars())),
-            filename=filename)
+            filename=filename,
+            num_threads=num_threads)
     else:
         params_var_name = unique_name.generate("saved_params")
         # give warning when there is no var in model
@@ -319,6 +503,21 @@ def save_vars(executor,
             )
             return None
 
+        if num_threads > 1 and filename is None and not save_to_memory:
+            parallel_vars = [
+                var for var in vars
+                if var.type == core.VarDesc.VarType.LOD_TENSOR
+            ]
+            _save_vars_parallel(
+                os.path.normpath(dirname), parallel_vars, num_threads)
+            # other variables are still saved by save ops
+            vars = [
+                var for var in vars
+                if var.type != core.VarDesc.VarType.LOD_TENSOR
+            ]
+            if len(vars) == 0:
+                return None
+
         save_program = Program()
         save_block = save_program.global_block()
 
@@ -595,7 +794,11 @@ def _save_distributed_persistables(executor, dirname, main_program):
 
 
 @dygraph_not_support
-def save_persistables(executor, dirname, main_program=None, filename=None):
+def save_persistables(executor,
+                      dirname,
+                      main_program=None,
+                      filename=None,
+                      num_threads=1):
     """
     :api_attr: Static Graph
 
@@ -626,6 +829,8 @@ def save_persistables(executor, dirname, main_program=None, filename=None):
         filename(str, optional): The file to save all variables. If you prefer to
                                  save variables in different files, set it to None.
                                  Default: None.
+        num_threads(int, optional): The number of threads to save variables concurrently,
+                                 see :ref:`api_fluid_io_save_vars` . Default: 1.
 
     Returns:
         str: When saving parameters to a file, returns None.
@@ -662,7 +867,8 @@ def save_persistables(executor, dirname, main_program=None, filename=None):
             main_program=main_program,
             vars=None,
             predicate=is_persistable,
-            filename=filename)
+            filename=filename,
+            num_threads=num_threads)
 
 
 def load_vars(executor,
@@ -670,7 +876,8 @@ def load_vars(executor,
               main_program=None,
               vars=None,
               predicate=None,
-              filename=None):
+              filename=None,
+              num_threads=1):
     """
     :api_attr: Static Graph
 
@@ -701,6 +908,11 @@ def load_vars(executor,
         filename(str, optional): The file which saved all required variables. If variables
                                 were saved in separate files, set it to be None.
                                 Default: None
+        num_threads(int, optional): The number of threads to load variables concurrently.
+                                If it is larger than 1 and `filename` is None, LoDTensor
+                                variables are read from separate files and set to scope
+                                by a thread pool directly, without running load ops.
+                                Default: 1
 
     Returns:
         None
@@ -767,7 +979,8 @@ def load_vars(executor,
             dirname=dirname,
             main_program=main_program,
             vars=list(filter(predicate, main_program.list_vars())),
-            filename=filename)
+            filename=filename,
+            num_threads=num_threads)
     else:
         load_prog = Program()
         load_block = load_prog.global_block()
@@ -787,6 +1000,8 @@ def load_vars(executor,
         check_vars = []
         sparse_vars = []
 
+        parallel_vars = []
+
         for each_var in vars:
             assert isinstance(each_var, Variable)
 
@@ -801,6 +1016,12 @@ def load_vars(executor,
                 sparse_vars.append(each_var)
                 continue
 
+            if num_threads > 1 and filename is None and dirname is not None \
+                    and each_var.type == core.VarDesc.VarType.LOD_TENSOR:
+                parallel_vars.append(each_var)
+                check_vars.append(each_var)
+                continue
+
             new_var = _clone_var_in_block_(load_block, each_var)
             check_vars.append(each_var)
 
@@ -884,7 +1105,10 @@ def load_vars(executor,
                     'file_path': filename,
                     'model_from_memory': vars_from_memory
                 })
-        executor.run(load_prog)
+        if len(parallel_vars) > 0:
+            _load_vars_parallel(executor, dirname, parallel_vars, num_threads)
+        if len(load_block.ops) > 0:
+            executor.run(load_prog)
 
         # check var shape
         for each_var in check_vars:
@@ -963,7 +1187,11 @@ def load_params(executor, dirname, main_program=None, filename=None):
 
 
 @dygraph_not_support
-def load_persistables(executor, dirname, main_program=None, filename=None):
+def load_persistables(executor,
+                      dirname,
+                      main_program=None,
+                      filename=None,
+                      num_threads=1):
     """
     :api_attr: Static Graph
     
@@ -988,6 +1216,8 @@ def load_persistables(executor, dirname, main_program=None, filename=None):
         filename(str, optional): The file which saved all persistable variables. If variables
                                  were saved in separated files, set it to None.
                                  Default: None.
+        num_threads(int, optional): The number of threads to load variables concurrently,
+                                 see :ref:`api_fluid_io_load_vars` . Default: 1.
 
     Returns:
         None
@@ -1013,7 +1243,8 @@ def load_persistables(executor, dirname, main_program=None, filename=None):
             dirname=dirname,
             main_program=main_program,
             predicate=is_persistable,
-            filename=filename)
+            filename=filename,
+            num_threads=num_threads)
 
 
 def _load_distributed_persistables(executor, dirname, main_program=None):
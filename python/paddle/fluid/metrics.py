@@ -55,6 +55,65 @@ def _is_number_or_matrix_(var):
     return _is_number_(var) or isinstance(var, np.ndarray)
 
 
+def _binary_confusion_counts(preds, labels):
+    """
+    Count true positive, false positive and false negative of binary
+    predictions (0 or 1) and labels.
+    """
+    preds = np.asarray(preds).reshape([-1])
+    labels = np.asarray(labels).reshape([-1])
+    pred_pos = preds == 1
+    label_pos = labels == 1
+    tp = int(np.count_nonzero(pred_pos & label_pos))
+    fp = int(np.count_nonzero(pred_pos & ~label_pos))
+    fn = int(np.count_nonzero(~pred_pos & label_pos))
+    return tp, fp, fn
+
+
+def _auc_bucket_stats(preds, labels, num_thresholds):
+    """
+    Histogram the positive-class probabilities `preds[:, 1]` into
+    `num_thresholds + 1` buckets, separately for positive and negative
+    labels.
+    """
+    bin_idx = (preds[:, 1] * num_thresholds).astype('int64')
+    assert np.all(bin_idx <= num_thresholds)
+    is_pos = np.asarray(labels).reshape([-1]).astype('bool')
+    num_pred_buckets = num_thresholds + 1
+    stat_pos = np.bincount(bin_idx[is_pos], minlength=num_pred_buckets)
+    stat_neg = np.bincount(bin_idx[~is_pos], minlength=num_pred_buckets)
+    return stat_pos, stat_neg
+
+
+def _auc_from_bucket_stats(stat_pos, stat_neg, curve='ROC'):
+    """
+    Compute the area under the ROC or PR curve from bucket histograms of
+    positive and negative instances, accumulated from the highest bucket
+    (threshold) to the lowest.
+    """
+    tot_pos = np.cumsum(np.asarray(stat_pos, dtype='float64')[::-1])
+    tot_neg = np.cumsum(np.asarray(stat_neg, dtype='float64')[::-1])
+    if len(tot_pos) == 0 or tot_pos[-1] <= 0.0 or tot_neg[-1] <= 0.0:
+        return 0.0
+
+    if curve == 'PR':
+        # precision is undefined at thresholds without any prediction
+        predicted = tot_pos + tot_neg
+        valid = predicted > 0.0
+        recall = tot_pos[valid] / tot_pos[-1]
+        precision = tot_pos[valid] / predicted[valid]
+        prev_recall = np.concatenate([[0.0], recall[:-1]])
+        prev_precision = np.concatenate([precision[:1], precision[:-1]])
+        return float(
+            np.sum((recall - prev_recall) * (precision + prev_precision) /
+                   2.0))
+
+    prev_pos = np.concatenate([[0.0], tot_pos[:-1]])
+    prev_neg = np.concatenate([[0.0], tot_neg[:-1]])
+    auc = np.sum(np.abs(tot_neg - prev_neg) * (tot_pos + prev_pos) / 2.0)
+    return float(auc / tot_pos[-1] / tot_neg[-1])
+
+
 class MetricBase(object):
     """
     In many cases, we usually have to split the test data into mini-batches for evaluating 
@@ -326,17 +385,30 @@ class Precision(MetricBase):
             raise ValueError("The 'preds' must be a numpy ndarray.")
         if not _is_numpy_(labels):
             raise ValueError("The 'labels' must be a numpy ndarray.")
-        sample_num = labels.shape[0]
         preds = np.rint(preds).astype("int32")
+        tp, fp, _ = _binary_confusion_counts(preds, labels)
+        self.tp += tp
+        self.fp += fp
 
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if pred == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fp += 1
+    def get_state(self):
+        """
+        Get the states of the metric, which can be summed across workers
+        and merged by :code:`merge_state`.
+
+        Returns:
+            dict: the number of true positive 'tp' and false positive 'fp'.
+        """
+        return {'tp': self.tp, 'fp': self.fp}
+
+    def merge_state(self, state):
+        """
+        Merge the states got by :code:`get_state` of another metric.
+
+        Args:
+            state(dict): the states to merge.
+        """
+        self.tp += int(state['tp'])
+        self.fp += int(state['fp'])
 
     def eval(self):
         """
@@ -409,17 +481,30 @@ class Recall(MetricBase):
             raise ValueError("The 'preds' must be a numpy ndarray.")
         if not _is_numpy_(labels):
             raise ValueError("The 'labels' must be a numpy ndarray.")
-        sample_num = labels.shape[0]
         preds = np.rint(preds).astype("int32")
+        tp, _, fn = _binary_confusion_counts(preds, labels)
+        self.tp += tp
+        self.fn += fn
+
+    def get_state(self):
+        """
+        Get the states of the metric, which can be summed across workers
+        and merged by :code:`merge_state`.
 
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if label == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fn += 1
+        Returns:
+            dict: the number of true positive 'tp' and false negative 'fn'.
+        """
+        return {'tp': self.tp, 'fn': self.fn}
+
+    def merge_state(self, state):
+        """
+        Merge the states got by :code:`get_state` of another metric.
+
+        Args:
+            state(dict): the states to merge.
+        """
+        self.tp += int(state['tp'])
+        self.fn += int(state['fn'])
 
     def eval(self):
         """
@@ -700,7 +785,7 @@ class Auc(MetricBase):
     """
     The auc metric is for binary classification.
     Refer to https://en.wikipedia.org/wiki/Receiver_operating_characteristic#Area_under_the_curve.
-    Please notice that the auc metric is implemented with python, which may be a little bit slow.
+    Please notice that the auc metric is computed with numpy on CPU.
     If you concern the speed, please use the fluid.layers.auc instead.
 
     The `auc` function creates four local variables, `true_positives`,
@@ -714,8 +799,11 @@ class Auc(MetricBase):
     Args:
         name (str, optional): Metric name. For details, please refer to :ref:`api_guide_Name`. Default is None.
         curve (str): Specifies the name of the curve to be computed, 'ROC' [default] or 'PR' for the Precision-Recall-curve.
+        num_thresholds (int): The number of thresholds to use when discretizing the curve. Default is 4095.
 
-    "NOTE: only implement the ROC curve type via Python now."
+    States of the metric got by :code:`get_state` can be summed across
+    workers and merged by :code:`merge_state`, to compute the auc of all
+    workers.
 
     Examples:
         .. code-block:: python
@@ -745,12 +833,14 @@ class Auc(MetricBase):
 
     def __init__(self, name, curve='ROC', num_thresholds=4095):
         super(Auc, self).__init__(name=name)
+        assert curve in ['ROC', 'PR'], \
+            "curve should be 'ROC' or 'PR', but got {}".format(curve)
         self._curve = curve
         self._num_thresholds = num_thresholds
 
         _num_pred_buckets = num_thresholds + 1
-        self._stat_pos = [0] * _num_pred_buckets
-        self._stat_neg = [0] * _num_pred_buckets
+        self._stat_pos = np.zeros(_num_pred_buckets, dtype='int64')
+        self._stat_neg = np.zeros(_num_pred_buckets, dtype='int64')
 
     def update(self, preds, labels):
         """
@@ -765,14 +855,42 @@ class Auc(MetricBase):
         if not _is_numpy_(preds):
             raise ValueError("The 'predictions' must be a numpy ndarray.")
 
-        for i, lbl in enumerate(labels):
-            value = preds[i, 1]
-            bin_idx = int(value * self._num_thresholds)
-            assert bin_idx <= self._num_thresholds
-            if lbl:
-                self._stat_pos[bin_idx] += 1.0
-            else:
-                self._stat_neg[bin_idx] += 1.0
+        stat_pos, stat_neg = _auc_bucket_stats(preds, labels,
+                                               self._num_thresholds)
+        self._stat_pos += stat_pos
+        self._stat_neg += stat_neg
+
+    def reset(self):
+        """
+        Reset the bucket statistics of the auc curve.
+        """
+        self._stat_pos = np.zeros_like(self._stat_pos)
+        self._stat_neg = np.zeros_like(self._stat_neg)
+
+    def get_state(self):
+        """
+        Get the bucket statistics of positive and negative instances, which
+        can be summed across workers and merged by :code:`merge_state`.
+
+        Returns:
+            dict: numpy arrays 'stat_pos' and 'stat_neg' with
+            shape [num_thresholds + 1].
+        """
+        return {
+            'stat_pos': self._stat_pos.copy(),
+            'stat_neg': self._stat_neg.copy()
+        }
+
+    def merge_state(self, state):
+        """
+        Merge the bucket statistics got by :code:`get_state` of another
+        metric with the same :attr:`num_thresholds`.
+
+        Args:
+            state(dict): the statistics to merge.
+        """
+        self._stat_pos += np.asarray(state['stat_pos']).astype('int64')
+        self._stat_neg += np.asarray(state['stat_neg']).astype('int64')
 
     @staticmethod
     def trapezoid_area(x1, x2, y1, y2):
@@ -785,21 +903,8 @@ class Auc(MetricBase):
         Return:
             float: the area under auc curve
         """
-        tot_pos = 0.0
-        tot_neg = 0.0
-        auc = 0.0
-
-        idx = self._num_thresholds
-        while idx >= 0:
-            tot_pos_prev = tot_pos
-            tot_neg_prev = tot_neg
-            tot_pos += self._stat_pos[idx]
-            tot_neg += self._stat_neg[idx]
-            auc += self.trapezoid_area(tot_neg, tot_neg_prev, tot_pos,
-                                       tot_pos_prev)
-            idx -= 1
-
-        return auc / tot_pos / tot_neg if tot_pos > 0.0 and tot_neg > 0.0 else 0.0
+        return _auc_from_bucket_stats(self._stat_pos, self._stat_neg,
+                                      self._curve)
 
 
 class DetectionMAP(object):
@@ -23,7 +23,7 @@ from .executor import global_scope
 from .data_feeder import DataFeeder, BatchedTensorProvider
 from .multiprocess_utils import multiprocess_queue_set, CleanupFuncRegistrar, _cleanup_mmap, _cleanup, _set_SIGCHLD_handler
 from .dataloader import BatchSampler, Dataset, IterableDataset
-from .dataloader.dataloader_iter import _DataLoaderIterSingleProcess, _DataLoaderIterMultiProcess, _DatasetKind, default_collate_fn
+from .dataloader.dataloader_iter import _DataLoaderIterSingleProcess, _DataLoaderIterMultiProcess, _DatasetKind, _DataLoaderStats, default_collate_fn
 from .dataloader.batch_sampler import _InfiniteIterableSampler
 from .layers.io import monkey_patch_reader_methods, _copy_reader_var_, double_buffer
 from .unique_name import UniqueNameGenerator
@@ -213,6 +213,20 @@ class DataLoader(object):
         worker_init_fn(callable): init function which will be called with
             worker id on each subproces starting if not set as None. Default
             None.
+        persistent_workers(bool): whether to keep worker subprocesses alive
+            after an epoch finished, if set True, workers and their queues
+            will be reused by later epochs instead of being restarted on
+            each :code:`iter(loader)`, which saves subprocess starting,
+            dataset pickling and :attr:`worker_init_fn` calling on each
+            epoch. Only works in multi-process mode(num_workers > 0).
+            Default False.
+        adaptive_prefetch(bool): whether to adjust the number of outstanding
+            batches in multi-process mode automatically, if set True, more
+            batch indices will be put to workers when the trainer is waiting
+            for data, and less when loaded data is piled up. Default False.
+        prefetch_memory_limit(int|None): the maximum bytes of outstanding
+            batches in adaptive prefetch mode, estimated by the average
+            batch size in bytes, None for no limit. Default None.
 
     Returns:
         DataLoader: an iterable object for data iterating, each elemnet of the generated data is a Tensor.
@@ -344,7 +358,10 @@ class DataLoader(object):
                  use_buffer_reader=True,
                  use_shared_memory=True,
                  timeout=0,
-                 worker_init_fn=None):
+                 worker_init_fn=None,
+                 persistent_workers=False,
+                 adaptive_prefetch=False,
+                 prefetch_memory_limit=None):
         self.return_list = return_list
         self.collate_fn = collate_fn
         self.use_buffer_reader = use_buffer_reader
@@ -372,6 +389,15 @@ class DataLoader(object):
             num_workers = 0
         self.num_workers = num_workers
 
+        self.persistent_workers = persistent_workers and num_workers > 0
+        self._iterator = None
+
+        self.adaptive_prefetch = adaptive_prefetch and num_workers > 0
+        assert prefetch_memory_limit is None or prefetch_memory_limit > 0, \
+                "prefetch_memory_limit should be None or a positive value"
+        self.prefetch_memory_limit = prefetch_memory_limit
+        self._stats = _DataLoaderStats()
+
         self.use_shared_memory = use_shared_memory
         if use_shared_memory and num_workers == 0:
             self.use_shared_memory = False
@@ -424,12 +450,69 @@ class DataLoader(object):
     def __iter__(self):
         if self.num_workers == 0:
             return _DataLoaderIterSingleProcess(self)
+        elif self.persistent_workers:
+            if self._iterator is None or self._iterator._shutdown:
+                self._iterator = _DataLoaderIterMultiProcess(self)
+            else:
+                self._iterator._reset()
+            return self._iterator
         else:
             return _DataLoaderIterMultiProcess(self)
 
     def __call__(self):
         return self.__iter__()
 
+    def stats(self):
+        """
+        Get time cost statistics of each data loading stage accumulated
+        since DataLoader created or :code:`reset_stats` called.
+
+        Returns:
+            dict: a dict contains following keys:
+
+            :attr:`read`, :attr:`wait`, :attr:`fetch`, :attr:`collate`:
+            time cost of the trainer waiting for data, reader thread waiting
+            for workers, workers reading samples from dataset and collating
+            samples into batch, each as a dict with keys :attr:`count`,
+            :attr:`total`, :attr:`avg` and :attr:`max` in seconds.
+
+            :attr:`batch_bytes`: average bytes of a batch from workers.
+
+            :attr:`outstanding_capacity`: current number of outstanding
+            batches in multi-process mode.
+
+        Examples:
+
+            .. code-block:: python
+
+                import numpy as np
+                import paddle
+                from paddle.io import Dataset, DataLoader
+
+                class RandomDataset(Dataset):
+                    def __getitem__(self, idx):
+                        return np.random.random([784]).astype('float32')
+
+                    def __len__(self):
+                        return 100
+
+                paddle.disable_static()
+                loader = DataLoader(RandomDataset(), batch_size=10,
+                                    return_list=True)
+                for data in loader:
+                    pass
+                print(loader.stats()['read']['avg'])
+        """
+        return self._stats.summary()
+
+    def reset_stats(self):
+        """
+        Reset time cost statistics, see :code:`stats`.
+        """
+        outstanding_capacity = self._stats.outstanding_capacity
+        self._stats.reset()
+        self._stats.outstanding_capacity = outstanding_capacity
+
     @staticmethod
     def from_generator(feed_list=None,
                        capacity=None,
@@ -23,6 +23,7 @@ import paddle.fluid as fluid
 from paddle.fluid.dygraph.jit import declarative
 from paddle.fluid.dygraph.dygraph_to_static import ProgramTranslator
 from paddle.fluid.dygraph.dygraph_to_static import convert_to_static
+from paddle.fluid.dygraph.dygraph_to_static.program_translator import LRUCache
 
 from test_fetch_feed import Pool2D, Linear
 
@@ -154,5 +155,67 @@ class TestToOutputWithCache(unittest.TestCase):
             self.assertEqual(ret.numpy(), 5050)
 
 
+def mean_func(x):
+    return fluid.layers.mean(x)
+
+
+class TestBoundedProgramCache(unittest.TestCase):
+    def run_with_shapes(self, static_func, shapes):
+        with fluid.dygraph.guard(fluid.CPUPlace()):
+            for shape in shapes:
+                x = np.random.random(shape).astype('float32')
+                out = static_func(fluid.dygraph.to_variable(x))
+                self.assertTrue(np.allclose(out.numpy(), np.mean(x)))
+
+    def test_lru(self):
+        static_func = declarative(mean_func, cache_capacity=2)
+        self.run_with_shapes(static_func,
+                             [[2, 3], [3, 3], [2, 3], [4, 3], [3, 3]])
+        stats = static_func.get_cache_stats()
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 4)
+        self.assertEqual(stats['evictions'], 2)
+        self.assertTrue(stats['trace_time'] > 0)
+        self.assertEqual(static_func.get_traced_count(), 2)
+
+    def test_batch_bucketing(self):
+        static_func = declarative(mean_func, shape_bucketing='batch')
+        self.run_with_shapes(static_func, [[2, 3], [5, 3], [7, 3], [7, 4]])
+        stats = static_func.get_cache_stats()
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(static_func.inputs[0].shape, (-1, 4))
+
+    def test_all_bucketing(self):
+        static_func = declarative(mean_func, shape_bucketing='all')
+        self.run_with_shapes(static_func, [[2, 3], [5, 4], [7, 1]])
+        self.assertEqual(static_func.get_traced_count(), 1)
+
+    def test_invalid_args(self):
+        with self.assertRaises(ValueError):
+            declarative(mean_func, shape_bucketing='unknown')
+        with self.assertRaises(ValueError):
+            declarative(mean_func, cache_capacity=0)
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_lru(self):
+        cache = LRUCache(2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        self.assertTrue('b' not in cache)
+        self.assertEqual(cache.get('b'), None)
+        self.assertEqual(cache.stats(), {
+            'size': 2,
+            'capacity': 2,
+            'hits': 1,
+            'misses': 1,
+            'evictions': 1
+        })
+
+
 if __name__ == '__main__':
     unittest.main()
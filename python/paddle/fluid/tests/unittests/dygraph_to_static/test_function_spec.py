@@ -14,7 +14,7 @@
 
 import paddle
 from paddle.static import InputSpec
-from paddle.fluid.dygraph.dygraph_to_static.function_spec import FunctionSpec
+from paddle.fluid.dygraph.dygraph_to_static.function_spec import FunctionSpec, bucket_input_spec
 
 from test_declarative import foo_func
 
@@ -112,5 +112,20 @@ class TestFunctionSpec(unittest.TestCase):
             input_with_spec = foo_spec.args_to_input_spec((a_tensor, ), {})
 
 
+    def test_bucket_input_spec(self):
+        # InputSpec can not be created with 0-d shape directly
+        scalar_spec = InputSpec([1], name='y')
+        scalar_spec.shape = ()
+        specs = [InputSpec([4, 10], name='x'), scalar_spec, 1]
+        bucketed = bucket_input_spec(specs, 'batch')
+        self.assertTupleEqual(bucketed[0].shape, (-1, 10))
+        self.assertTupleEqual(bucketed[1].shape, ())
+        self.assertEqual(bucketed[2], 1)
+
+        bucketed = bucket_input_spec(specs, 'all')
+        self.assertTupleEqual(bucketed[0].shape, (-1, -1))
+        self.assertTupleEqual(bucketed[1].shape, ())
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,197 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import importlib
+import numpy as np
+
+import paddle.fluid as fluid
+from paddle.fluid.dygraph.jit import declarative
+from paddle.fluid.dygraph.dygraph_to_static import ProgramTranslator
+from paddle.fluid.dygraph.dygraph_to_static.persistent_cache import get_persistent_cache
+
+from test_fetch_feed import Linear
+
+MODULE_CODE = """
+import paddle.fluid as fluid
+
+
+def helper(x):
+    return x + {}
+
+
+def foo(x):
+    x = fluid.dygraph.to_variable(x)
+    return helper(x)
+"""
+
+CONFIG_MODULE_CODE = """
+SCALE = {}
+"""
+
+CONFIG_USER_MODULE_CODE = """
+import paddle.fluid as fluid
+from cached_config import SCALE
+
+
+def foo(x):
+    x = fluid.dygraph.to_variable(x)
+    return x * SCALE
+"""
+
+
+class ConfigLayer(fluid.dygraph.Layer):
+    def __init__(self, config, act=None):
+        super(ConfigLayer, self).__init__()
+        self.config = config
+        self.act = act
+
+    @declarative
+    def forward(self, x):
+        x = fluid.dygraph.to_variable(x)
+        if self.act is not None:
+            x = self.act(x)
+        return x * self.config['scale']
+
+
+class TestPersistentCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.program_translator = ProgramTranslator()
+        self.program_translator.set_cache_dir(self.cache_dir)
+        self.data = np.random.random((4, 10)).astype('float32')
+
+    def tearDown(self):
+        self.program_translator.set_cache_dir(None)
+        shutil.rmtree(self.cache_dir)
+
+    def run_linear(self):
+        with fluid.dygraph.guard(fluid.CPUPlace()):
+            # same parameter names as a new process
+            with fluid.unique_name.guard():
+                net = Linear()
+            pre, loss = net(fluid.dygraph.to_variable(self.data))
+            return pre.numpy(), loss.numpy()
+
+    def test_reload_program(self):
+        cache = get_persistent_cache()
+        pre, loss = self.run_linear()
+        self.assertEqual(cache.hits, 0)
+        program_dir = os.path.join(self.cache_dir, 'program')
+        self.assertEqual(len(os.listdir(program_dir)), 1)
+
+        reloaded_pre, reloaded_loss = self.run_linear()
+        self.assertEqual(cache.hits, 1)
+        self.assertTrue(np.allclose(pre, reloaded_pre))
+        self.assertTrue(np.allclose(loss, reloaded_loss))
+
+    def test_train_reloaded_program(self):
+        def train():
+            with fluid.dygraph.guard(fluid.CPUPlace()):
+                with fluid.unique_name.guard():
+                    net = Linear()
+                sgd = fluid.optimizer.SGD(learning_rate=0.1,
+                                          parameter_list=net.parameters())
+                for _ in range(2):
+                    _, loss = net(fluid.dygraph.to_variable(self.data))
+                    loss.backward()
+                    sgd.minimize(loss)
+                    net.clear_gradients()
+                return [param.numpy() for param in net.parameters()]
+
+        params = train()
+        reloaded_params = train()
+        self.assertEqual(get_persistent_cache().hits, 1)
+        for param, reloaded_param in zip(params, reloaded_params):
+            self.assertTrue(np.allclose(param, reloaded_param))
+
+    def test_source_changed(self):
+        module_dir = tempfile.mkdtemp()
+        sys.path.insert(0, module_dir)
+        try:
+            outs = []
+            for value in ['1', '10']:
+                with open(os.path.join(module_dir, 'cached_module.py'),
+                          'w') as f:
+                    f.write(MODULE_CODE.format(value))
+                sys.modules.pop('cached_module', None)
+                module = importlib.import_module('cached_module')
+                with fluid.dygraph.guard(fluid.CPUPlace()):
+                    outs.append(declarative(module.foo)(self.data).numpy())
+            self.assertEqual(get_persistent_cache().hits, 0)
+            self.assertTrue(np.allclose(outs[0], self.data + 1))
+            self.assertTrue(np.allclose(outs[1], self.data + 10))
+        finally:
+            sys.path.remove(module_dir)
+            sys.modules.pop('cached_module', None)
+            shutil.rmtree(module_dir)
+
+    def run_config_layer(self, config, act=None):
+        with fluid.dygraph.guard(fluid.CPUPlace()):
+            return ConfigLayer(config, act)(self.data).numpy()
+
+    def test_layer_attribute_changed(self):
+        cache = get_persistent_cache()
+        for scale in [2.0, 3.0]:
+            out = self.run_config_layer({'scale': scale})
+            self.assertTrue(np.allclose(out, self.data * scale))
+        self.assertEqual(cache.hits, 0)
+        out = self.run_config_layer({'scale': 3.0})
+        self.assertTrue(np.allclose(out, self.data * 3.0))
+        self.assertEqual(cache.hits, 1)
+
+    def test_uncacheable_layer_attribute(self):
+        for _ in range(2):
+            out = self.run_config_layer({'scale': 2.0}, lambda x: x + 1)
+            self.assertTrue(np.allclose(out, (self.data + 1) * 2.0))
+        # a lambda can't be keyed, the program is traced every time
+        program_dir = os.path.join(self.cache_dir, 'program')
+        self.assertFalse(
+            os.path.isdir(program_dir) and os.listdir(program_dir))
+        self.assertEqual(get_persistent_cache().hits, 0)
+
+    def test_imported_constant_changed(self):
+        module_dir = tempfile.mkdtemp()
+        sys.path.insert(0, module_dir)
+        try:
+            with open(os.path.join(module_dir, 'cached_user.py'), 'w') as f:
+                f.write(CONFIG_USER_MODULE_CODE)
+            outs = []
+            for value in ['2', '3']:
+                with open(os.path.join(module_dir, 'cached_config.py'),
+                          'w') as f:
+                    f.write(CONFIG_MODULE_CODE.format(value))
+                sys.modules.pop('cached_config', None)
+                sys.modules.pop('cached_user', None)
+                module = importlib.import_module('cached_user')
+                with fluid.dygraph.guard(fluid.CPUPlace()):
+                    outs.append(declarative(module.foo)(self.data).numpy())
+            self.assertEqual(get_persistent_cache().hits, 0)
+            self.assertTrue(np.allclose(outs[0], self.data * 2))
+            self.assertTrue(np.allclose(outs[1], self.data * 3))
+        finally:
+            sys.path.remove(module_dir)
+            for name in ['cached_config', 'cached_user']:
+                sys.modules.pop(name, None)
+            shutil.rmtree(module_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
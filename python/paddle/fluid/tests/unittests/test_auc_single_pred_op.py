@@ -53,9 +53,9 @@ class TestAucSinglePredOp(OpTest):
             pred[i][1] = pred[i][0]
         python_auc.update(pred, labels)
 
-        pos = python_auc._stat_pos * 2
+        pos = python_auc._stat_pos.tolist() * 2
         pos.append(1)
-        neg = python_auc._stat_neg * 2
+        neg = python_auc._stat_neg.tolist() * 2
         neg.append(1)
         self.outputs = {
             'AUC': np.array(python_auc.eval()),
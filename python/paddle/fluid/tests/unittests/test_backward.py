@@ -327,6 +327,52 @@ class TestAppendBackwardWithError(unittest.TestCase):
                 loss=self.avg_loss, callbacks=callback)
 
 
+class TestRepetitiveOutputs(unittest.TestCase):
+    def check_repetitive_grad(self, num_uses, accumulate_op):
+        """
+        The gradient of x used `num_uses` times is renamed and accumulated
+        by `accumulate_op` in _addup_repetitive_outputs_.
+        """
+        flag = 'FLAGS_max_inplace_grad_add'
+        old_flags = fluid.get_flags([flag])
+        fluid.set_flags({flag: 4})
+        try:
+            main_program = fluid.Program()
+            startup_program = fluid.Program()
+            with fluid.program_guard(main_program, startup_program):
+                x = fluid.data(name='x', shape=[2, 3], dtype='float32')
+                x.stop_gradient = False
+                outs = [
+                    fluid.layers.scale(
+                        x, scale=float(i)) for i in range(num_uses)
+                ]
+                loss = fluid.layers.reduce_sum(fluid.layers.sums(outs))
+                num_forward_ops = len(main_program.global_block().ops)
+                x_grad = fluid.gradients(loss, x)[0]
+        finally:
+            fluid.set_flags(old_flags)
+
+        backward_ops = main_program.global_block().ops[num_forward_ops:]
+        self.assertTrue(accumulate_op in [op.type for op in backward_ops])
+
+        exe = fluid.Executor(fluid.CPUPlace())
+        exe.run(startup_program)
+        x_np = np.random.random([2, 3]).astype('float32')
+        x_grad_np, = exe.run(main_program,
+                             feed={'x': x_np},
+                             fetch_list=[x_grad])
+        expected = np.full([2, 3], sum(range(num_uses)), dtype='float32')
+        self.assertTrue(np.allclose(x_grad_np, expected))
+
+    def test_add_ops(self):
+        # no more than FLAGS_max_inplace_grad_add uses
+        self.check_repetitive_grad(3, 'grad_add')
+
+    def test_sum_op(self):
+        # more than FLAGS_max_inplace_grad_add uses
+        self.check_repetitive_grad(50, 'sum')
+
+
 # TODO(Aurelius84): add conditional network test
 class ConditionalNet(BackwardNet):
     def __init__(self):
@@ -37,5 +37,28 @@ class TestDatasetAbstract(unittest.TestCase):
             pass
 
 
+class RangeIterableDataset(IterableDataset):
+    def __init__(self, num_samples):
+        self.num_samples = num_samples
+
+    def __iter__(self):
+        for i in range(self.num_samples):
+            yield i
+
+
+class TestShuffleDataset(unittest.TestCase):
+    def test_main(self):
+        for mode in ['window', 'block', 'global']:
+            for buf_size in [0, 1, 7, 100, 200]:
+                dataset = ShuffleDataset(
+                    RangeIterableDataset(100), buf_size, mode=mode)
+                samples = list(dataset)
+                self.assertEqual(sorted(samples), list(range(100)))
+
+    def test_error(self):
+        with self.assertRaises(ValueError):
+            ShuffleDataset(RangeIterableDataset(100), 10, mode='unknown')
+
+
 if __name__ == '__main__':
     unittest.main()
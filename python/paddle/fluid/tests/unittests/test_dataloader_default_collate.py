@@ -0,0 +1,83 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import division
+
+import unittest
+import numpy as np
+
+from paddle.fluid.dataloader.collate import default_collate_fn
+
+
+class TestDefaultCollateFn(unittest.TestCase):
+    def setUp(self):
+        self.batch_size = 4
+        self.images = [
+            np.random.random([3, 8, 8]).astype('float32')
+            for _ in range(self.batch_size)
+        ]
+        self.labels = [
+            np.random.randint(0, 9, (1, )).astype('int64')
+            for _ in range(self.batch_size)
+        ]
+
+    def test_single_field(self):
+        out = default_collate_fn(self.images)
+        self.assertEqual(len(out), 1)
+        self.assertTrue(np.array_equal(out[0], np.stack(self.images)))
+
+    def test_list_fields(self):
+        batch = list(zip(self.images, self.labels))
+        image, label = default_collate_fn(batch)
+        self.assertEqual(image.dtype, np.float32)
+        self.assertEqual(label.dtype, np.int64)
+        self.assertTrue(image.flags['C_CONTIGUOUS'])
+        self.assertTrue(np.array_equal(image, np.stack(self.images)))
+        self.assertTrue(np.array_equal(label, np.stack(self.labels)))
+
+    def test_nested_fields(self):
+        batch = [{
+            'label': label,
+            'image': (image, 1.0)
+        } for image, label in zip(self.images, self.labels)]
+        image, scale, label = default_collate_fn(batch)
+        self.assertTrue(np.array_equal(image, np.stack(self.images)))
+        self.assertTrue(np.array_equal(scale, np.ones([self.batch_size])))
+        self.assertTrue(np.array_equal(label, np.stack(self.labels)))
+
+    def test_shape_mismatch(self):
+        batch = list(zip(self.images, self.labels))
+        batch[-1] = (self.images[-1][0], self.labels[-1])
+        with self.assertRaises(ValueError):
+            default_collate_fn(batch)
+
+    def test_dtype_promotion(self):
+        # later samples are not casted to the dtype of the first sample
+        for fields in [[1, 2.7], [np.array('ab'), np.array('abcdef')],
+                       [np.int32(1), np.int64(1 << 40)]]:
+            batch = [(field, ) for field in fields]
+            out, = default_collate_fn(batch)
+            expected = np.stack(fields)
+            self.assertEqual(out.dtype, expected.dtype)
+            self.assertTrue(np.array_equal(out, expected))
+
+    def test_field_number_mismatch(self):
+        batch = list(zip(self.images, self.labels))
+        batch[-1] = (self.images[-1], )
+        with self.assertRaises(RuntimeError):
+            default_collate_fn(batch)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -79,6 +79,126 @@ class TestExecutor(unittest.TestCase):
         print("run time with program cache: %f" % run_time_with_cache)
 
 
+class TestExecutorProgramCache(unittest.TestCase):
+    def build_program(self):
+        main_program = fluid.Program()
+        startup_program = fluid.Program()
+        with fluid.program_guard(main_program, startup_program):
+            a = fluid.data(name='a', shape=[None, 4], dtype='float32')
+            out = fluid.layers.scale(a, scale=2.0)
+        return main_program, out
+
+    def run_program(self, exe, program, fetch_list):
+        a_np = numpy.random.random((2, 4)).astype('float32')
+        return exe.run(program=program,
+                       feed={'a': a_np},
+                       fetch_list=fetch_list,
+                       use_program_cache=True)
+
+    def test_hit_and_miss(self):
+        exe = fluid.Executor(core.CPUPlace())
+        program, out = self.build_program()
+        for _ in range(3):
+            self.run_program(exe, program, [out])
+        stats = exe._cache_stats()['program_cache']
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['size'], 1)
+
+    def test_program_version(self):
+        exe = fluid.Executor(core.CPUPlace())
+        program, out = self.build_program()
+        self.run_program(exe, program, [out])
+        with fluid.program_guard(program):
+            out2 = fluid.layers.scale(out, scale=3.0)
+        res = self.run_program(exe, program, [out2])
+        stats = exe._cache_stats()['program_cache']
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(res[0].shape, (2, 4))
+        # the version of ProgramDesc is still available
+        self.assertTrue(
+            core._is_program_version_supported(program._version()))
+
+    def test_program_version_changed_in_cpp(self):
+        exe = fluid.Executor(core.CPUPlace())
+        program, out = self.build_program()
+        self.run_program(exe, program, [out])
+        # change the scale on the c++ end, then sync
+        block = program.global_block()
+        op_desc = block.desc._insert_op(1)
+        op_desc.copy_from(block.ops[0].desc)
+        block._sync_with_cpp()
+        self.run_program(exe, program, [out])
+        stats = exe._cache_stats()['program_cache']
+        self.assertEqual(stats['misses'], 2)
+
+    def test_eviction(self):
+        exe = fluid.Executor(core.CPUPlace())
+        exe.program_caches = fluid.executor._ProgramCache(capacity=2)
+        programs = [self.build_program() for _ in range(3)]
+        for program, out in programs:
+            self.run_program(exe, program, [out])
+        stats = exe._cache_stats()['program_cache']
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(stats['evictions'], 1)
+
+        # the first program is evicted
+        self.run_program(exe, programs[0][0], [programs[0][1]])
+        self.assertEqual(exe._cache_stats()['program_cache']['misses'], 4)
+
+    def test_released_program(self):
+        exe = fluid.Executor(core.CPUPlace())
+        program, out = self.build_program()
+        self.run_program(exe, program, [out.name])
+        self.assertEqual(len(exe.program_caches), 1)
+        del program, out
+        import gc
+        gc.collect()
+        program, out = self.build_program()
+        self.run_program(exe, program, [out.name])
+        self.assertEqual(len(exe.program_caches), 1)
+
+
+class TestExecutorCompiledFeed(unittest.TestCase):
+    def test_feed_reuse_and_check(self):
+        main_program = fluid.Program()
+        startup_program = fluid.Program()
+        with fluid.program_guard(main_program, startup_program):
+            a = fluid.data(name='a', shape=[None, 4], dtype='float32')
+            out = fluid.layers.scale(a, scale=2.0)
+
+        exe = fluid.Executor(core.CPUPlace())
+        for batch_size in [2, 2, 3, 2]:
+            a_np = numpy.random.random((batch_size, 4)).astype('float32')
+            res, = exe.run(main_program,
+                           feed={'a': a_np},
+                           fetch_list=[out],
+                           use_program_cache=True)
+            self.assertTrue(numpy.allclose(res, a_np * 2.0))
+
+        # wrong dtype and shape are still checked for new signatures
+        with self.assertRaises(ValueError):
+            exe.run(main_program,
+                    feed={'a': numpy.ones((2, 4)).astype('float64')},
+                    fetch_list=[out],
+                    use_program_cache=True)
+        with self.assertRaises(ValueError):
+            exe.run(main_program,
+                    feed={'a': numpy.ones((2, 5)).astype('float32')},
+                    fetch_list=[out],
+                    use_program_cache=True)
+
+        # LoDTensor feed
+        a_np = numpy.random.random((2, 4)).astype('float32')
+        a_tensor = fluid.core.LoDTensor()
+        a_tensor.set(a_np, core.CPUPlace())
+        res, = exe.run(main_program,
+                       feed={'a': a_tensor},
+                       fetch_list=[out],
+                       use_program_cache=True)
+        self.assertTrue(numpy.allclose(res, a_np * 2.0))
+
+
 class ExecutorPaddingRNNTest(PaddingRNNTestBase):
     def train_and_save_inference_program(self,
                                          rnn_model="static",
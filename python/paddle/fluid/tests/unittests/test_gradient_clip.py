@@ -373,6 +373,69 @@ class TestDygraphGradientClipByGlobalNorm(TestDygraphGradientClip):
             % (a, b))
 
 
+class TestDygraphGradientClipByGlobalNormInplace(unittest.TestCase):
+    def setUp(self):
+        self.clip_norm = 0.8
+        np.random.seed(2020)
+        self.shapes = [[5, 5], [5], [3, 4]]
+
+    def build_params_grads(self, grads_np):
+        params_grads = []
+        for i, grad_np in enumerate(grads_np):
+            p = fluid.dygraph.to_variable(
+                np.zeros_like(grad_np), name="p%d" % i)
+            g = fluid.dygraph.to_variable(grad_np, name="g%d" % i)
+            params_grads.append((p, g))
+        return params_grads
+
+    def test_clip(self):
+        with fluid.dygraph.guard():
+            clip = fluid.clip.GradientClipByGlobalNorm(
+                clip_norm=self.clip_norm)
+            for step in range(2):
+                grads_np = [
+                    np.random.uniform(-1, 1, shape).astype('float32')
+                    for shape in self.shapes
+                ]
+                global_norm = np.sqrt(
+                    sum([np.sum(np.square(g)) for g in grads_np]))
+                scale = self.clip_norm / max(global_norm, self.clip_norm)
+
+                params_grads = self.build_params_grads(grads_np)
+                clipped = clip(params_grads)
+                self.assertEqual(len(clipped), len(grads_np))
+                for (_, g), grad_np in zip(clipped, grads_np):
+                    self.assertEqual(list(g.shape), list(grad_np.shape))
+                    self.assertTrue(
+                        np.allclose(
+                            g.numpy(), grad_np * scale, rtol=1e-6))
+                self.assertFalse(clip.found_nonfinite)
+                # the alignment padding of the flat buffer is zero
+                flat_grad, = clip._flat_grads.values()
+                self.assertTrue(
+                    np.allclose(
+                        np.sum(np.square(flat_grad.numpy())),
+                        np.square(global_norm * scale),
+                        rtol=1e-5))
+
+    def test_skip_nonfinite(self):
+        with fluid.dygraph.guard():
+            clip = fluid.clip.GradientClipByGlobalNorm(
+                clip_norm=self.clip_norm, skip_nonfinite=True)
+            grads_np = [
+                np.random.uniform(-1, 1, shape).astype('float32')
+                for shape in self.shapes
+            ]
+            grads_np[1][0] = np.inf
+            self.assertEqual(clip(self.build_params_grads(grads_np)), [])
+            self.assertTrue(clip.found_nonfinite)
+
+            grads_np[1][0] = 0.0
+            self.assertEqual(
+                len(clip(self.build_params_grads(grads_np))), len(grads_np))
+            self.assertFalse(clip.found_nonfinite)
+
+
 class TestDygraphGradientClipByNorm(TestDygraphGradientClip):
     def setUp(self):
         self.clip_norm = 0.8
@@ -0,0 +1,150 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import unittest
+import numpy as np
+
+import paddle
+import paddle.nn as nn
+
+
+class MLP(nn.Layer):
+    def __init__(self):
+        super(MLP, self).__init__()
+        self._linear1 = nn.Linear(13, 8)
+        self._linear2 = nn.Linear(8, 5)
+        self._linear3 = nn.Linear(5, 1)
+
+    def forward(self, x):
+        return self._linear3(self._linear2(self._linear1(x)))
+
+
+class TestMultiTensorOptimizer(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        np.random.seed(2020)
+        self.inputs = [
+            np.random.random([4, 13]).astype('float32') for _ in range(3)
+        ]
+
+    def tearDown(self):
+        paddle.enable_static()
+
+    def train(self, opt_cls, use_multi_tensor, **kwargs):
+        paddle.manual_seed(2020)
+        model = MLP()
+        opt = opt_cls(
+            parameters=model.parameters(),
+            use_multi_tensor=use_multi_tensor,
+            **kwargs)
+        for data in self.inputs:
+            loss = paddle.mean(model(paddle.to_tensor(data)))
+            loss.backward()
+            opt.step()
+            opt.clear_grad()
+        params = [param.numpy() for param in model.parameters()]
+        state = dict((key, value.numpy())
+                     for key, value in opt.state_dict().items())
+        return params, state
+
+    def check_optimizer(self, opt_cls, **kwargs):
+        params, state = self.train(opt_cls, False, **kwargs)
+        fused_params, fused_state = self.train(opt_cls, True, **kwargs)
+        for param, fused_param in zip(params, fused_params):
+            self.assertTrue(np.allclose(param, fused_param, atol=1e-6))
+        self.assertEqual(sorted(state.keys()), sorted(fused_state.keys()))
+        for key in state:
+            self.assertTrue(
+                np.allclose(
+                    state[key], fused_state[key], atol=1e-6))
+
+    def test_sgd(self):
+        self.check_optimizer(paddle.optimizer.SGD, learning_rate=0.1)
+
+    def test_momentum(self):
+        self.check_optimizer(
+            paddle.optimizer.Momentum, learning_rate=0.1, use_nesterov=True)
+
+    def test_adam(self):
+        self.check_optimizer(paddle.optimizer.Adam, learning_rate=0.01)
+
+    def test_adamw(self):
+        self.check_optimizer(
+            paddle.optimizer.AdamW, learning_rate=0.01, weight_decay=0.01)
+
+    def test_zero_padding(self):
+        # the alignment padding of the flat buffers stays zero
+        model = MLP()
+        opt = paddle.optimizer.Adam(
+            learning_rate=0.01,
+            parameters=model.parameters(),
+            use_multi_tensor=True)
+        for data in self.inputs:
+            loss = paddle.mean(model(paddle.to_tensor(data)))
+            loss.backward()
+            opt.step()
+            opt.clear_grad()
+        group, = list(opt._multi_tensor_groups.values())[0]
+        flat_param = group._buffers['param'].numpy()
+        self.assertTrue(np.all(np.isfinite(flat_param)))
+        self.assertTrue(
+            np.allclose(
+                np.sum(np.square(flat_param)),
+                sum(np.sum(np.square(p.numpy())) for p in model.parameters()),
+                rtol=1e-5))
+        for buffer in group._buffers.values():
+            self.assertTrue(np.all(np.isfinite(buffer.numpy())))
+
+    def test_tensor_param_lr(self):
+        # parameters with a tensor learning rate are updated one by one
+        model = MLP()
+        opt = paddle.optimizer.SGD(learning_rate=0.1,
+                                   parameters=model.parameters(),
+                                   use_multi_tensor=True)
+        weight = model._linear1.weight
+        weight.optimize_attr['learning_rate'] = paddle.to_tensor([1.0])
+        loss = paddle.mean(model(paddle.to_tensor(self.inputs[0])))
+        loss.backward()
+        params_grads = [(param, param._grad_ivar())
+                        for param in model.parameters()]
+        group, = opt._get_multi_tensor_groups(params_grads)
+        self.assertEqual(len(group.params), len(params_grads) - 1)
+        self.assertNotIn(weight.name, [param.name for param in group.params])
+
+    def test_set_value(self):
+        # a parameter replaced by set_value is not a view of the flat
+        # buffer anymore, and is copied into the buffer at the next step
+        paddle.manual_seed(2020)
+        model = MLP()
+        opt = paddle.optimizer.SGD(learning_rate=0.0,
+                                   parameters=model.parameters(),
+                                   use_multi_tensor=True)
+        for data in self.inputs:
+            loss = paddle.mean(model(paddle.to_tensor(data)))
+            loss.backward()
+            opt.step()
+            opt.clear_grad()
+            value = np.random.random([13, 8]).astype('float32')
+            model._linear1.weight.set_value(value)
+
+        loss = paddle.mean(model(paddle.to_tensor(self.inputs[0])))
+        loss.backward()
+        opt.step()
+        self.assertTrue(np.array_equal(model._linear1.weight.numpy(), value))
+
+
+if __name__ == '__main__':
+    unittest.main()
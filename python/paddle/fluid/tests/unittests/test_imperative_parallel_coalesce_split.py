@@ -23,6 +23,7 @@ from paddle.fluid import core
 from paddle.fluid.dygraph.parallel import DataParallel
 from paddle.fluid.dygraph.base import to_variable
 from paddle.fluid.dygraph.parallel import _coalesce_tensors, _split_tensors, _reshape_inplace
+from paddle.fluid.dygraph.parallel import _GradBucket, _build_grad_buckets, _grad_alignment
 
 
 class MyLayer(fluid.Layer):
@@ -78,6 +79,56 @@ class TestImperativeParallelCoalesceSplit(unittest.TestCase):
             _reshape_inplace(x, new_shape)
             self.assertEqual(x.shape, new_shape)
 
+    def test_build_grad_buckets(self):
+        with fluid.dygraph.guard():
+            shapes = [[2, 3], [4, 9], [10, 1], [3, 3]]
+            dtypes = ["float32", "float32", "float64", "float64"]
+            params_and_grads = []
+            for shape, dtype in zip(shapes, dtypes):
+                param = to_variable(np.zeros(shape).astype(dtype))
+                grad = to_variable(np.random.random(shape).astype(dtype))
+                params_and_grads.append((param, grad))
+
+            # a new bucket on dtype change or when the size limit is exceeded,
+            # the aligned sizes are 64, 192, 128 and 128 bytes
+            buckets = _build_grad_buckets(params_and_grads, 100, alignment=64)
+            self.assertEqual([len(b.param_names) for b in buckets],
+                             [1, 1, 1, 1])
+            buckets = _build_grad_buckets(params_and_grads, 256, alignment=64)
+            self.assertEqual([len(b.param_names) for b in buckets], [2, 2])
+            self.assertEqual([b.numel for b in buckets], [42, 19])
+
+            # the alignment padding of the place is counted by default
+            alignment = _grad_alignment()
+            buckets = _build_grad_buckets(params_and_grads, alignment)
+            self.assertEqual([len(b.param_names) for b in buckets],
+                             [1, 1, 1, 1])
+
+    def test_grad_bucket_coalesce(self):
+        with fluid.dygraph.guard():
+            vars = []
+            vars.append(to_variable(np.random.random([2, 3]).astype("float32")))
+            vars.append(to_variable(np.random.random([4, 9]).astype("float32")))
+            origs = [var.numpy() for var in vars]
+
+            bucket = _GradBucket(vars[0].dtype)
+            buffer = bucket.coalesce(vars)
+            self.assertEqual(vars[0].shape, [2, 3])
+            self.assertEqual(vars[1].shape, [4, 9])
+            # each gradient is at an aligned offset of the flat buffer
+            offset = _grad_alignment() // 4
+            flat = buffer.numpy()
+            for var, orig, start in zip(vars, origs, [0, offset]):
+                self.assertTrue(np.array_equal(var.numpy(), orig))
+                self.assertTrue(
+                    np.array_equal(flat[start:start + orig.size],
+                                   orig.flatten()))
+
+            # the flat buffer is kept across steps
+            self.assertTrue(bucket.coalesce(vars) is buffer)
+            for var, orig in zip(vars, origs):
+                self.assertTrue(np.array_equal(var.numpy(), orig))
+
 
 if __name__ == '__main__':
     unittest.main()
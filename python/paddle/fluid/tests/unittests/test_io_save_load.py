@@ -14,7 +14,10 @@
 
 from __future__ import print_function
 
+import os
+import shutil
 import unittest
+import numpy as np
 import paddle.fluid as fluid
 from paddle.fluid import core
 
@@ -69,5 +72,76 @@ class TestSaveInferenceModelAPIError(unittest.TestCase):
                 main_program=main_prog)
 
 
+class TestParallelSaveLoadVars(unittest.TestCase):
+    def setUp(self):
+        self.model_path = "./parallel_save_load_model"
+
+    def tearDown(self):
+        if os.path.exists(self.model_path):
+            shutil.rmtree(self.model_path)
+
+    def build_program(self):
+        start_prog = fluid.Program()
+        main_prog = fluid.Program()
+        with fluid.program_guard(main_prog, start_prog):
+            x = fluid.data(name='x', shape=[10, 16], dtype='float32')
+            y = fluid.layers.fc(x, 8)
+            z = fluid.layers.fc(y, 4)
+        return start_prog, main_prog
+
+    def get_persistables(self, main_prog):
+        scope = fluid.global_scope()
+        return dict((var.name, np.array(scope.find_var(var.name).get_tensor()))
+                    for var in main_prog.list_vars()
+                    if fluid.io.is_persistable(var))
+
+    def reset_persistables(self, main_prog):
+        place = fluid.CPUPlace()
+        scope = fluid.global_scope()
+        for name, value in self.get_persistables(main_prog).items():
+            scope.find_var(name).get_tensor().set(
+                np.zeros_like(value), place)
+
+    def check_save_load(self, save_threads, load_threads):
+        start_prog, main_prog = self.build_program()
+        exe = fluid.Executor(fluid.CPUPlace())
+        exe.run(start_prog)
+        orig = self.get_persistables(main_prog)
+
+        fluid.io.save_persistables(
+            exe, self.model_path, main_prog, num_threads=save_threads)
+        self.reset_persistables(main_prog)
+        fluid.io.load_persistables(
+            exe, self.model_path, main_prog, num_threads=load_threads)
+
+        loaded = self.get_persistables(main_prog)
+        for name, value in orig.items():
+            self.assertTrue(np.array_equal(value, loaded[name]))
+
+    def test_parallel_save_load(self):
+        self.check_save_load(4, 4)
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(self.model_path, fluid.io._MANIFEST_FILENAME)))
+
+    def test_parallel_save_op_load(self):
+        # files saved in parallel can be loaded by load op
+        self.check_save_load(4, 1)
+
+    def test_op_save_parallel_load(self):
+        self.check_save_load(1, 4)
+
+    def test_load_var_not_in_manifest(self):
+        start_prog, main_prog = self.build_program()
+        exe = fluid.Executor(fluid.CPUPlace())
+        exe.run(start_prog)
+        fluid.io.save_persistables(
+            exe, self.model_path, main_prog, num_threads=2)
+        fluid.io._write_manifest(self.model_path, {'vars': {}})
+        with self.assertRaises(RuntimeError):
+            fluid.io.load_persistables(
+                exe, self.model_path, main_prog, num_threads=2)
+
+
 if __name__ == '__main__':
     unittest.main()
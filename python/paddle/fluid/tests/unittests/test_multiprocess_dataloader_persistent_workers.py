@@ -0,0 +1,107 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import division
+
+import unittest
+import numpy as np
+
+import paddle.fluid as fluid
+from paddle.io import Dataset, IterableDataset, DataLoader
+
+EPOCH_NUM = 3
+BATCH_SIZE = 4
+SAMPLE_NUM = 40
+IMAGE_SIZE = 16
+
+
+class RandomDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __getitem__(self, idx):
+        np.random.seed(idx)
+        image = np.random.random([IMAGE_SIZE]).astype('float32')
+        label = np.array([idx]).astype('int64')
+        return image, label
+
+    def __len__(self):
+        return self.sample_num
+
+
+class RandomIterableDataset(IterableDataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __iter__(self):
+        for i in range(self.sample_num):
+            np.random.seed(i)
+            image = np.random.random([IMAGE_SIZE]).astype('float32')
+            label = np.array([i]).astype('int64')
+            yield image, label
+
+
+class TestPersistentWorkers(unittest.TestCase):
+    def create_loader(self, dataset, num_workers):
+        return DataLoader(
+            dataset,
+            places=fluid.CPUPlace(),
+            num_workers=num_workers,
+            batch_size=BATCH_SIZE,
+            return_list=True,
+            persistent_workers=True)
+
+    def run_epoch(self, loader):
+        labels = []
+        for image, label in loader:
+            labels.extend(label.numpy().flatten().tolist())
+        return labels
+
+    def test_map_dataset(self):
+        with fluid.dygraph.guard(fluid.CPUPlace()):
+            loader = self.create_loader(RandomDataset(SAMPLE_NUM), 2)
+            pids = None
+            for _ in range(EPOCH_NUM):
+                labels = self.run_epoch(loader)
+                self.assertEqual(labels, list(range(SAMPLE_NUM)))
+
+                worker_pids = [w.pid for w in loader._iterator._workers]
+                if pids is not None:
+                    self.assertEqual(pids, worker_pids)
+                pids = worker_pids
+                for w in loader._iterator._workers:
+                    self.assertTrue(w.is_alive())
+
+    def test_break_epoch(self):
+        with fluid.dygraph.guard(fluid.CPUPlace()):
+            loader = self.create_loader(RandomDataset(SAMPLE_NUM), 2)
+            for i, data in enumerate(loader):
+                if i == 2:
+                    break
+
+            labels = self.run_epoch(loader)
+            self.assertEqual(labels, list(range(SAMPLE_NUM)))
+
+    def test_iterable_dataset(self):
+        with fluid.dygraph.guard(fluid.CPUPlace()):
+            loader = self.create_loader(RandomIterableDataset(SAMPLE_NUM), 2)
+            for _ in range(EPOCH_NUM):
+                labels = self.run_epoch(loader)
+                # each worker holds a full copy of IterableDataset
+                self.assertEqual(sorted(labels), sorted(
+                    list(range(SAMPLE_NUM)) * 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
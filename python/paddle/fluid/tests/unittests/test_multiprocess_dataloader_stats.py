@@ -0,0 +1,96 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import division
+
+import time
+import unittest
+import numpy as np
+
+import paddle.fluid as fluid
+from paddle.io import Dataset, DataLoader
+
+BATCH_SIZE = 4
+SAMPLE_NUM = 80
+IMAGE_SIZE = 16
+
+
+class SlowDataset(Dataset):
+    def __init__(self, sample_num, sleep_time=0.):
+        self.sample_num = sample_num
+        self.sleep_time = sleep_time
+
+    def __getitem__(self, idx):
+        if self.sleep_time > 0:
+            time.sleep(self.sleep_time)
+        image = np.random.random([IMAGE_SIZE]).astype('float32')
+        label = np.array([idx]).astype('int64')
+        return image, label
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestDataLoaderStats(unittest.TestCase):
+    def run_main(self, num_workers, adaptive_prefetch=False):
+        with fluid.dygraph.guard(fluid.CPUPlace()):
+            loader = DataLoader(
+                SlowDataset(SAMPLE_NUM, 0.002),
+                places=fluid.CPUPlace(),
+                num_workers=num_workers,
+                batch_size=BATCH_SIZE,
+                return_list=True,
+                adaptive_prefetch=adaptive_prefetch,
+                prefetch_memory_limit=1 << 20)
+            batch_num = 0
+            for data in loader:
+                batch_num += 1
+            self.assertEqual(batch_num, SAMPLE_NUM // BATCH_SIZE)
+            return loader
+
+    def check_stats(self, stats):
+        batch_num = SAMPLE_NUM // BATCH_SIZE
+        for stage in ['read', 'fetch', 'collate']:
+            self.assertEqual(stats[stage]['count'], batch_num)
+            self.assertGreaterEqual(stats[stage]['total'], 0.)
+            self.assertGreaterEqual(stats[stage]['max'],
+                                    stats[stage]['avg'])
+        self.assertGreater(stats['fetch']['total'],
+                           SAMPLE_NUM * 0.002 * 0.5)
+
+    def test_single_process(self):
+        loader = self.run_main(0)
+        self.check_stats(loader.stats())
+
+        loader.reset_stats()
+        self.assertEqual(loader.stats()['read']['count'], 0)
+
+    def test_multi_process(self):
+        loader = self.run_main(2)
+        stats = loader.stats()
+        self.check_stats(stats)
+        self.assertEqual(stats['batch_bytes'], BATCH_SIZE *
+                         (IMAGE_SIZE * 4 + 8))
+
+    def test_adaptive_prefetch(self):
+        loader = self.run_main(2, adaptive_prefetch=True)
+        stats = loader.stats()
+        self.check_stats(stats)
+        # initial outstanding capacity is 2 * num_workers
+        self.assertGreaterEqual(stats['outstanding_capacity'], 4)
+        self.assertLessEqual(stats['outstanding_capacity'], 4 * 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,6 +14,7 @@
 
 from __future__ import print_function
 
+import os
 import unittest
 import numpy as np
 import paddle
@@ -140,6 +141,52 @@ class TestSaveLoad(unittest.TestCase):
         with self.assertRaises(ValueError):
             paddle.load("test_paddle_save_load.linear")
 
+    def test_save_load_binary_format(self):
+        layer, opt = self.build_and_train_model()
+        layer_state_dict = layer.state_dict()
+        opt_state_dict = opt.state_dict()
+
+        for configs in [{
+                'use_binary_format': True
+        }, {
+                'shard_size': 1024
+        }]:
+            layer_save_path = "test_paddle_save_load_binary.linear.pdparams"
+            opt_save_path = "test_paddle_save_load_binary.linear.pdopt"
+            paddle.save(layer_state_dict, layer_save_path, **configs)
+            paddle.save(opt_state_dict, opt_save_path, **configs)
+
+            for use_mmap in [True, False]:
+                load_layer_state_dict = paddle.load(
+                    layer_save_path, use_mmap=use_mmap)
+                load_opt_state_dict = paddle.load(
+                    opt_save_path, use_mmap=use_mmap)
+                self.check_load_state_dict(layer_state_dict,
+                                           load_layer_state_dict)
+                self.check_load_state_dict(opt_state_dict,
+                                           load_opt_state_dict)
+
+            load_layer_state_dict = paddle.load(
+                layer_save_path, keep_name_table=True)
+            self.assertTrue(
+                "StructuredToParameterName@@" in load_layer_state_dict)
+
+            new_layer = LinearNet()
+            new_layer.set_state_dict(paddle.load(layer_save_path))
+            new_state_dict = dict((key, value.numpy()) for key, value in
+                                  new_layer.state_dict().items())
+            self.check_load_state_dict(layer_state_dict, new_state_dict)
+
+        # the weight of LinearNet is larger than 1024 bytes
+        self.assertTrue(
+            os.path.exists("test_paddle_save_load_binary.linear.pdparams"
+                           ".shard1"))
+
+        with self.assertRaises(ValueError):
+            paddle.save(layer_state_dict, layer_save_path, shard_size=0)
+        with self.assertRaises(ValueError):
+            paddle.save(layer_state_dict, layer_save_path, unknown=True)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -13,7 +13,9 @@
 # limitations under the License.
 
 from __future__ import print_function
+import gc
 import unittest
+import weakref
 
 from paddle.fluid.framework import Program, default_main_program, program_guard, grad_var_name
 import paddle.fluid.layers as layers
@@ -162,6 +164,89 @@ class TestProgram(unittest.TestCase):
         self.assertRaises(TypeError, program._copy_dist_param_info_from,
                           "program")
 
+    def test_sync_with_cpp(self):
+        program = Program()
+        with program_guard(program):
+            x = layers.data(name='x', shape=[10], dtype='float32')
+            for _ in range(4):
+                x = layers.scale(x, scale=2.0)
+        block = program.global_block()
+        ops = list(block.ops)
+
+        # remove and insert ops in the middle, and append an op on c++ end
+        block.desc._remove_op(1, 3)
+        block.desc._insert_op(1).set_type('relu')
+        block.desc.append_op().set_type('sigmoid')
+        block._sync_with_cpp()
+
+        self.assertEqual([op.type for op in block.ops],
+                         ['scale', 'relu', 'scale', 'sigmoid'])
+        # the unchanged ops keep their python instances
+        self.assertTrue(block.ops[0] is ops[0])
+        self.assertTrue(block.ops[2] is ops[3])
+        for op_idx, op in enumerate(block.ops):
+            self.assertTrue(op.desc is block.desc.op(op_idx))
+
+        # an unchanged block is not synced again
+        generation = block.desc._generation()
+        version = program._mutation_version
+        block._sync_with_cpp()
+        self.assertEqual(block._synced_generation, generation)
+        self.assertEqual(program._mutation_version, version)
+
+        # an op removed on c++ end changes the generation
+        block.desc._remove_op(3, 4)
+        self.assertGreater(block.desc._generation(), generation)
+        block._sync_with_cpp()
+        self.assertEqual([op.type for op in block.ops],
+                         ['scale', 'relu', 'scale'])
+        self.assertGreater(program._mutation_version, version)
+
+    def test_program_clone_lazily(self):
+        program = Program()
+        with program_guard(program, Program()):
+            x = layers.data(name='x', shape=[10], dtype='float32')
+            y = layers.fc(x, size=2, param_attr='fc_w')
+            loss = layers.mean(y)
+
+        for for_test in [False, True]:
+            cloned = program.clone(for_test=for_test)
+            block = cloned.global_block()
+            self.assertTrue(block._lazy_build is not None)
+
+            # the origin program changed after clone
+            with program_guard(program, Program()):
+                fluid.optimizer.SGD(learning_rate=0.1).minimize(loss)
+            program.global_block().var('fc_w').trainable = False
+
+            # built on the first access
+            self.assertEqual([op.type for op in block.ops],
+                             ['mul', 'elementwise_add', 'mean'])
+            self.assertTrue(block._lazy_build is None)
+            self.assertTrue(
+                isinstance(block.var('fc_w'), fluid.framework.Parameter))
+            self.assertTrue(block.var('x').is_data)
+            self.assertFalse(block.has_var('fc_w@GRAD'))
+            self.assertTrue(block.var('fc_w').trainable)
+            program.global_block().var('fc_w').trainable = True
+
+    def test_program_clone_lazily_released(self):
+        program = Program()
+        with program_guard(program, Program()):
+            x = layers.data(name='x', shape=[10], dtype='float32')
+            layers.fc(x, size=2, param_attr='fc_w')
+        cloned = program.clone()
+
+        # the cloned program doesn't keep the origin program alive
+        origin = weakref.ref(program)
+        del program, x
+        gc.collect()
+        self.assertTrue(origin() is None)
+        self.assertTrue(cloned.global_block().var('x').is_data)
+        self.assertTrue(
+            isinstance(cloned.global_block().var('fc_w'),
+                       fluid.framework.Parameter))
+
 
 if __name__ == '__main__':
     unittest.main()
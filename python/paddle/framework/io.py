@@ -15,10 +15,13 @@
 from __future__ import print_function
 
 import os
+import mmap
+import struct
 import collections
 import pickle
 import six
 import warnings
+import numpy as np
 
 import paddle
 
@@ -36,12 +39,12 @@ __all__ = [
 ]
 
 
-def _build_saved_state_dict(state_dict):
+def _build_saved_state_dict(state_dict, convert_to_numpy=True):
     save_dict = {}
     name_table = {}
     for key, value in state_dict.items():
         if isinstance(value, (Variable, core.VarBase)):
-            save_dict[key] = value.numpy()
+            save_dict[key] = value.numpy() if convert_to_numpy else value
             name_table[key] = value.name
         else:
             save_dict[key] = value
@@ -50,6 +53,135 @@ def _build_saved_state_dict(state_dict):
     return save_dict
 
 
+# NOTE(chenweihang): [ Binary format of paddle.save ]
+# With `use_binary_format=True`, tensors of the state dict are written as
+# raw buffers aligned to _BINARY_FORMAT_ALIGNMENT bytes one by one, so only
+# one tensor is converted to numpy at a time when saving, and tensors can
+# be loaded lazily by mmap. Other values are pickled in an index written
+# after the tensor data. File layout of the first shard (the `path` file):
+#   | magic | tensor data | pickled index | index size (uint64) | magic |
+# tensor data which exceeds `shard_size` is written to shard files named
+# `path.shard1`, `path.shard2`, ..., which only contain tensor data.
+_BINARY_FORMAT_MAGIC = b'PDSTATE1'
+_BINARY_FORMAT_ALIGNMENT = 64
+_BINARY_FORMAT_VERSION = 1
+
+
+def _binary_shard_path(path, shard_id):
+    return path if shard_id == 0 else "%s.shard%d" % (path, shard_id)
+
+
+def _is_binary_format_file(path):
+    with open(path, 'rb') as f:
+        return f.read(len(_BINARY_FORMAT_MAGIC)) == _BINARY_FORMAT_MAGIC
+
+
+def _to_numpy_tensor(value):
+    if isinstance(value, (Variable, core.VarBase)):
+        value = value.numpy()
+    return np.ascontiguousarray(value)
+
+
+def _save_binary_format(saved_obj, path, shard_size=None):
+    tensors = collections.OrderedDict()
+    others = dict()
+    for key, value in saved_obj.items():
+        if isinstance(value, (Variable, core.VarBase, np.ndarray)):
+            tensors[key] = value
+        else:
+            others[key] = value
+
+    tensor_index = dict()
+    shard_id = 0
+    # index is written to the first shard after all tensors are written
+    first_file = open(path, 'wb')
+    cur_file = first_file
+    try:
+        first_file.write(_BINARY_FORMAT_MAGIC)
+        data_start = len(_BINARY_FORMAT_MAGIC)
+        for key, value in tensors.items():
+            # convert to numpy one by one to avoid holding two copies
+            # of all tensors in memory
+            array = _to_numpy_tensor(value)
+            offset = cur_file.tell()
+            if shard_size is not None and offset > data_start and \
+                    offset + array.nbytes > shard_size:
+                if cur_file is not first_file:
+                    cur_file.close()
+                shard_id += 1
+                cur_file = open(_binary_shard_path(path, shard_id), 'wb')
+                offset = data_start = 0
+            padding = -offset % _BINARY_FORMAT_ALIGNMENT
+            cur_file.write(b'\0' * padding)
+            offset += padding
+            array.tofile(cur_file)
+            tensor_index[key] = (shard_id, offset, array.dtype.str,
+                                 array.shape)
+
+        index = {
+            'version': _BINARY_FORMAT_VERSION,
+            'num_shards': shard_id + 1,
+            'tensors': tensor_index,
+            'others': others,
+        }
+        index_bytes = pickle.dumps(index, protocol=2)
+        first_file.write(index_bytes)
+        first_file.write(struct.pack('<Q', len(index_bytes)))
+        first_file.write(_BINARY_FORMAT_MAGIC)
+    finally:
+        if cur_file is not first_file:
+            cur_file.close()
+        first_file.close()
+
+
+def _load_binary_format(path, use_mmap=True):
+    footer_size = 8 + len(_BINARY_FORMAT_MAGIC)
+    with open(path, 'rb') as f:
+        f.seek(-footer_size, os.SEEK_END)
+        index_size = struct.unpack('<Q', f.read(8))[0]
+        if f.read(len(_BINARY_FORMAT_MAGIC)) != _BINARY_FORMAT_MAGIC:
+            raise ValueError("The file (%s) saved by `paddle.save` is "
+                             "incomplete or corrupted." % path)
+        f.seek(-(footer_size + index_size), os.SEEK_END)
+        index_bytes = f.read(index_size)
+    index = pickle.loads(index_bytes) if six.PY2 else pickle.loads(
+        index_bytes, encoding='latin1')
+
+    load_result = dict(index['others'])
+    buffers = dict()
+    try:
+        for key, (shard_id, offset, dtype, shape) in index['tensors'].items():
+            dtype = np.dtype(dtype)
+            count = int(np.prod(shape))
+            if count == 0:
+                load_result[key] = np.empty(shape, dtype=dtype)
+                continue
+            if shard_id not in buffers:
+                shard_file = open(_binary_shard_path(path, shard_id), 'rb')
+                if use_mmap:
+                    # NOTE: ACCESS_COPY makes loaded arrays writable without
+                    # modifying the file, pages are only read when accessed
+                    buffers[shard_id] = mmap.mmap(
+                        shard_file.fileno(), 0, access=mmap.ACCESS_COPY)
+                    shard_file.close()
+                else:
+                    buffers[shard_id] = shard_file
+            if use_mmap:
+                array = np.frombuffer(
+                    buffers[shard_id], dtype=dtype, count=count, offset=offset)
+            else:
+                buffers[shard_id].seek(offset)
+                array = np.fromfile(
+                    buffers[shard_id], dtype=dtype, count=count)
+            load_result[key] = array.reshape(shape)
+    finally:
+        if not use_mmap:
+            for shard_file in buffers.values():
+                shard_file.close()
+
+    return load_result
+
+
 def _load_state_dict_from_save_inference_model(model_path, config):
     # 1. load program desc & construct _ProgramHolder
     programs = _construct_program_holders(model_path, config.model_filename)
@@ -177,8 +309,31 @@ def _build_load_path_and_config(path, config):
     return model_path, config
 
 
+def _parse_save_config(configs):
+    supported_configs = ['use_binary_format', 'shard_size']
+
+    # input check
+    for key in configs:
+        if key not in supported_configs:
+            raise ValueError(
+                "The additional config (%s) of `paddle.save` is not supported."
+                % key)
+
+    # construct inner config
+    inner_config = _SaveLoadConfig()
+    inner_config.use_binary_format = configs.get('use_binary_format', None)
+    inner_config.shard_size = configs.get('shard_size', None)
+    # sharding is only supported by binary format
+    if inner_config.shard_size is not None:
+        inner_config.use_binary_format = True
+
+    return inner_config
+
+
 def _parse_load_config(configs):
-    supported_configs = ['model_filename', 'params_filename', 'keep_name_table']
+    supported_configs = [
+        'model_filename', 'params_filename', 'keep_name_table', 'use_mmap'
+    ]
 
     # input check
     for key in configs:
@@ -192,11 +347,12 @@ def _parse_load_config(configs):
     inner_config.model_filename = configs.get('model_filename', None)
     inner_config.params_filename = configs.get('params_filename', None)
     inner_config.keep_name_table = configs.get('keep_name_table', None)
+    inner_config.use_mmap = configs.get('use_mmap', None)
 
     return inner_config
 
 
-def save(obj, path):
+def save(obj, path, **configs):
     '''
     Save an object to the specified path.
     
@@ -213,6 +369,15 @@ def save(obj, path):
         obj(Object) : The object to be saved.
         path(str) : The path of the object to be saved. 
           If saved in the current directory, the input path string will be used as the file name. 
+        **configs (dict, optional): other save configuration options. Default None.
+            The following options are currently supported:
+            (1) use_binary_format (bool): Whether to save tensors as aligned raw buffers 
+            instead of pickling the whole object. Tensors are converted and written one 
+            by one, and can be loaded lazily by mmap in ``paddle.load`` . Default False.
+            (2) shard_size (int): The max bytes of tensor data in each file, tensor data 
+            exceeding it is written to ``path.shard1``, ``path.shard2``, ... , a tensor 
+            larger than ``shard_size`` is written to a file alone. Setting it implies 
+            ``use_binary_format=True`` . Default None, means no sharding.
 
     Returns:
         None
@@ -238,6 +403,8 @@ def save(obj, path):
     '''
 
     # 1. input check
+    config = _parse_save_config(configs)
+
     if not isinstance(obj, dict):
         raise NotImplementedError(
             "Now only supports save state_dict of Layer or Optimizer, "
@@ -258,6 +425,11 @@ def save(obj, path):
         os.makedirs(dirname)
 
     # TODO(chenweihang): supports save other object
+    if config.use_binary_format:
+        saved_obj = _build_saved_state_dict(obj, convert_to_numpy=False)
+        _save_binary_format(saved_obj, path, config.shard_size)
+        return
+
     saved_obj = _build_saved_state_dict(obj)
 
     with open(path, 'wb') as f:
@@ -305,6 +477,9 @@ def load(path, **configs):
             (2) params_filename (string): The persistable variables file name of the paddle 1.x 
             ``save_inference_model`` save format. No default file name, save variables separately 
             by default.
+            (3) use_mmap (bool): Whether to load tensors saved with ``use_binary_format=True`` 
+            by mmap. If True, the loaded numpy arrays are backed by the mapped file, which 
+            is only read when the arrays are accessed. Default True.
 
     Returns:
         Object(Object): a target object can be used in paddle
@@ -336,9 +511,12 @@ def load(path, **configs):
 
     if os.path.isfile(path):
         # we think path is file means this file is created by paddle.save
-        with open(path, 'rb') as f:
-            load_result = pickle.load(f) if six.PY2 else pickle.load(
-                f, encoding='latin1')
+        if _is_binary_format_file(path):
+            load_result = _load_binary_format(path, config.use_mmap)
+        else:
+            with open(path, 'rb') as f:
+                load_result = pickle.load(f) if six.PY2 else pickle.load(
+                    f, encoding='latin1')
 
         if not config.keep_name_table and "StructuredToParameterName@@" in load_result:
             del load_result["StructuredToParameterName@@"]
@@ -19,7 +19,8 @@ from . import model_summary
 from . import model
 from .model import *
 from .model_summary import summary
+from .step_profiler import StepProfiler
 
 logger.setup_logger()
 
-__all__ = ['callbacks'] + model.__all__ + ['summary']
+__all__ = ['callbacks'] + model.__all__ + ['summary', 'StepProfiler']
@@ -62,6 +62,8 @@ class CallbackList(object):
         self.callbacks = [c for c in callbacks]
         self.params = {}
         self.model = None
+        # StepProfiler to record the time of each callback
+        self.profiler = None
 
     def append(self, callback):
         self.callbacks.append(callback)
@@ -78,6 +80,13 @@ class CallbackList(object):
             c.set_model(model)
 
     def _call(self, name, *args):
+        profiler = self.profiler
+        if profiler is not None and profiler.recording:
+            for c in self.callbacks:
+                with profiler.record('{}.{}'.format(type(c).__name__, name),
+                                     'callback'):
+                    getattr(c, name)(*args)
+            return
         for c in self.callbacks:
             func = getattr(c, name)
             func(*args)
@@ -427,6 +436,10 @@ class ModelCheckpoint(Callback):
                         are saved. Default: 1.
         save_dir(str|None): The directory to save checkpoint during training.
                 If None, will not save checkpoint. Default: None.
+        async_save(bool): Whether to write checkpoints in a background thread
+                while training continues. The last one is waited at the end
+                of training. The future of each checkpoint is kept in
+                `futures`. Default: False.
 
     Examples:
         .. code-block:: python
@@ -452,9 +465,11 @@ class ModelCheckpoint(Callback):
             model.fit(train_dataset, batch_size=64, callbacks=callback)
     """
 
-    def __init__(self, save_freq=1, save_dir=None):
+    def __init__(self, save_freq=1, save_dir=None, async_save=False):
         self.save_freq = save_freq
         self.save_dir = save_dir
+        self.async_save = async_save
+        self.futures = []
 
     def on_epoch_begin(self, epoch=None, logs=None):
         self.epoch = epoch
@@ -462,17 +477,24 @@ class ModelCheckpoint(Callback):
     def _is_save(self):
         return self.model and self.save_dir and ParallelEnv().local_rank == 0
 
+    def _save(self, path):
+        print('save checkpoint at {}'.format(os.path.abspath(path)))
+        future = self.model.save(path, async_save=self.async_save)
+        if future is not None:
+            self.futures.append(future)
+
     def on_epoch_end(self, epoch, logs=None):
         if self._is_save() and self.epoch % self.save_freq == 0:
             path = '{}/{}'.format(self.save_dir, epoch)
-            print('save checkpoint at {}'.format(os.path.abspath(path)))
-            self.model.save(path)
+            self._save(path)
 
     def on_train_end(self, logs=None):
         if self._is_save():
             path = '{}/final'.format(self.save_dir)
-            print('save checkpoint at {}'.format(os.path.abspath(path)))
-            self.model.save(path)
+            self._save(path)
+            # checkpoints are written in order, so waiting the last is enough
+            if self.futures:
+                self.futures[-1].wait()
 
 
 class VisualDL(Callback):
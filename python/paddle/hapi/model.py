@@ -37,6 +37,7 @@ from paddle.fluid.executor import global_scope
 from paddle.fluid.io import is_belong_to_optimizer
 from paddle.fluid.dygraph.base import to_variable
 from paddle.fluid.dygraph.parallel import ParallelEnv
+from paddle.fluid.dygraph.checkpoint import _pack_state_dict, _save_checkpoint
 from paddle.fluid.dygraph.dygraph_to_static.program_translator import ProgramTranslator, FunctionSpec
 from paddle.fluid.layers.utils import flatten
 from paddle.fluid.layers import collective
@@ -51,6 +52,7 @@ from paddle.static import InputSpec as Input
 
 from .callbacks import config_callbacks
 from .model_summary import summary
+from .step_profiler import StepProfiler, record_span
 
 __all__ = ['Model', ]
 
@@ -268,7 +270,9 @@ class StaticGraphAdapter(object):
     def parameters(self, *args, **kwargs):
         return self.model.network.parameters(*args, **kwargs)
 
-    def save(self, path):
+    def save(self, path, async_save=False):
+        files = []
+
         def _save(state, path):
             if not state:
                 return
@@ -276,29 +280,23 @@ class StaticGraphAdapter(object):
                 k: to_numpy(v) if isinstance(v, Variable) else v
                 for k, v in state.items()
             }
-            with open(path, 'wb') as f:
-                pickle.dump(state, f)
+            files.append((state, path))
 
         base = os.path.basename(path)
         assert base != "", "path should be of 'dirname/filename' format"
-        dir_name = os.path.dirname(path)
-        if dir_name and not os.path.exists(dir_name):
-            os.makedirs(dir_name)
         param_path = path + ".pdparams"
         _save(self.model.network.state_dict(), param_path)
         prog = self._progs.get('train', None)
-        if prog is None or self.model._optimizer is None:
-            return
-        # XXX `optimizer.state_dict()` only work in dygraph mode
-        optim_path = path + ".pdopt"
-        optim = {
-            p.name: p
-            for p in filter(is_belong_to_optimizer, prog.list_vars())
-        }
-        if not optim:
-            return
+        if prog is not None and self.model._optimizer is not None:
+            # XXX `optimizer.state_dict()` only work in dygraph mode
+            optim_path = path + ".pdopt"
+            optim = {
+                p.name: p
+                for p in filter(is_belong_to_optimizer, prog.list_vars())
+            }
+            _save(optim, optim_path)
 
-        _save(optim, optim_path)
+        return _save_checkpoint(files, async_save)
 
     def load(self, param_state_pairs, optim_state):
         if self._executor is None:
@@ -443,10 +441,12 @@ class StaticGraphAdapter(object):
             else:
                 pruned_fetch_list.append(fetch_var)
 
-        rets = self._executor.run(compiled_prog,
-                                  feed=feed,
-                                  fetch_list=pruned_fetch_list,
-                                  return_numpy=False)
+        profiler = self.model._step_profiler
+        with record_span(profiler, 'run_program'):
+            rets = self._executor.run(compiled_prog,
+                                      feed=feed,
+                                      fetch_list=pruned_fetch_list,
+                                      return_numpy=False)
 
         # restore pruned fetch_list Variable from feeds
         for i, name in enumerate(pruned_fetch_idx_name_map):
@@ -454,7 +454,8 @@ class StaticGraphAdapter(object):
                 rets.insert(i, feed[name])
 
         # LoDTensor cannot be fetch as numpy directly
-        rets = [np.array(v) for v in rets]
+        with record_span(profiler, 'fetch'):
+            rets = [np.array(v) for v in rets]
         if self.mode == 'test':
             return rets[:]
 
@@ -480,7 +481,8 @@ class StaticGraphAdapter(object):
                     self._merge_count[self.mode + '_total'] += samples
                     self._merge_count[self.mode + '_batch'] = samples
 
-            metrics.append(metric.update(*state))
+            with record_span(profiler, 'update:' + type(metric).__name__):
+                metrics.append(metric.update(*state))
 
         if num_loss and len(metrics):
             return rets[:num_loss], metrics
@@ -634,28 +636,35 @@ class DynamicGraphAdapter(object):
             "model not ready, please call `model.prepare()` first"
         self.model.network.train()
         self.mode = 'train'
+        profiler = self.model._step_profiler
         inputs = to_list(inputs)
         self._input_shapes = _update_input_shapes(inputs)
         labels = labels or []
-        labels = [to_variable(l) for l in to_list(labels)]
+        with record_span(profiler, 'feed'):
+            labels = [to_variable(l) for l in to_list(labels)]
+            inputs = [to_variable(x) for x in inputs]
 
-        if self._nranks > 1:
-            outputs = self.ddp_model.forward(* [to_variable(x) for x in inputs])
-        else:
-            outputs = self.model.network.forward(
-                * [to_variable(x) for x in inputs])
+        with record_span(profiler, 'forward'):
+            if self._nranks > 1:
+                outputs = self.ddp_model.forward(*inputs)
+            else:
+                outputs = self.model.network.forward(*inputs)
 
-        losses = self.model._loss(*(to_list(outputs) + labels))
-        losses = to_list(losses)
-        final_loss = fluid.layers.sum(losses)
-        final_loss.backward()
+            losses = self.model._loss(*(to_list(outputs) + labels))
+            losses = to_list(losses)
+            final_loss = fluid.layers.sum(losses)
+        with record_span(profiler, 'backward'):
+            final_loss.backward()
 
-        self.model._optimizer.minimize(final_loss)
-        self.model.network.clear_gradients()
+        with record_span(profiler, 'optimizer'):
+            self.model._optimizer.minimize(final_loss)
+            self.model.network.clear_gradients()
         metrics = []
         for metric in self.model._metrics:
-            metric_outs = metric.compute(*(to_list(outputs) + labels))
-            m = metric.update(* [to_numpy(m) for m in to_list(metric_outs)])
+            with record_span(profiler, 'update:' + type(metric).__name__):
+                metric_outs = metric.compute(*(to_list(outputs) + labels))
+                m = metric.update(
+                    * [to_numpy(m) for m in to_list(metric_outs)])
             metrics.append(m)
 
         return ([to_numpy(l) for l in losses], metrics) \
@@ -664,15 +673,19 @@ class DynamicGraphAdapter(object):
     def eval_batch(self, inputs, labels=None):
         self.model.network.eval()
         self.mode = 'eval'
+        profiler = self.model._step_profiler
         inputs = to_list(inputs)
         self._input_shapes = _update_input_shapes(inputs)
         labels = labels or []
-        labels = [to_variable(l) for l in to_list(labels)]
+        with record_span(profiler, 'feed'):
+            labels = [to_variable(l) for l in to_list(labels)]
+            inputs = [to_variable(x) for x in inputs]
 
-        outputs = self.model.network.forward(* [to_variable(x) for x in inputs])
-        if self.model._loss:
-            losses = self.model._loss(*(to_list(outputs) + labels))
-            losses = to_list(losses)
+        with record_span(profiler, 'forward'):
+            outputs = self.model.network.forward(*inputs)
+            if self.model._loss:
+                losses = self.model._loss(*(to_list(outputs) + labels))
+                losses = to_list(losses)
 
         if self._nranks > 1:
             outputs = [_all_gather(o, self._nranks) for o in to_list(outputs)]
@@ -699,8 +712,10 @@ class DynamicGraphAdapter(object):
                     self._merge_count[self.mode + '_total'] += samples
                     self._merge_count[self.mode + '_batch'] = samples
 
-            metric_outs = metric.compute(*(to_list(outputs) + labels))
-            m = metric.update(* [to_numpy(m) for m in to_list(metric_outs)])
+            with record_span(profiler, 'update:' + type(metric).__name__):
+                metric_outs = metric.compute(*(to_list(outputs) + labels))
+                m = metric.update(
+                    * [to_numpy(m) for m in to_list(metric_outs)])
             metrics.append(m)
 
         if self.model._loss and len(metrics):
@@ -713,9 +728,12 @@ class DynamicGraphAdapter(object):
     def test_batch(self, inputs):
         self.model.network.eval()
         self.mode = 'test'
-        inputs = [to_variable(x) for x in to_list(inputs)]
+        profiler = self.model._step_profiler
+        with record_span(profiler, 'feed'):
+            inputs = [to_variable(x) for x in to_list(inputs)]
         self._input_shapes = _update_input_shapes(inputs)
-        outputs = self.model.network.forward(*inputs)
+        with record_span(profiler, 'forward'):
+            outputs = self.model.network.forward(*inputs)
         if self._nranks > 1 and isinstance(self.model._place, fluid.CUDAPlace):
             outputs = [_all_gather(o, self._nranks) for o in to_list(outputs)]
 
@@ -724,14 +742,14 @@ class DynamicGraphAdapter(object):
     def parameters(self, *args, **kwargs):
         return self.model.network.parameters(*args, **kwargs)
 
-    def save(self, path):
+    def save(self, path, async_save=False):
         params = self.model.network.state_dict()
-        fluid.save_dygraph(params, path)
-        if self.model._optimizer is None:
-            return
-        if self.model._optimizer.state_dict():
+        files = [_pack_state_dict(params, path)]
+        if self.model._optimizer is not None and \
+                self.model._optimizer.state_dict():
             optim = self.model._optimizer.state_dict()
-            fluid.save_dygraph(optim, path)
+            files.append(_pack_state_dict(optim, path))
+        return _save_checkpoint(files, async_save)
 
     def load(self, param_state_pairs, optim_state):
         # restore parameter states
@@ -859,6 +877,7 @@ class Model(object):
         self._input_shapes = None
         self._is_shape_inferred = False
         self._test_dataloader = None
+        self._step_profiler = None
 
         if not in_dygraph_mode():
             if not isinstance(inputs, (list, dict, Input)):
@@ -1014,7 +1033,7 @@ class Model(object):
             self._update_inputs()
         return loss
 
-    def save(self, path, training=True):
+    def save(self, path, training=True, async_save=False):
         """  
         This function saves parameters, optimizer information or model and 
         paramters only for inference to path. It depends on the parameter
@@ -1036,9 +1055,17 @@ class Model(object):
                  will be raised.
             training (bool, optional): Whether to save for training. If not, save
                 for inference only. Default: True.
+            async_save (bool, optional): Whether to write the files in a
+                background thread while training continues. The states are
+                copied to host before returning, and at most one checkpoint
+                is being written at the same time, later saving waits for it.
+                Saving without `async_save` waits for them too. Only works
+                when `training` is True. Default: False.
 
         Returns:
-            None
+            CheckpointFuture|None: the future done when all the files are
+                written if `async_save` is True, otherwise None. Call its
+                `wait()` or `result()` to wait for the checkpoint.
 
         Examples:
 
@@ -1076,13 +1103,15 @@ class Model(object):
                 model.fit(data, epochs=1, batch_size=32, verbose=0)
                 model.save('checkpoint/test')  # save for training
                 model.save('inference_model', False)  # save for inference
+                future = model.save('checkpoint/async', async_save=True)
+                future.wait()  # wait until the files are written
         """
 
         if ParallelEnv().local_rank == 0:
             if not training:
                 self._save_inference_model(path)
             else:
-                self._adapter.save(path)
+                return self._adapter.save(path, async_save)
 
     def load(self, path, skip_mismatch=False, reset_optimizer=False):
         """
@@ -1602,7 +1631,7 @@ class Model(object):
                     self.return_label = return_label
 
                 def __getitem__(self, idx):
-                    img = np.reshape(self.images[idx], [1, 28, 28])
+                    img = np.reshape(self.images[idx], [1, 28, 28]).astype('float32')
                     if self.return_label:
                         return img, np.array(self.labels[idx]).astype('int64')
                     return img,
@@ -1793,7 +1822,14 @@ class Model(object):
 
     def _run_one_epoch(self, data_loader, callbacks, mode, logs={}):
         outputs = []
+        profiler = self._step_profiler
+        callbacks.profiler = profiler
+        data_start = time.time()
         for step, data in enumerate(data_loader):
+            if profiler is not None:
+                profiler.begin_step(mode, step)
+                profiler.add('data', int(data_start * 1e9),
+                             int(time.time() * 1e9))
             # data might come from different types of data_loader and have
             # different format, as following:
             # 1. DataLoader in static graph:
@@ -1805,7 +1841,8 @@ class Model(object):
             # 4. custumed iterator yield seperated inputs and labels:
             #   ([input1, input2, ...], [label1, lable2, ...])
             # To handle all of these, flatten (nested) list to list.
-            data = flatten(data)
+            with record_span(profiler, 'flatten'):
+                data = flatten(data)
             # LoDTensor.shape is callable, where LoDTensor comes from
             # DataLoader in static graph
 
@@ -1815,8 +1852,9 @@ class Model(object):
             callbacks.on_batch_begin(mode, step, logs)
 
             if mode != 'test':
-                outs = getattr(self, mode + '_batch')(data[:len(self._inputs)],
-                                                      data[len(self._inputs):])
+                with record_span(profiler, mode + '_batch'):
+                    outs = getattr(self, mode + '_batch')(
+                        data[:len(self._inputs)], data[len(self._inputs):])
                 if self._metrics and self._loss:
                     metrics = [[l[0] for l in outs[0]]]
                 elif self._loss:
@@ -1826,18 +1864,21 @@ class Model(object):
 
                 # metrics
                 for metric in self._metrics:
-                    res = metric.accumulate()
+                    with record_span(profiler,
+                                     'accumulate:' + type(metric).__name__):
+                        res = metric.accumulate()
                     metrics.extend(to_list(res))
 
                 assert len(self._metrics_name()) == len(metrics)
                 for k, v in zip(self._metrics_name(), metrics):
                     logs[k] = v
             else:
-                if self._inputs is not None:
-                    outs = getattr(self,
-                                   mode + '_batch')(data[:len(self._inputs)])
-                else:
-                    outs = getattr(self, mode + '_batch')(data)
+                with record_span(profiler, mode + '_batch'):
+                    if self._inputs is not None:
+                        outs = getattr(self, mode + '_batch')(
+                            data[:len(self._inputs)])
+                    else:
+                        outs = getattr(self, mode + '_batch')(data)
 
                 outputs.append(outs)
 
@@ -1849,12 +1890,46 @@ class Model(object):
                 logs['batch_size'] = self._adapter._merge_count[mode + '_batch']
 
             callbacks.on_batch_end(mode, step, logs)
+            if profiler is not None:
+                profiler.end_step()
+                data_start = time.time()
         self._reset_metrics()
 
         if mode == 'test':
             return logs, outputs
         return logs
 
+    def set_step_profiler(self, profiler):
+        """
+        Sets the profiler to record the time spans of the python side of each
+        step in `fit`, `evaluate` and `predict`, such as data waiting, feeding,
+        forward, backward, optimizer, metric updating and each callback.
+
+        Args:
+            profiler (StepProfiler|None): The profiler, None to disable it.
+
+        Returns:
+            None
+
+        Examples:
+
+            .. code-block:: python
+
+                import paddle
+                from paddle.static import InputSpec
+                from paddle.hapi.step_profiler import StepProfiler
+
+                input = InputSpec([None, 784], 'float32', 'x')
+                model = paddle.Model(paddle.nn.Linear(784, 10), input)
+                profiler = StepProfiler(sample_freq=100)
+                model.set_step_profiler(profiler)
+        """
+        if profiler is not None and not isinstance(profiler, StepProfiler):
+            raise TypeError(
+                "The profiler should be a StepProfiler or None, but received "
+                "{}.".format(type(profiler)))
+        self._step_profiler = profiler
+
     def summary(self, input_size=None, dtype=None):
         """Prints a string summary of the network.
 
@@ -0,0 +1,332 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import os
+import json
+import time
+import threading
+import collections
+
+import six
+
+__all__ = ['StepProfiler']
+
+
+def _now_ns():
+    # NOTE: the same clock as the events of fluid.profiler, which are
+    # recorded by gettimeofday in nanoseconds, so that they can be merged.
+    return int(time.time() * 1e9)
+
+
+class _NullSpan(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span(object):
+    def __init__(self, profiler, name, category):
+        self._profiler = profiler
+        self._name = name
+        self._category = category
+
+    def __enter__(self):
+        self._start = _now_ns()
+        return self
+
+    def __exit__(self, *args):
+        self._profiler.add(self._name, self._start, _now_ns(), self._category)
+        return False
+
+
+def record_span(profiler, name, category='hapi'):
+    """
+    Returns a context recording a span named `name` in the current step of
+    `profiler`, or a no-op context if `profiler` is None or not recording.
+    """
+    if profiler is None or not profiler.recording:
+        return _NULL_SPAN
+    return profiler.record(name, category)
+
+
+class StepProfiler(object):
+    """
+    Profiler recording the time spans of the python side of each step in the
+    training, evaluating and predicting loops of `paddle.Model`, such as data
+    waiting, feeding, forward, backward, optimizer, metric updating and each
+    callback, which are not visible to `fluid.profiler`.
+
+    The recorded steps can be summarized by `summary`, or exported as Chrome
+    tracing JSON by `export_chrome_tracing`, which can be merged with the
+    timeline of `fluid.profiler` generated by `tools/timeline.py` by
+    `merge_chrome_tracing`. As `tools/timeline.py`, timestamps and durations
+    are in nanoseconds.
+
+    Args:
+        sample_freq (int, optional): Record one step in every `sample_freq`
+            steps, the other steps cost almost nothing, so that the profiler
+            can be kept on in long running jobs. Default: 1, record every step.
+        max_steps (int, optional): The maximum number of recorded steps kept,
+            the oldest ones are dropped when exceeded. Default: 1000.
+
+    Examples:
+        .. code-block:: python
+
+            import paddle
+            from paddle.static import InputSpec
+            from paddle.hapi.step_profiler import StepProfiler
+
+            inputs = [InputSpec([-1, 1, 28, 28], 'float32', 'image')]
+            labels = [InputSpec([None, 1], 'int64', 'label')]
+            train_dataset = paddle.vision.datasets.MNIST(mode='train')
+
+            model = paddle.Model(paddle.vision.LeNet(), inputs, labels)
+            optim = paddle.optimizer.Adam(0.001, parameters=model.parameters())
+            model.prepare(optim, paddle.nn.CrossEntropyLoss(),
+                          paddle.metric.Accuracy())
+
+            profiler = StepProfiler(sample_freq=10)
+            model.set_step_profiler(profiler)
+            model.fit(train_dataset, batch_size=64, epochs=1)
+
+            print(profiler.summary(sorted_key='total'))
+            profiler.export_chrome_tracing('./step_trace.json')
+    """
+
+    def __init__(self, sample_freq=1, max_steps=1000):
+        if not isinstance(sample_freq, six.integer_types) or sample_freq < 1:
+            raise ValueError(
+                "sample_freq of StepProfiler should be a positive integer, "
+                "but received {}.".format(sample_freq))
+        if not isinstance(max_steps, six.integer_types) or max_steps < 1:
+            raise ValueError(
+                "max_steps of StepProfiler should be a positive integer, "
+                "but received {}.".format(max_steps))
+        self.sample_freq = sample_freq
+        self.max_steps = max_steps
+        self.clear()
+
+    def clear(self):
+        """
+        Drops all the recorded steps.
+        """
+        # each step is a dict with keys mode, step and events, each event is
+        # a tuple of (name, category, start_ns, end_ns, thread_id)
+        self._steps = collections.deque(maxlen=self.max_steps)
+        self._num_steps = 0
+        self._current = None
+
+    @property
+    def recording(self):
+        """
+        Whether the current step is being recorded.
+        """
+        return self._current is not None
+
+    def begin_step(self, mode, step):
+        """
+        Begins a step, which is recorded if it's sampled.
+
+        Args:
+            mode (str): The mode of the step, 'train', 'eval' or 'test'.
+            step (int): The index of the step in the epoch.
+        """
+        sampled = self._num_steps % self.sample_freq == 0
+        self._num_steps += 1
+        if not sampled:
+            self._current = None
+            return
+        self._current = {
+            'mode': mode,
+            'step': step,
+            'start': _now_ns(),
+            'events': []
+        }
+
+    def end_step(self):
+        """
+        Ends the current step.
+        """
+        if self._current is None:
+            return
+        self._current['end'] = _now_ns()
+        self._steps.append(self._current)
+        self._current = None
+
+    def add(self, name, start_ns, end_ns, category='hapi'):
+        """
+        Adds a span measured by the caller to the current step.
+        """
+        if self._current is not None:
+            self._current['events'].append(
+                (name, category, start_ns, end_ns,
+                 threading.current_thread().ident))
+
+    def record(self, name, category='hapi'):
+        """
+        Returns a context recording a span named `name` in the current step,
+        which is a no-op if the step is not recorded.
+        """
+        if self._current is None:
+            return _NULL_SPAN
+        return _Span(self, name, category)
+
+    @property
+    def steps(self):
+        """
+        The list of recorded steps.
+        """
+        return list(self._steps)
+
+    def summary(self, sorted_key='total'):
+        """
+        Returns the summary table of the spans in recorded steps.
+
+        Args:
+            sorted_key (str, optional): The key to sort the spans, which
+                should be one of 'calls', 'total', 'max', 'min' and 'ave'.
+                Default: 'total'.
+
+        Returns:
+            str: the summary table, times are in milliseconds.
+        """
+        keys = ['calls', 'total', 'max', 'min', 'ave']
+        if sorted_key not in keys:
+            raise ValueError("sorted_key of StepProfiler.summary should be "
+                             "one of {}, but received {}.".format(keys,
+                                                                   sorted_key))
+        # name -> [calls, total, max, min]
+        stats = collections.OrderedDict()
+        for step in self._steps:
+            spans = [('step', step['start'], step['end'])] + [
+                (event[0], event[2], event[3]) for event in step['events']
+            ]
+            for name, start, end in spans:
+                duration = (end - start) / 1e6
+                stat = stats.setdefault(name,
+                                        [0, 0.0, duration, duration])
+                stat[0] += 1
+                stat[1] += duration
+                stat[2] = max(stat[2], duration)
+                stat[3] = min(stat[3], duration)
+
+        rows = []
+        for name, (calls, total, max_t, min_t) in six.iteritems(stats):
+            row = dict(
+                zip(keys, [calls, total, max_t, min_t, total / calls]))
+            row['name'] = name
+            rows.append(row)
+        rows.sort(key=lambda row: row[sorted_key], reverse=True)
+
+        width = max([len(row['name']) for row in rows] + [5]) + 2
+        lines = [('{:<' + str(width) + '}{:>10}{:>14}{:>12}{:>12}{:>12}')
+                 .format('Event', 'Calls', 'Total(ms)', 'Max(ms)', 'Min(ms)',
+                         'Ave(ms)')]
+        for row in rows:
+            lines.append(('{:<' + str(width) +
+                          '}{:>10}{:>14.3f}{:>12.3f}{:>12.3f}{:>12.3f}').format(
+                              row['name'], row['calls'], row['total'], row[
+                                  'max'], row['min'], row['ave']))
+        return '\n'.join(lines)
+
+    def chrome_tracing(self):
+        """
+        Returns the recorded steps as a dict in Chrome tracing format.
+        """
+        pid = os.getpid()
+        events = [{
+            'name': 'process_name',
+            'ph': 'M',
+            'pid': pid,
+            'args': {
+                'name': 'hapi step profiler'
+            }
+        }]
+        for step in self._steps:
+            events.append({
+                'name': '{}_step'.format(step['mode']),
+                'cat': 'step',
+                'ph': 'X',
+                'pid': pid,
+                'tid': 0,
+                'ts': step['start'],
+                'dur': step['end'] - step['start'],
+                'args': {
+                    'mode': step['mode'],
+                    'step': step['step']
+                }
+            })
+            for name, category, start, end, tid in step['events']:
+                events.append({
+                    'name': name,
+                    'cat': category,
+                    'ph': 'X',
+                    'pid': pid,
+                    'tid': tid,
+                    'ts': start,
+                    'dur': end - start,
+                    'args': {
+                        'step': step['step']
+                    }
+                })
+        return {'traceEvents': events}
+
+    def export_chrome_tracing(self, path):
+        """
+        Exports the recorded steps to `path` as Chrome tracing JSON, which can
+        be viewed in chrome://tracing.
+
+        Args:
+            path (str): The path of the exported file.
+        """
+        dir_name = os.path.dirname(path)
+        if dir_name and not os.path.exists(dir_name):
+            os.makedirs(dir_name)
+        with open(path, 'w') as f:
+            json.dump(self.chrome_tracing(), f, separators=(',', ':'))
+
+
+def merge_chrome_tracing(paths, output_path):
+    """
+    Merges Chrome tracing JSON files, such as those exported by StepProfiler
+    and generated by `tools/timeline.py` from `fluid.profiler`, into one file.
+    The process ids of each file are renumbered so that they don't collide.
+
+    Args:
+        paths (list[str]): The paths of Chrome tracing JSON files.
+        output_path (str): The path of the merged file.
+    """
+    merged = []
+    next_pid = 0
+    for path in paths:
+        with open(path) as f:
+            trace = json.load(f)
+        events = trace['traceEvents'] if isinstance(trace, dict) else trace
+        pid_map = {}
+        for event in events:
+            if 'pid' in event:
+                if event['pid'] not in pid_map:
+                    pid_map[event['pid']] = next_pid
+                    next_pid += 1
+                event['pid'] = pid_map[event['pid']]
+            merged.append(event)
+    with open(output_path, 'w') as f:
+        json.dump({'traceEvents': merged}, f, separators=(',', ':'))
@@ -17,6 +17,7 @@ __all__ = [
     'Dataset',
     'IterableDataset',
     'TensorDataset',
+    'ShuffleDataset',
     'BatchSampler',
     'DistributedBatchSampler',
     #            'Transform',
@@ -29,4 +30,4 @@ __all__ = [
 
 from ..fluid.io import DataLoader
 from ..fluid.dataloader import Dataset, IterableDataset, BatchSampler, get_worker_info, \
-        TensorDataset, Sampler, SequenceSampler, RandomSampler, DistributedBatchSampler
+        TensorDataset, ShuffleDataset, Sampler, SequenceSampler, RandomSampler, DistributedBatchSampler
@@ -21,6 +21,8 @@ import abc
 import numpy as np
 
 import paddle
+from ..fluid.metrics import _binary_confusion_counts, _auc_bucket_stats, \
+        _auc_from_bucket_stats
 
 __all__ = ['Metric', 'Accuracy', 'Precision', 'Recall', 'Auc']
 
@@ -394,17 +396,10 @@ class Precision(Metric):
         elif not _is_numpy_(labels):
             raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
 
-        sample_num = labels.shape[0]
         preds = np.floor(preds + 0.5).astype("int32")
-
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if pred == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fp += 1
+        tp, fp, _ = _binary_confusion_counts(preds, labels)
+        self.tp += tp
+        self.fp += fp
 
     def reset(self):
         """
@@ -413,6 +408,26 @@ class Precision(Metric):
         self.tp = 0
         self.fp = 0
 
+    def get_state(self):
+        """
+        Get the states of the metric, which can be summed across workers
+        and merged by :code:`merge_state`.
+
+        Returns:
+            dict: the number of true positive 'tp' and false positive 'fp'.
+        """
+        return {'tp': self.tp, 'fp': self.fp}
+
+    def merge_state(self, state):
+        """
+        Merge the states got by :code:`get_state` of another metric.
+
+        Args:
+            state(dict): the states to merge.
+        """
+        self.tp += int(state['tp'])
+        self.fp += int(state['fp'])
+
     def accumulate(self):
         """
         Calculate the final precision.
@@ -528,17 +543,10 @@ class Recall(Metric):
         elif not _is_numpy_(labels):
             raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
 
-        sample_num = labels.shape[0]
         preds = np.rint(preds).astype("int32")
-
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if label == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fn += 1
+        tp, _, fn = _binary_confusion_counts(preds, labels)
+        self.tp += tp
+        self.fn += fn
 
     def accumulate(self):
         """
@@ -557,6 +565,26 @@ class Recall(Metric):
         self.tp = 0
         self.fn = 0
 
+    def get_state(self):
+        """
+        Get the states of the metric, which can be summed across workers
+        and merged by :code:`merge_state`.
+
+        Returns:
+            dict: the number of true positive 'tp' and false negative 'fn'.
+        """
+        return {'tp': self.tp, 'fn': self.fn}
+
+    def merge_state(self, state):
+        """
+        Merge the states got by :code:`get_state` of another metric.
+
+        Args:
+            state(dict): the states to merge.
+        """
+        self.tp += int(state['tp'])
+        self.fn += int(state['fn'])
+
     def name(self):
         """
         Returns metric name
@@ -568,7 +596,7 @@ class Auc(Metric):
     """
     The auc metric is for binary classification.
     Refer to https://en.wikipedia.org/wiki/Receiver_operating_characteristic#Area_under_the_curve.
-    Please notice that the auc metric is implemented with python, which may be a little bit slow.
+    Please notice that the auc metric is computed with numpy on CPU.
 
     The `auc` function creates four local variables, `true_positives`,
     `true_negatives`, `false_positives` and `false_negatives` that are used to
@@ -583,11 +611,26 @@ class Auc(Metric):
             'ROC' or 'PR' for the Precision-Recall-curve. Default is 'ROC'.
         num_thresholds (int): The number of thresholds to use when
             discretizing the roc curve. Default is 4095.
-            'ROC' or 'PR' for the Precision-Recall-curve. Default is 'ROC'.
         name (str, optional): String name of the metric instance. Default
             is `auc`.
 
-    "NOTE: only implement the ROC curve type via Python now."
+    States of the metric got by :code:`get_state` can be summed across
+    workers and merged by :code:`merge_state`, to compute the auc of all
+    workers, for example:
+
+    .. code-block:: python
+
+        import paddle
+        import paddle.distributed as dist
+
+        state = m.get_state()
+        m.reset()
+        for key, value in state.items():
+            value = paddle.to_tensor(value)
+            dist.all_reduce(value)
+            state[key] = value.numpy()
+        m.merge_state(state)
+        res = m.accumulate()
 
     Example by standalone:
         .. code-block:: python
@@ -654,12 +697,14 @@ class Auc(Metric):
                  *args,
                  **kwargs):
         super(Auc, self).__init__(*args, **kwargs)
+        assert curve in ['ROC', 'PR'], \
+            "curve should be 'ROC' or 'PR', but got {}".format(curve)
         self._curve = curve
         self._num_thresholds = num_thresholds
 
         _num_pred_buckets = num_thresholds + 1
-        self._stat_pos = np.zeros(_num_pred_buckets)
-        self._stat_neg = np.zeros(_num_pred_buckets)
+        self._stat_pos = np.zeros(_num_pred_buckets, dtype='int64')
+        self._stat_neg = np.zeros(_num_pred_buckets, dtype='int64')
         self._name = name
 
     def update(self, preds, labels):
@@ -684,14 +729,10 @@ class Auc(Metric):
         elif not _is_numpy_(preds):
             raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
 
-        for i, lbl in enumerate(labels):
-            value = preds[i, 1]
-            bin_idx = int(value * self._num_thresholds)
-            assert bin_idx <= self._num_thresholds
-            if lbl:
-                self._stat_pos[bin_idx] += 1.0
-            else:
-                self._stat_neg[bin_idx] += 1.0
+        stat_pos, stat_neg = _auc_bucket_stats(preds, labels,
+                                               self._num_thresholds)
+        self._stat_pos += stat_pos
+        self._stat_neg += stat_neg
 
     @staticmethod
     def trapezoid_area(x1, x2, y1, y2):
@@ -704,29 +745,41 @@ class Auc(Metric):
         Return:
             float: the area under auc curve
         """
-        tot_pos = 0.0
-        tot_neg = 0.0
-        auc = 0.0
-
-        idx = self._num_thresholds
-        while idx >= 0:
-            tot_pos_prev = tot_pos
-            tot_neg_prev = tot_neg
-            tot_pos += self._stat_pos[idx]
-            tot_neg += self._stat_neg[idx]
-            auc += self.trapezoid_area(tot_neg, tot_neg_prev, tot_pos,
-                                       tot_pos_prev)
-            idx -= 1
-
-        return auc / tot_pos / tot_neg if tot_pos > 0.0 and tot_neg > 0.0 else 0.0
+        return _auc_from_bucket_stats(self._stat_pos, self._stat_neg,
+                                      self._curve)
 
     def reset(self):
         """
         Reset states and result
         """
         _num_pred_buckets = self._num_thresholds + 1
-        self._stat_pos = np.zeros(_num_pred_buckets)
-        self._stat_neg = np.zeros(_num_pred_buckets)
+        self._stat_pos = np.zeros(_num_pred_buckets, dtype='int64')
+        self._stat_neg = np.zeros(_num_pred_buckets, dtype='int64')
+
+    def get_state(self):
+        """
+        Get the bucket statistics of positive and negative instances, which
+        can be summed across workers and merged by :code:`merge_state`.
+
+        Returns:
+            dict: numpy arrays 'stat_pos' and 'stat_neg' with
+            shape [num_thresholds + 1].
+        """
+        return {
+            'stat_pos': self._stat_pos.copy(),
+            'stat_neg': self._stat_neg.copy()
+        }
+
+    def merge_state(self, state):
+        """
+        Merge the bucket statistics got by :code:`get_state` of another
+        metric with the same :attr:`num_thresholds`.
+
+        Args:
+            state(dict): the statistics to merge.
+        """
+        self._stat_pos += np.asarray(state['stat_pos']).astype('int64')
+        self._stat_neg += np.asarray(state['stat_neg']).astype('int64')
 
     def name(self):
         """
@@ -79,6 +79,9 @@ class Adam(Optimizer):
             gradient in current mini-batch, so it will be much more faster. But this mode has
             different semantics with the original Adam algorithm and may lead to different result.
             The default value is False.
+        use_multi_tensor (bool, optional): Whether to update the dense parameters of the same dtype
+            together in dygraph mode, their parameters, gradients and accumulators are coalesced into
+            flat buffers and each group is updated by one optimize operator. Default False.
         name (str, optional): Normally there is no need for user to set this property.
             For more information, please refer to :ref:`api_guide_Name`.
             The default value is None.
@@ -125,6 +128,8 @@ class Adam(Optimizer):
     _moment2_acc_str = "moment2"
     _beta1_pow_acc_str = "beta1_pow_acc"
     _beta2_pow_acc_str = "beta2_pow_acc"
+    _multi_tensor_acc_strs = [_moment1_acc_str, _moment2_acc_str]
+    _multi_tensor_shared_acc_strs = [_beta1_pow_acc_str, _beta2_pow_acc_str]
 
     def __init__(self,
                  learning_rate=0.001,
@@ -135,7 +140,8 @@ class Adam(Optimizer):
                  weight_decay=None,
                  grad_clip=None,
                  lazy_mode=False,
-                 name=None):
+                 name=None,
+                 use_multi_tensor=False):
         assert learning_rate is not None
         assert beta1 is not None
         assert beta2 is not None
@@ -157,6 +163,7 @@ class Adam(Optimizer):
         self._beta2 = beta2
         self._epsilon = epsilon
         self._lazy_mode = lazy_mode
+        self._use_multi_tensor = use_multi_tensor
 
     def _create_accumulators(self, block, parameters):
         assert isinstance(block, framework.Block)
@@ -248,6 +255,25 @@ class Adam(Optimizer):
 
         return adam_op
 
+    def _append_multi_tensor_optimize_op(self, block, param, grad, lr,
+                                         accumulators, first_param):
+        moment1 = accumulators[self._moment1_acc_str]
+        moment2 = accumulators[self._moment2_acc_str]
+        # the beta pows are the same for all the parameters of a group
+        beta1_pow_acc = self._get_accumulator(self._beta1_pow_acc_str,
+                                              first_param)
+        beta2_pow_acc = self._get_accumulator(self._beta2_pow_acc_str,
+                                              first_param)
+        _beta1 = self._beta1 if not isinstance(
+            self._beta1, Variable) else self._beta1.numpy().item(0)
+        _beta2 = self._beta2 if not isinstance(
+            self._beta2, Variable) else self._beta2.numpy().item(0)
+        core.ops.adam(param, grad, lr, moment1, moment2, beta1_pow_acc,
+                      beta2_pow_acc, param, moment1, moment2, beta1_pow_acc,
+                      beta2_pow_acc, 'epsilon', self._epsilon, 'lazy_mode',
+                      self._lazy_mode, 'min_row_size_to_use_multithread', 1000,
+                      'beta1', _beta1, 'beta2', _beta2)
+
     @framework.dygraph_only
     def step(self):
         """
@@ -71,6 +71,9 @@ class AdamW(Adam):
             gradient in current mini-batch, so it will be much more faster. But this mode has
             different semantics with the original Adam algorithm and may lead to different result.
             The default value is False.
+        use_multi_tensor (bool, optional): Whether to update the dense parameters of the same dtype
+            together in dygraph mode, their parameters, gradients and accumulators are coalesced into
+            flat buffers and each group is updated by one optimize operator. Default False.
         name (str, optional): Normally there is no need for user to set this property.
             For more information, please refer to :ref:`api_guide_Name`.
             The default value is None.
@@ -110,7 +113,8 @@ class AdamW(Adam):
                  apply_decay_param_fun=None,
                  grad_clip=None,
                  lazy_mode=False,
-                 name=None):
+                 name=None,
+                 use_multi_tensor=False):
         assert learning_rate is not None
         assert beta1 is not None
         assert beta2 is not None
@@ -136,7 +140,8 @@ class AdamW(Adam):
             epsilon=epsilon,
             grad_clip=grad_clip,
             name=name,
-            lazy_mode=lazy_mode)
+            lazy_mode=lazy_mode,
+            use_multi_tensor=use_multi_tensor)
 
     def _scale_parameters(self, params_and_grads):
         """
@@ -60,6 +60,9 @@ class Momentum(Optimizer):
             some derived class of ``GradientClipBase`` . There are three cliping strategies
             ( :ref:`api_fluid_clip_GradientClipByGlobalNorm` , :ref:`api_fluid_clip_GradientClipByNorm` ,
             :ref:`api_fluid_clip_GradientClipByValue` ). Default None, meaning there is no gradient clipping.
+        use_multi_tensor (bool, optional): Whether to update the dense parameters of the same dtype
+            together in dygraph mode, their parameters, gradients and accumulators are coalesced into
+            flat buffers and each group is updated by one optimize operator. Default False.
         name (str, optional): The default value is None. Normally there is no need for user
                 to set this property. For more information, please refer to
                 :ref:`api_guide_Name` .
@@ -83,6 +86,7 @@ class Momentum(Optimizer):
             momentum.clear_grad()
     """
     _velocity_acc_str = "velocity"
+    _multi_tensor_acc_strs = [_velocity_acc_str]
 
     def __init__(self,
                  learning_rate=0.001,
@@ -91,7 +95,8 @@ class Momentum(Optimizer):
                  use_nesterov=False,
                  weight_decay=None,
                  grad_clip=None,
-                 name=None):
+                 name=None,
+                 use_multi_tensor=False):
         if learning_rate is None:
             raise ValueError("learning_rate is not set")
         if momentum is None:
@@ -105,6 +110,7 @@ class Momentum(Optimizer):
         self.type = "momentum"
         self._momentum = momentum
         self._use_nesterov = bool(use_nesterov)
+        self._use_multi_tensor = use_multi_tensor
 
     def _create_accumulators(self, block, parameters):
         assert isinstance(block, framework.Block)
@@ -147,3 +153,10 @@ class Momentum(Optimizer):
             stop_gradient=True)
 
         return momentum_op
+
+    def _append_multi_tensor_optimize_op(self, block, param, grad, lr,
+                                         accumulators, first_param):
+        velocity_acc = accumulators[self._velocity_acc_str]
+        core.ops.momentum(param, grad, velocity_acc, lr, param, velocity_acc,
+                          'mu', self._momentum, 'use_nesterov',
+                          self._use_nesterov)
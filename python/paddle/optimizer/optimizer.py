@@ -17,7 +17,7 @@ from __future__ import print_function
 import numpy as np
 import six
 import logging
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 
 import paddle
 from paddle.fluid.distribute_lookup_table import find_distributed_lookup_table
@@ -46,6 +46,59 @@ from .lr_scheduler import _LRScheduler
 __all__ = ['Optimizer']
 
 
+class _MultiTensorGroup(object):
+    """
+    Dense parameters of the same dtype that are updated by one optimize op
+    in multi-tensor mode.
+
+    The parameters, the gradients and every fused accumulator are made
+    views of slices of flat buffers by the coalesce_tensor op. The flat
+    buffers are kept across steps, and coalesce_tensor only copies a tensor
+    into its buffer when the tensor is not a view of the buffer anymore,
+    e.g. a gradient created by backward or a parameter loaded by
+    set_value.
+    """
+
+    def __init__(self, params):
+        self.params = params
+        self.dtype = params[0].dtype
+        self._buffers = {}
+
+    @framework.dygraph_only
+    def coalesce(self, key, vars):
+        buffer = self._buffers.get(key, None)
+        if buffer is None:
+            buffer = framework._varbase_creator(dtype=self.dtype)
+            self._buffers[key] = buffer
+            # NOTE: the alignment padding between the slices is never written
+            #       by the copies below but is updated by the optimize op too,
+            #       zero the whole buffer once when it is allocated, with
+            #       placeholder outputs so that the tensors are not overwritten
+            framework._dygraph_tracer().trace_op(
+                type='coalesce_tensor',
+                inputs={'Input': vars},
+                outputs={
+                    'Output': [
+                        framework._varbase_creator(dtype=self.dtype)
+                        for _ in vars
+                    ],
+                    'FusedOutput': buffer
+                },
+                attrs={
+                    'set_constant': True,
+                    'constant': 0.0,
+                    'dtype': self.dtype
+                })
+        framework._dygraph_tracer().trace_op(
+            type='coalesce_tensor',
+            inputs={'Input': vars},
+            outputs={'Output': vars,
+                     'FusedOutput': buffer},
+            attrs={'copy_data': True,
+                   'dtype': self.dtype})
+        return buffer
+
+
 class Optimizer(object):
     """Optimizer Base class.
 
@@ -152,6 +205,11 @@ class Optimizer(object):
         self._accumulators_holder = {}
         self._param_device_map = dict()
         self.clear_gradients = self.clear_grad
+        # NOTE: in multi-tensor mode, which is enabled by the subclasses
+        #       supporting it, the dense parameters are updated in groups
+        #       by dtype with one optimize op per group in dygraph mode
+        self._use_multi_tensor = False
+        self._multi_tensor_groups = {}
 
     @framework.dygraph_only
     def state_dict(self):
@@ -176,6 +234,7 @@ class Optimizer(object):
                 state_dict = adam.state_dict()
 
         '''
+        self._sync_multi_tensor_groups()
         state_dict = {}
         for k, v in self._accumulators.items():
             for para_name, var_tmp in v.items():
@@ -596,6 +655,9 @@ class Optimizer(object):
         self._create_global_learning_rate()
 
         if framework.in_dygraph_mode():
+            if self._use_multi_tensor:
+                parameters_and_grads = self._multi_tensor_optimize(
+                    target_block, parameters_and_grads)
             for param_and_grad in parameters_and_grads:
                 if param_and_grad[1] is None:
                     continue
@@ -624,6 +686,99 @@ class Optimizer(object):
     def _append_dgc_ops(self, param_and_grad):
         pass
 
+    # the accumulators of a group which are coalesced into flat buffers,
+    # and those of shape [1] shared by the whole group, e.g. beta pows,
+    # of which the ones of the first parameter are used
+    _multi_tensor_acc_strs = []
+    _multi_tensor_shared_acc_strs = []
+
+    def _append_multi_tensor_optimize_op(self, block, param, grad, lr,
+                                         accumulators, first_param):
+        """ append the optimize operator updating the flat `param` of a
+            group with `accumulators` as a dict of the flat accumulators
+        """
+        raise NotImplementedError(
+            "Optimizer {} does not support multi-tensor mode".format(
+                self.__class__.__name__))
+
+    def _get_multi_tensor_groups(self, parameters_and_grads):
+        fused_params = []
+        for param, grad in parameters_and_grads:
+            if grad is None or not param.trainable or grad._is_sparse():
+                continue
+            # parameters with their own learning rate, either a float or a
+            # Variable, are updated one by one
+            param_lr = param.optimize_attr['learning_rate']
+            if isinstance(param_lr, (Variable, core.VarBase)) or \
+                    param_lr != 1.0:
+                continue
+            fused_params.append(param)
+
+        key = tuple(param.name for param in fused_params)
+        groups = self._multi_tensor_groups.get(key, None)
+        if groups is None:
+            # the shared accumulators of the old groups are synchronized
+            # before the parameters are grouped differently
+            self._sync_multi_tensor_groups()
+            params_by_dtype = OrderedDict()
+            for param in fused_params:
+                params_by_dtype.setdefault(param.dtype, []).append(param)
+            groups = [
+                _MultiTensorGroup(params)
+                for params in params_by_dtype.values()
+            ]
+            self._multi_tensor_groups = {key: groups}
+        return groups
+
+    @framework.dygraph_only
+    @no_grad
+    def _multi_tensor_optimize(self, block, parameters_and_grads):
+        """
+        Update the dense parameters with one optimize op per group, and
+        return the (parameter, gradient) pairs left to be updated one by
+        one.
+        """
+        groups = self._get_multi_tensor_groups(parameters_and_grads)
+        grads = dict((param.name, grad)
+                     for param, grad in parameters_and_grads)
+        fused_names = set()
+        for group in groups:
+            params = group.params
+            flat_param = group.coalesce('param', params)
+            flat_grad = group.coalesce(
+                'grad', [grads[param.name] for param in params])
+            accumulators = {}
+            for acc_str in self._multi_tensor_acc_strs:
+                accumulators[acc_str] = group.coalesce(
+                    acc_str,
+                    [self._get_accumulator(acc_str, param) for param in params])
+            lr = self._create_param_lr((params[0], None))
+            self._append_multi_tensor_optimize_op(
+                block, flat_param, flat_grad, lr, accumulators, params[0])
+            fused_names.update(param.name for param in params)
+
+        return [(param, grad) for param, grad in parameters_and_grads
+                if param.name not in fused_names]
+
+    @framework.dygraph_only
+    @no_grad
+    def _sync_multi_tensor_groups(self):
+        # copy the shared accumulators of the first parameter of every
+        # group to the other parameters, so that they are saved correctly
+        for groups in self._multi_tensor_groups.values():
+            for group in groups:
+                first_param = group.params[0]
+                for acc_str in self._multi_tensor_shared_acc_strs:
+                    first_acc = self._get_accumulator(acc_str, first_param)
+                    for param in group.params[1:]:
+                        framework._dygraph_tracer().trace_op(
+                            type='assign',
+                            inputs={'X': first_acc},
+                            outputs={
+                                'Out': self._get_accumulator(acc_str, param)
+                            },
+                            attrs={})
+
     def backward(self,
                  loss,
                  startup_program=None,
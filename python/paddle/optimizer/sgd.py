@@ -45,6 +45,9 @@ class SGD(Optimizer):
             some derived class of ``GradientClipBase`` . There are three cliping strategies
             ( :ref:`api_fluid_clip_GradientClipByGlobalNorm` , :ref:`api_fluid_clip_GradientClipByNorm` ,
             :ref:`api_fluid_clip_GradientClipByValue` ). Default None, meaning there is no gradient clipping.
+        use_multi_tensor (bool, optional): Whether to update the dense parameters of the same dtype
+            together in dygraph mode, their parameters, gradients and accumulators are coalesced into
+            flat buffers and each group is updated by one optimize operator. Default False.
         name (str, optional): The default value is None. Normally there is no need for user
                 to set this property. For more information, please refer to
                 :ref:`api_guide_Name` . 
@@ -74,7 +77,8 @@ class SGD(Optimizer):
                  parameters=None,
                  weight_decay=None,
                  grad_clip=None,
-                 name=None):
+                 name=None,
+                 use_multi_tensor=False):
         if learning_rate is None:
             raise ValueError("learning_rate is not set")
         super(SGD, self).__init__(
@@ -84,6 +88,7 @@ class SGD(Optimizer):
             grad_clip=grad_clip,
             name=name)
         self.type = "sgd"
+        self._use_multi_tensor = use_multi_tensor
 
     @no_grad
     def _append_optimize_op(self, block, param_and_grad):
@@ -106,3 +111,7 @@ class SGD(Optimizer):
             stop_gradient=True)
 
         return sgd_op
+
+    def _append_multi_tensor_optimize_op(self, block, param, grad, lr,
+                                         accumulators, first_param):
+        core.ops.sgd(param, lr, grad, param)
@@ -17,21 +17,34 @@ __all__ = [
     'ComposeNotAligned', 'firstn', 'xmap_readers', 'multiprocess_reader'
 ]
 
+import threading
 from threading import Thread
+import os
+import shutil
+import tempfile
 import subprocess
 import multiprocessing
 import six
 import sys
 
-from six.moves.queue import Queue
+from six.moves.queue import Queue, Empty, Full
 from six.moves import zip_longest
 from six.moves import map
 from six.moves import zip
+from six.moves import cPickle as pickle
 import itertools
 import random
+import time
+import traceback
 import zlib
+import numpy as np
 import paddle.compat as cpt
 
+try:
+    from multiprocessing import shared_memory, resource_tracker
+except ImportError:
+    shared_memory = None
+
 # On macOS, the 'spawn' start method is now the default in Python3.8 multiprocessing,
 # Paddle is currently unable to solve this, so forces the process to start using 
 # the 'fork' start method.
@@ -47,6 +60,13 @@ if sys.version_info >= (3, 8) and sys.platform == 'darwin':
 else:
     fork_context = multiprocessing
 
+# numpy arrays smaller than this are pickled directly by xmap_readers
+XMAP_SHM_MIN_BYTES = 1 << 16
+# seconds to wait for the processes of xmap_readers to exit before killing
+XMAP_STOP_TIMEOUT = 5
+# the max number of run files opened at once by the global shuffle
+GLOBAL_SHUFFLE_MAX_RUNS = 64
+
 
 def cache(reader):
     """
@@ -130,7 +150,167 @@ def map_readers(func, *readers):
     return reader
 
 
-def shuffle(reader, buf_size):
+def _block_shuffle(samples, buf_size):
+    buf = []
+    for e in samples:
+        buf.append(e)
+        if len(buf) >= buf_size:
+            random.shuffle(buf)
+            for b in buf:
+                yield b
+            buf = []
+
+    if len(buf) > 0:
+        random.shuffle(buf)
+        for b in buf:
+            yield b
+
+
+def _window_shuffle(samples, buf_size):
+    # keep the buffer full, and emit a random sample of the buffer for
+    # every incoming sample, which is replaced by the incoming one
+    if buf_size <= 0:
+        for e in samples:
+            yield e
+        return
+
+    buf = []
+    for e in samples:
+        if len(buf) < buf_size:
+            buf.append(e)
+            continue
+        idx = random.randrange(buf_size)
+        yield buf[idx]
+        buf[idx] = e
+
+    random.shuffle(buf)
+    for b in buf:
+        yield b
+
+
+class _RemainsTree(object):
+    """
+    A Fenwick tree of the remaining samples of runs, to pick a run with
+    probability proportional to its remaining samples in O(log(runs)).
+    """
+
+    def __init__(self, remains):
+        self._size = len(remains)
+        self._tree = [0] * (self._size + 1)
+        self.total = 0
+        for idx, remain in enumerate(remains):
+            self._add(idx, remain)
+
+    def _add(self, idx, delta):
+        self.total += delta
+        idx += 1
+        while idx <= self._size:
+            self._tree[idx] += delta
+            idx += idx & -idx
+
+    def pop(self):
+        # find the run holding the r-th remaining sample, and take it
+        r = random.randrange(self.total)
+        idx = 0
+        step = 1 << self._size.bit_length()
+        while step > 0:
+            if idx + step <= self._size and self._tree[idx + step] <= r:
+                idx += step
+                r -= self._tree[idx]
+            step >>= 1
+        self._add(idx, -1)
+        return idx
+
+
+def _merge_runs(run_files, run_sizes):
+    runs = [open(path, 'rb') for path in run_files]
+    remains = _RemainsTree(run_sizes)
+    try:
+        while remains.total > 0:
+            yield pickle.load(runs[remains.pop()])
+    finally:
+        for f in runs:
+            f.close()
+
+
+def _global_shuffle(samples, buf_size, spill_dir=None):
+    # shuffle every `buf_size` samples as a run and spill it to disk, then
+    # merge runs by picking a run with probability proportional to its
+    # remaining samples, which gives a uniform permutation of all samples.
+    # At most GLOBAL_SHUFFLE_MAX_RUNS runs are opened at once, more runs are
+    # merged into larger runs on disk first, which keeps the permutation
+    # uniform.
+    buf = []
+    run_files = []
+    run_sizes = []
+    tmp_dir = None
+
+    def _spill(samples):
+        fd, path = tempfile.mkstemp(suffix='.run', dir=tmp_dir)
+        size = 0
+        with os.fdopen(fd, 'wb') as f:
+            for b in samples:
+                pickle.dump(b, f, pickle.HIGHEST_PROTOCOL)
+                size += 1
+        run_files.append(path)
+        run_sizes.append(size)
+
+    try:
+        for e in samples:
+            buf.append(e)
+            if len(buf) >= max(buf_size, 1):
+                if tmp_dir is None:
+                    tmp_dir = tempfile.mkdtemp(
+                        prefix='paddle_shuffle_', dir=spill_dir)
+                random.shuffle(buf)
+                _spill(buf)
+                buf = []
+
+        if len(run_files) == 0:
+            # all samples fit in memory
+            random.shuffle(buf)
+            for b in buf:
+                yield b
+            return
+        if len(buf) > 0:
+            random.shuffle(buf)
+            _spill(buf)
+            buf = []
+
+        while len(run_files) > GLOBAL_SHUFFLE_MAX_RUNS:
+            files = run_files[:GLOBAL_SHUFFLE_MAX_RUNS]
+            sizes = run_sizes[:GLOBAL_SHUFFLE_MAX_RUNS]
+            del run_files[:GLOBAL_SHUFFLE_MAX_RUNS]
+            del run_sizes[:GLOBAL_SHUFFLE_MAX_RUNS]
+            _spill(_merge_runs(files, sizes))
+            for path in files:
+                os.remove(path)
+
+        for b in _merge_runs(run_files, run_sizes):
+            yield b
+    finally:
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+SHUFFLE_MODES = ('block', 'window', 'global')
+
+
+def _check_shuffle_mode(mode):
+    if mode not in SHUFFLE_MODES:
+        raise ValueError("shuffle mode should be one of {}, but got {}".format(
+            SHUFFLE_MODES, mode))
+
+
+def _shuffle_samples(samples, buf_size, mode, spill_dir=None):
+    if mode == 'window':
+        return _window_shuffle(samples, buf_size)
+    if mode == 'global':
+        return _global_shuffle(samples, buf_size, spill_dir)
+    return _block_shuffle(samples, buf_size)
+
+
+def shuffle(reader, buf_size, mode='block', spill_dir=None):
     """
     paddle.fluid.io.shuffle ( :ref:`api_fluid_io_shuffle` ) is recommended to use,
     and paddle.reader.shuffle is an alias.
@@ -139,10 +319,25 @@ def shuffle(reader, buf_size):
 
     The output data from the origin reader will be saved into a buffer, 
     and then shuffle the data. The size of buffer is determined by argument buf_size.
+    How the buffer is used is determined by argument mode:
+
+    - 'block': fill the buffer, shuffle it and output all the data in it
+      before refilling.
+    - 'window': keep the buffer full, and output a random data in the buffer
+      for every input data, the output latency is constant and the order of
+      output data is not blocky.
+    - 'global': shuffle every buf_size data and spill them to a file in
+      spill_dir, then merge these files randomly, which shuffles all the
+      data of the reader with only buf_size data in memory. Data should be
+      picklable.
  
     Args:
         reader(callable): the original reader whose data will be shuffled.
         buf_size(int): the size of shuffled buffer.
+        mode(str): the shuffle mode, 'block', 'window' or 'global'.
+            Default 'block'.
+        spill_dir(str): the directory to spill data in 'global' mode.
+            Default None, the system temporary directory.
 
     Returns:
         callable: a decorated reader.
@@ -160,21 +355,11 @@ def shuffle(reader, buf_size):
                 print(e)
             # outputs are 0~4 unordered arrangement
     """
+    _check_shuffle_mode(mode)
 
     def data_reader():
-        buf = []
-        for e in reader():
-            buf.append(e)
-            if len(buf) >= buf_size:
-                random.shuffle(buf)
-                for b in buf:
-                    yield b
-                buf = []
-
-        if len(buf) > 0:
-            random.shuffle(buf)
-            for b in buf:
-                yield b
+        for e in _shuffle_samples(reader(), buf_size, mode, spill_dir):
+            yield e
 
     return data_reader
 
@@ -408,96 +593,306 @@ class XmapEndSignal():
     pass
 
 
-def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
+class _XmapError(object):
+    def __init__(self, exc_info):
+        self.exc_info = exc_info
+
+
+class _XmapSharedArray(object):
+    def __init__(self, name, shape, dtype):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+
+def _xmap_to_shared_memory(data):
+    # move large numpy arrays into shared memory blocks, only the block
+    # name is pickled and sent through the queue
+    if isinstance(data, np.ndarray) and data.nbytes >= XMAP_SHM_MIN_BYTES:
+        shm = shared_memory.SharedMemory(create=True, size=data.nbytes)
+        array = np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)
+        array[...] = data
+        del array
+        # NOTE: the block is unlinked by the receiver process, do not let
+        #       the resource tracker of this process track it
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        shm.close()
+        return _XmapSharedArray(shm.name, data.shape, data.dtype.str)
+    if type(data) in (list, tuple):
+        return type(data)(_xmap_to_shared_memory(d) for d in data)
+    return data
+
+
+def _xmap_from_shared_memory(data):
+    if isinstance(data, _XmapSharedArray):
+        shm = shared_memory.SharedMemory(name=data.name)
+        try:
+            array = np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)
+            result = array.copy()
+            del array
+        finally:
+            shm.close()
+            shm.unlink()
+        return result
+    if type(data) in (list, tuple):
+        return type(data)(_xmap_from_shared_memory(d) for d in data)
+    return data
+
+
+def _xmap_unlink_shared_memory(data):
+    # release the blocks of a mapped sample which will never be received
+    if isinstance(data, _XmapSharedArray):
+        try:
+            shm = shared_memory.SharedMemory(name=data.name)
+        except FileNotFoundError:
+            return
+        shm.close()
+        shm.unlink()
+    elif type(data) in (list, tuple):
+        for d in data:
+            _xmap_unlink_shared_memory(d)
+
+
+def _xmap_handle_worker(in_queue,
+                        out_queue,
+                        mapper,
+                        use_shared_memory,
+                        stop_event=None):
+    ins = in_queue.get()
+    while not isinstance(ins, XmapEndSignal):
+        if stop_event is not None and stop_event.is_set():
+            return
+        order, sample = ins
+        try:
+            r = mapper(sample)
+            if use_shared_memory:
+                r = _xmap_to_shared_memory(r)
+        except Exception:
+            r = _XmapError(traceback.format_exc())
+        out_queue.put((order, r))
+        ins = in_queue.get()
+    in_queue.put(ins)
+    out_queue.put(ins)
+
+
+class _XmapStats(object):
+    """
+    Backpressure statistics of a xmap reader.
+
+    - reader_blocked_time: seconds the source reader spent putting samples
+      into the full input queue, large value means mappers are slower
+      than the source reader.
+    - consumer_wait_time: seconds the consumer spent waiting for mapped
+      samples, large value means mappers or the source reader are slower
+      than the consumer.
+    - max_reorder_buffer: the max number of mapped samples buffered to
+      keep the order, only used when :code:`order=True`.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.samples = 0
+        self.reader_blocked_time = 0.0
+        self.consumer_wait_time = 0.0
+        self.max_reorder_buffer = 0
+
+    def summary(self):
+        return {
+            'samples': self.samples,
+            'reader_blocked_time': self.reader_blocked_time,
+            'consumer_wait_time': self.consumer_wait_time,
+            'max_reorder_buffer': self.max_reorder_buffer,
+        }
+
+
+def _xmap_stop_workers(workers, in_queue, out_queue, stop_event,
+                       use_shared_memory):
+    def drain(timeout):
+        try:
+            ins = out_queue.get(timeout=timeout)
+        except Empty:
+            return False
+        if use_shared_memory and not isinstance(ins, XmapEndSignal):
+            _xmap_unlink_shared_memory(ins[1])
+        return True
+
+    # NOTE: let the workers exit after their current sample, and keep the
+    #       out_queue drained meanwhile, so that no worker is killed between
+    #       creating a shared memory block and putting it into the queue
+    stop_event.set()
+    # wake up the workers waiting for samples
+    for _ in workers:
+        try:
+            in_queue.put_nowait(XmapEndSignal())
+        except Full:
+            break
+    deadline = time.time() + XMAP_STOP_TIMEOUT
+    while any(w.is_alive() for w in workers) and time.time() < deadline:
+        drain(0.01)
+    for w in workers:
+        if w.is_alive():
+            w.terminate()
+        w.join()
+    while drain(0.01):
+        pass
+
+
+def xmap_readers(mapper,
+                 reader,
+                 process_num,
+                 buffer_size,
+                 order=False,
+                 use_process=False,
+                 use_shared_memory=True):
     """
-    Use multi-threads to map samples from reader by a mapper defined by user.
+    Use multi-threads or multi-processes to map samples from reader by a
+    mapper defined by user.
 
     Args:
         mapper (callable): a function to map the data from reader.
         reader (callable): a data reader which yields the data. 
-        process_num (int): thread number to handle original sample.
+        process_num (int): thread or process number to handle original sample.
         buffer_size (int): size of the queue to read data in. 
-        order (bool): whether to keep the data order from original reader. 
+        order (bool): whether to keep the data order from original reader,
+            at most :attr:`buffer_size` samples are read ahead of the
+            consumer to keep the order. Default False.
+        use_process (bool): whether to map samples in processes instead of
+            threads, which is useful for CPU-bound mappers. Processes are
+            started by fork, so it is not supported on Windows.
             Default False.
+        use_shared_memory (bool): whether to move large numpy arrays in
+            mapped samples back from processes through shared memory
+            instead of pickling through pipes, only effective when
+            :attr:`use_process` is True and :code:`multiprocessing.shared_memory`
+            is available (Python 3.8+). Default True.
 
     Returns:
-        callable: a decorated reader with data mapping. 
+        callable: a decorated reader with data mapping. Backpressure
+        statistics of the last pass can be got by calling the :code:`stats`
+        attribute of it, which returns a dict with keys 'samples',
+        'reader_blocked_time', 'consumer_wait_time' and 'max_reorder_buffer'.
+
+    Examples:
+        .. code-block:: python
+
+            import paddle
+
+            def reader():
+                for i in range(10):
+                    yield i
+
+            def mapper(x):
+                return x * 2
+
+            xreader = paddle.reader.xmap_readers(
+                mapper, reader, process_num=2, buffer_size=4, order=True)
+
+            # Output: 0 2 4 ... 18
+            for i in xreader():
+                print(i)
+            print(xreader.stats())
     """
-    end = XmapEndSignal()
+    if use_process and sys.platform == 'win32':
+        raise NotImplementedError(
+            "xmap_readers with use_process=True is not supported on windows.")
 
-    # define a worker to read samples from reader to in_queue
-    def read_worker(reader, in_queue):
-        for i in reader():
-            in_queue.put(i)
-        in_queue.put(end)
+    end = XmapEndSignal()
+    stats = _XmapStats()
+    use_shared_memory = use_process and use_shared_memory and \
+            shared_memory is not None
 
     # define a worker to read samples from reader to in_queue with order flag
-    def order_read_worker(reader, in_queue):
+    def read_worker(reader, in_queue, out_queue, in_flight):
         in_order = 0
-        for i in reader():
-            in_queue.put((in_order, i))
-            in_order += 1
-        in_queue.put(end)
-
-    # define a worker to handle samples from in_queue by mapper
-    # and put mapped samples into out_queue
-    def handle_worker(in_queue, out_queue, mapper):
-        sample = in_queue.get()
-        while not isinstance(sample, XmapEndSignal):
-            r = mapper(sample)
-            out_queue.put(r)
-            sample = in_queue.get()
-        in_queue.put(end)
-        out_queue.put(end)
-
-    # define a worker to handle samples from in_queue by mapper
-    # and put mapped samples into out_queue by order
-    def order_handle_worker(in_queue, out_queue, mapper, out_order):
-        ins = in_queue.get()
-        while not isinstance(ins, XmapEndSignal):
-            order, sample = ins
-            r = mapper(sample)
-            while order != out_order[0]:
-                pass
-            out_queue.put(r)
-            out_order[0] += 1
-            ins = in_queue.get()
+        try:
+            for i in reader():
+                start = time.time()
+                if in_flight is not None:
+                    in_flight.acquire()
+                in_queue.put((in_order, i))
+                stats.reader_blocked_time += time.time() - start
+                in_order += 1
+        except Exception:
+            out_queue.put((-1, _XmapError(traceback.format_exc())))
         in_queue.put(end)
-        out_queue.put(end)
 
     def xreader():
-        in_queue = Queue(buffer_size)
-        out_queue = Queue(buffer_size)
-        out_order = [0]
-        # start a read worker in a thread
-        target = order_read_worker if order else read_worker
-        t = Thread(target=target, args=(reader, in_queue))
-        t.daemon = True
-        t.start()
-        # start several handle_workers
-        target = order_handle_worker if order else handle_worker
-        args = (in_queue, out_queue, mapper, out_order) if order else (
-            in_queue, out_queue, mapper)
+        stats.reset()
+        if use_process:
+            in_queue = fork_context.Queue(buffer_size)
+            out_queue = fork_context.Queue(buffer_size)
+        else:
+            in_queue = Queue(buffer_size)
+            out_queue = Queue(buffer_size)
+        # NOTE: when order is True, the samples read but not yielded yet are
+        #       limited to buffer_size, which bounds the reorder buffer
+        in_flight = threading.BoundedSemaphore(buffer_size) if order else None
+        stop_event = fork_context.Event() if use_process else None
+        # start several handle_workers, before starting the read worker
+        # thread, so that processes are not forked with running threads
+        args = (in_queue, out_queue, mapper, use_shared_memory, stop_event)
         workers = []
         for i in range(process_num):
-            worker = Thread(target=target, args=args)
+            if use_process:
+                worker = fork_context.Process(
+                    target=_xmap_handle_worker, args=args)
+            else:
+                worker = Thread(target=_xmap_handle_worker, args=args)
             worker.daemon = True
             workers.append(worker)
         for w in workers:
             w.start()
+        # start a read worker in a thread
+        t = Thread(
+            target=read_worker, args=(reader, in_queue, out_queue, in_flight))
+        t.daemon = True
+        t.start()
 
-        sample = out_queue.get()
-        while not isinstance(sample, XmapEndSignal):
-            yield sample
-            sample = out_queue.get()
-        finish = 1
-        while finish < process_num:
-            sample = out_queue.get()
-            if isinstance(sample, XmapEndSignal):
-                finish += 1
-            else:
-                yield sample
+        # NOTE: mapped samples may arrive out of order, keep them in a
+        #       reorder buffer until all previous samples arrived when
+        #       order is True, instead of making workers wait in turn
+        reorder_buffer = {}
+        out_order = 0
+        finish = 0
+        try:
+            while finish < process_num:
+                start = time.time()
+                ins = out_queue.get()
+                stats.consumer_wait_time += time.time() - start
+                if isinstance(ins, XmapEndSignal):
+                    finish += 1
+                    continue
+
+                order_id, sample = ins
+                if isinstance(sample, _XmapError):
+                    raise RuntimeError(
+                        "xmap_readers raises an exception:\n{}".format(
+                            sample.exc_info))
+                if use_shared_memory:
+                    sample = _xmap_from_shared_memory(sample)
+
+                if not order:
+                    stats.samples += 1
+                    yield sample
+                    continue
+
+                reorder_buffer[order_id] = sample
+                stats.max_reorder_buffer = max(stats.max_reorder_buffer,
+                                               len(reorder_buffer))
+                while out_order in reorder_buffer:
+                    sample = reorder_buffer.pop(out_order)
+                    out_order += 1
+                    stats.samples += 1
+                    in_flight.release()
+                    yield sample
+        finally:
+            if use_process:
+                _xmap_stop_workers(workers, in_queue, out_queue, stop_event,
+                                   use_shared_memory)
 
+    xreader.stats = stats.summary
     return xreader
 
 
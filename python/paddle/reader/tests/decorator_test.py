@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import sys
 import time
+import shutil
+import tempfile
 import unittest
 import functools
+import numpy as np
 
 import paddle.reader
 
@@ -123,6 +127,70 @@ class TestShuffle(unittest.TestCase):
                 total += 1
             self.assertEqual(total, 10)
 
+    def test_shuffle_modes(self):
+        def reader():
+            for i in range(100):
+                yield [i, np.array([i])]
+
+        for mode in ('block', 'window', 'global'):
+            for size in (0, 1, 10, 100, 1000):
+                s = paddle.reader.shuffle(reader, size, mode=mode)
+                result = [e[0] for e in s()]
+                self.assertEqual(sorted(result), list(range(100)))
+                if size <= 1 and mode != 'global':
+                    self.assertEqual(result, list(range(100)))
+
+        with self.assertRaises(ValueError):
+            paddle.reader.shuffle(reader, 10, mode='unknown')
+
+    def test_window_shuffle_latency(self):
+        # window shuffle outputs a sample for every input sample once
+        # the buffer is full
+        consumed = []
+
+        def reader():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        s = paddle.reader.shuffle(reader, 10, mode='window')
+        for idx, e in enumerate(s()):
+            if idx >= 90:
+                break
+            self.assertEqual(len(consumed), idx + 11)
+
+    def test_global_shuffle_spill(self):
+        spill_dir = tempfile.mkdtemp()
+        try:
+            s = paddle.reader.shuffle(
+                reader_creator_10(0), 3, mode='global', spill_dir=spill_dir)
+            self.assertEqual(sorted(s()), list(range(10)))
+            # spilled files are removed after reading
+            self.assertEqual(os.listdir(spill_dir), [])
+        finally:
+            shutil.rmtree(spill_dir)
+
+    def test_global_shuffle_multi_level_merge(self):
+        spill_dir = tempfile.mkdtemp()
+        max_runs = paddle.reader.decorator.GLOBAL_SHUFFLE_MAX_RUNS
+        try:
+            # the 34 runs are merged on disk two at a time
+            paddle.reader.decorator.GLOBAL_SHUFFLE_MAX_RUNS = 2
+
+            def reader():
+                for i in range(100):
+                    yield i
+
+            s = paddle.reader.shuffle(
+                reader, 3, mode='global', spill_dir=spill_dir)
+            result = list(s())
+            self.assertEqual(sorted(result), list(range(100)))
+            self.assertNotEqual(result, list(range(100)))
+            self.assertEqual(os.listdir(spill_dir), [])
+        finally:
+            paddle.reader.decorator.GLOBAL_SHUFFLE_MAX_RUNS = max_runs
+            shutil.rmtree(spill_dir)
+
 
 class TestXmap(unittest.TestCase):
     def test_xmap(self):
@@ -147,6 +215,92 @@ class TestXmap(unittest.TestCase):
                         for idx, e in enumerate(result):
                             self.assertEqual(e, mapper(idx))
 
+    def test_xmap_process(self):
+        def mapper(x):
+            # large arrays are moved through shared memory
+            return x, np.full([128, 128], x, dtype='float32')
+
+        for order in (True, False):
+            reader = paddle.reader.xmap_readers(
+                mapper,
+                reader_creator_10(0),
+                4,
+                4,
+                order,
+                use_process=True)
+            for n in range(2):
+                result = list(reader())
+                if not order:
+                    result.sort(key=lambda x: x[0])
+                self.assertEqual(len(result), 10)
+                for idx, (e, array) in enumerate(result):
+                    self.assertEqual(e, idx)
+                    self.assertTrue(np.all(array == idx))
+                self.assertEqual(reader.stats()['samples'], 10)
+
+    def test_xmap_reorder(self):
+        def mapper(x):
+            # make earlier samples slower to reorder them
+            time.sleep(0.001 * (10 - x))
+            return x
+
+        reader = paddle.reader.xmap_readers(mapper,
+                                            reader_creator_10(0), 4, 10, True)
+        self.assertEqual(list(reader()), list(range(10)))
+        self.assertGreaterEqual(reader.stats()['max_reorder_buffer'], 1)
+
+    def test_xmap_reorder_bounded(self):
+        def mapper(x):
+            # the first sample is much slower than the others
+            if x == 0:
+                time.sleep(0.2)
+            return x
+
+        def reader():
+            for i in range(50):
+                yield i
+
+        reader = paddle.reader.xmap_readers(mapper, reader, 4, 8, True)
+        self.assertEqual(list(reader()), list(range(50)))
+        self.assertLessEqual(reader.stats()['max_reorder_buffer'], 8)
+
+    @unittest.skipIf(not os.path.isdir('/dev/shm'), "no /dev/shm")
+    def test_xmap_process_early_break(self):
+        def mapper(x):
+            return np.full([128, 128], x, dtype='float32')
+
+        def reader():
+            for i in range(100):
+                yield i
+
+        blocks = set(os.listdir('/dev/shm'))
+        for order in (True, False):
+            xreader = paddle.reader.xmap_readers(
+                mapper, reader, 4, 4, order, use_process=True)
+            for idx, array in enumerate(xreader()):
+                if idx == 3:
+                    break
+        # no shared memory block is left
+        self.assertEqual(set(os.listdir('/dev/shm')) - blocks, set())
+
+    def test_xmap_exception(self):
+        def mapper(x):
+            if x == 5:
+                raise ValueError("mapper error")
+            return x
+
+        for use_process in (False, True):
+            reader = paddle.reader.xmap_readers(
+                mapper,
+                reader_creator_10(0),
+                2,
+                2,
+                True,
+                use_process=use_process)
+            with self.assertRaises(RuntimeError):
+                for _ in reader():
+                    pass
+
 
 class TestMultiProcessReader(unittest.TestCase):
     def setup(self):
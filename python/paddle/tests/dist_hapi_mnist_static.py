@@ -37,7 +37,7 @@ class MnistDataset(MNIST):
         self.return_label = return_label
 
     def __getitem__(self, idx):
-        img = np.reshape(self.images[idx], [1, 28, 28])
+        img = np.reshape(self.images[idx], [1, 28, 28]).astype('float32')
         if self.return_label:
             return img, np.array(self.labels[idx]).astype('int64')
         return img,
@@ -12,6 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import io
+import shutil
+import tarfile
+import tempfile
 import unittest
 import numpy as np
 
@@ -46,5 +51,57 @@ class TestImdbTest(unittest.TestCase):
         self.assertTrue(int(label) in [0, 1])
 
 
+class TestImdbCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.temp_dir, 'aclImdb.tar.gz')
+        docs = {
+            'aclImdb/train/pos/0.txt': b'A good movie, a good story.\n',
+            'aclImdb/train/neg/0.txt': b'A bad movie!\n',
+            'aclImdb/train/pos/1.txt': b'good good\n',
+            'aclImdb/test/neg/0.txt': b'bad, bad story.\n',
+            'aclImdb/README': b'not a document',
+        }
+        with tarfile.open(self.data_file, 'w:gz') as tar:
+            for name, content in docs.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                tar.addfile(info, io.BytesIO(content))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def check_dataset(self, imdb):
+        self.assertEqual(len(imdb), 3)
+        unk = imdb.word_idx['<unk>']
+        # words appearing more than once, sorted by frequency
+        self.assertEqual(imdb.word_idx[b'good'], 0)
+        self.assertEqual(imdb.word_idx[b'a'], 1)
+        self.assertEqual(unk, 5)
+
+        docs = sorted(
+            (imdb[i][0].tolist(), int(imdb[i][1][0])) for i in range(3))
+        self.assertEqual(docs, [([0, 0], 0), ([1, 0, 3, 1, 0, 4], 0),
+                                ([1, 2, 3], 1)])
+        self.assertEqual(imdb[0][0].dtype, np.int64)
+
+        # compatibility attributes
+        self.assertEqual(sorted(zip(imdb.docs, imdb.labels)), docs)
+        self.assertTrue(isinstance(imdb.labels, list))
+
+    def test_cache(self):
+        cache_dir = os.path.join(self.temp_dir, 'cache')
+        imdb = Imdb(self.data_file, mode='train', cutoff=1, cache_dir=cache_dir)
+        self.check_dataset(imdb)
+        self.assertTrue(len(os.listdir(cache_dir)) > 0)
+
+        # load from cache by memory mapping
+        imdb = Imdb(self.data_file, mode='train', cutoff=1, cache_dir=cache_dir)
+        self.assertTrue(isinstance(imdb.doc_ids, np.memmap))
+        self.check_dataset(imdb)
+
+        self.check_dataset(Imdb(self.data_file, mode='train', cutoff=1))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import unittest
 import os
+import tarfile
 import numpy as np
 import tempfile
 import shutil
@@ -99,5 +101,50 @@ class TestWMT14Gen(unittest.TestCase):
         self.assertTrue(len(data[2].shape) == 1)
 
 
+class TestWMT14Cache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.temp_dir, 'wmt14.tgz')
+        files = {
+            'wmt14/src.dict': b'<s>\n<e>\n<unk>\nhello\nworld\n',
+            'wmt14/trg.dict': b'<s>\n<e>\n<unk>\nbonjour\nmonde\n',
+            'wmt14/train/train':
+            b'hello world\tbonjour monde\nhello there\tbonjour\nbad line\n',
+        }
+        with tarfile.open(self.data_file, 'w:gz') as tar:
+            for name, content in files.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                tar.addfile(info, io.BytesIO(content))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def check_dataset(self, wmt14):
+        self.assertEqual(len(wmt14), 2)
+        src_ids, trg_ids, trg_ids_next = wmt14[0]
+        self.assertEqual(src_ids.tolist(), [0, 3, 4, 1])
+        self.assertEqual(trg_ids.tolist(), [0, 3, 4])
+        self.assertEqual(trg_ids_next.tolist(), [3, 4, 1])
+        src_ids, trg_ids, trg_ids_next = wmt14[1]
+        self.assertEqual(src_ids.tolist(), [0, 3, 2, 1])
+        self.assertEqual(trg_ids.tolist(), [0, 3])
+        self.assertEqual(trg_ids_next.tolist(), [3, 1])
+
+        src_dict, trg_dict = wmt14.get_dict()
+        self.assertEqual(src_dict['world'], 4)
+        self.assertEqual(trg_dict['monde'], 4)
+
+    def test_cache(self):
+        cache_dir = os.path.join(self.temp_dir, 'cache')
+        for _ in range(2):
+            wmt14 = WMT14(
+                self.data_file, mode='train', dict_size=5, cache_dir=cache_dir)
+            self.check_dataset(wmt14)
+        self.assertTrue(isinstance(wmt14._src_ids, np.memmap))
+
+        self.check_dataset(WMT14(self.data_file, mode='train', dict_size=5))
+
+
 if __name__ == '__main__':
     unittest.main()
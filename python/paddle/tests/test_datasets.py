@@ -14,10 +14,17 @@
 
 import unittest
 import os
+import gzip
+import struct
+import tarfile
 import numpy as np
 import tempfile
 import shutil
 import cv2
+import six
+from six.moves import cPickle as pickle
+
+from paddle.vision.datasets.archive import TarArchive
 
 from paddle.vision.datasets import *
 from paddle.dataset.common import _check_exists_and_download
@@ -87,6 +94,163 @@ class TestFolderDatasets(unittest.TestCase):
             _check_exists_and_download('temp_paddle', None, None, None, False)
 
 
+class TestMNISTCache(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.data_dir, 'cache')
+        self.images = np.random.randint(
+            0, 256, size=(10, 28 * 28)).astype('uint8')
+        self.labels = np.random.randint(0, 10, size=(10, )).astype('uint8')
+        self.image_path = os.path.join(self.data_dir, 'images.gz')
+        self.label_path = os.path.join(self.data_dir, 'labels.gz')
+        with gzip.GzipFile(self.image_path, 'wb') as f:
+            f.write(struct.pack('>IIII', 2051, 10, 28, 28))
+            f.write(self.images.tobytes())
+        with gzip.GzipFile(self.label_path, 'wb') as f:
+            f.write(struct.pack('>II', 2049, 10))
+            f.write(self.labels.tobytes())
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def check_dataset(self, mnist):
+        self.assertEqual(len(mnist), 10)
+        self.assertEqual(mnist.images.dtype, np.uint8)
+        for i in range(len(mnist)):
+            image, label = mnist[i]
+            self.assertEqual(image.dtype, np.float32)
+            self.assertTrue(
+                np.array_equal(image.reshape([-1]), self.images[i]))
+            self.assertEqual(label.shape, (1, ))
+            self.assertEqual(label[0], self.labels[i])
+
+    def test_main(self):
+        self.check_dataset(
+            MNIST(
+                image_path=self.image_path,
+                label_path=self.label_path,
+                download=False))
+
+    def test_cache(self):
+        for _ in range(2):
+            mnist = MNIST(
+                image_path=self.image_path,
+                label_path=self.label_path,
+                download=False,
+                cache_dir=self.cache_dir)
+            self.check_dataset(mnist)
+        # loaded from cache by memory mapping
+        self.assertTrue(isinstance(mnist.images, np.memmap))
+
+
+class TestCifar10Cache(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.data_dir, 'cifar.tar.gz')
+        self.images = np.random.randint(
+            0, 256, size=(6, 3072)).astype('uint8')
+        self.labels = np.random.randint(0, 10, size=(6, )).tolist()
+        with tarfile.open(self.data_file, 'w:gz') as tar:
+            for i in range(2):
+                batch = {
+                    six.b('data'): self.images[i * 3:(i + 1) * 3],
+                    six.b('labels'): self.labels[i * 3:(i + 1) * 3]
+                }
+                batch_file = os.path.join(self.data_dir,
+                                          'data_batch_{}'.format(i))
+                with open(batch_file, 'wb') as f:
+                    pickle.dump(batch, f, protocol=2)
+                tar.add(batch_file, arcname='cifar/data_batch_{}'.format(i))
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_cache(self):
+        for _ in range(2):
+            cifar = Cifar10(
+                data_file=self.data_file,
+                mode='train',
+                download=False,
+                cache_dir=self.data_dir)
+            self.assertEqual(len(cifar), 6)
+            for i in range(len(cifar)):
+                image, label = cifar[i]
+                self.assertEqual(image.shape, (3, 32, 32))
+                self.assertTrue(
+                    np.array_equal(image.reshape([-1]), self.images[i]))
+                self.assertEqual(int(label), self.labels[i])
+        self.assertTrue(isinstance(cifar.images, np.memmap))
+
+
+class TestTarArchive(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.data_dir, 'cache')
+        self.contents = {}
+        for i in range(5):
+            name = 'file_{}.bin'.format(i)
+            content = np.random.bytes(np.random.randint(1, 2048))
+            with open(os.path.join(self.data_dir, name), 'wb') as f:
+                f.write(content)
+            self.contents['data/' + name] = content
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def build_archive(self, mode, suffix):
+        path = os.path.join(self.data_dir, 'archive' + suffix)
+        with tarfile.open(path, mode) as tar:
+            for name in self.contents.keys():
+                tar.add(
+                    os.path.join(self.data_dir, os.path.basename(name)),
+                    arcname=name)
+        return path
+
+    def check_archive(self, archive):
+        self.assertEqual(len(archive), len(self.contents))
+        for name, content in self.contents.items():
+            self.assertTrue(name in archive)
+            self.assertEqual(bytes(archive.read(name)), content)
+        with self.assertRaises(KeyError):
+            archive.read('not_exists')
+
+    def test_main(self):
+        for mode, suffix in [('w', '.tar'), ('w:gz', '.tgz'),
+                             ('w:bz2', '.tar.bz2')]:
+            path = self.build_archive(mode, suffix)
+            for use_mmap in [False, True]:
+                # the index is built at first, and loaded from cache later
+                for _ in range(2):
+                    archive = TarArchive(
+                        path, cache_dir=self.cache_dir, use_mmap=use_mmap)
+                    self.check_archive(archive)
+                    archive.close()
+            self.assertTrue(
+                os.path.exists(
+                    os.path.join(self.cache_dir, os.path.basename(path) +
+                                 '.offsets.npy')))
+
+    def test_no_cache(self):
+        for mode, suffix in [('w', '.tar'), ('w:gz', '.tgz'),
+                             ('w:bz2', '.tar.bz2')]:
+            path = self.build_archive(mode, suffix)
+            files = set(os.listdir(self.data_dir))
+            archive = TarArchive(path)
+            self.check_archive(archive)
+            archive = pickle.loads(pickle.dumps(archive))
+            self.check_archive(archive)
+            archive.close()
+            # nothing is written next to the archive
+            self.assertEqual(set(os.listdir(self.data_dir)), files)
+
+    def test_pickle(self):
+        path = self.build_archive('w', '.tar')
+        archive = TarArchive(path, cache_dir=self.cache_dir)
+        self.check_archive(archive)
+        archive = pickle.loads(pickle.dumps(archive))
+        self.check_archive(archive)
+
+
 class TestMNISTTest(unittest.TestCase):
     def test_main(self):
         mnist = MNIST(mode='test')
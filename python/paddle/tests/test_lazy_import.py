@@ -0,0 +1,71 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import os
+import sys
+import unittest
+import subprocess
+
+from paddle.utils.lazy_import import LazyModule
+
+LAZY_MODULES = ['paddle.vision', 'paddle.text', 'paddle.hapi']
+
+
+def run_code(code, lazy=True):
+    env = dict(os.environ)
+    env['PADDLE_LAZY_IMPORT'] = '1' if lazy else '0'
+    output = subprocess.check_output([sys.executable, '-c', code], env=env)
+    return output.decode().strip().splitlines()[-1]
+
+
+class TestLazyModule(unittest.TestCase):
+    def test_load_on_access(self):
+        namespace = {}
+        namespace['json'] = LazyModule('json', namespace, 'json')
+        self.assertTrue(isinstance(namespace['json'], LazyModule))
+        self.assertEqual(namespace['json'].dumps([1]), '[1]')
+        # the proxy is replaced by the module after the first access
+        self.assertFalse(isinstance(namespace['json'], LazyModule))
+        self.assertTrue(namespace['json'] is sys.modules['json'])
+
+
+# NOTE: paddle.hapi is imported eagerly before Python 3.7, which has no
+#       module level __getattr__ to load paddle.Model lazily
+@unittest.skipIf(sys.version_info < (3, 7), "requires Python 3.7+")
+class TestLazyImportPaddle(unittest.TestCase):
+    def imported_modules(self, stmt="pass", lazy=True):
+        code = "import sys, paddle; {}; print([m for m in {} if m in " \
+               "sys.modules])".format(stmt, LAZY_MODULES)
+        return run_code(code, lazy)
+
+    def test_not_imported(self):
+        self.assertEqual(self.imported_modules(), '[]')
+
+    def test_import_on_access(self):
+        stmt = "paddle.vision.models; paddle.text.datasets"
+        self.assertEqual(
+            self.imported_modules(stmt), str(['paddle.vision', 'paddle.text']))
+
+        code = "import paddle; print(paddle.Model is paddle.hapi.Model)"
+        self.assertEqual(run_code(code), 'True')
+
+    def test_eager_import(self):
+        self.assertEqual(
+            self.imported_modules(lazy=False), str(LAZY_MODULES))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -270,6 +270,72 @@ class TestAuc(unittest.TestCase):
 
         paddle.enable_static()
 
+    def loop_auc(self, preds, labels, num_thresholds):
+        # the reference implementation accumulating bucket by bucket
+        stat_pos = np.zeros(num_thresholds + 1)
+        stat_neg = np.zeros(num_thresholds + 1)
+        for i, lbl in enumerate(labels):
+            bin_idx = int(preds[i, 1] * num_thresholds)
+            if lbl:
+                stat_pos[bin_idx] += 1.0
+            else:
+                stat_neg[bin_idx] += 1.0
+        tot_pos, tot_neg, auc = 0.0, 0.0, 0.0
+        for idx in range(num_thresholds, -1, -1):
+            tot_pos_prev, tot_neg_prev = tot_pos, tot_neg
+            tot_pos += stat_pos[idx]
+            tot_neg += stat_neg[idx]
+            auc += abs(tot_neg - tot_neg_prev) * (tot_pos + tot_pos_prev) / 2.
+        return auc / tot_pos / tot_neg
+
+    def test_auc_merge_state(self):
+        preds = np.random.random((1000, 1))
+        preds = np.concatenate([1 - preds, preds], axis=1)
+        labels = np.random.randint(2, size=(1000, 1))
+
+        metrics = [paddle.metric.Auc(num_thresholds=255) for _ in range(4)]
+        for i, m in enumerate(metrics):
+            m.update(preds[i * 250:(i + 1) * 250], labels[i * 250:(i + 1) *
+                                                           250])
+        merged = paddle.metric.Auc(num_thresholds=255)
+        for m in metrics:
+            merged.merge_state(m.get_state())
+        self.assertAlmostEqual(merged.accumulate(),
+                               self.loop_auc(preds, labels, 255))
+
+        m = paddle.metric.Auc(num_thresholds=255)
+        m.update(preds, labels)
+        self.assertAlmostEqual(m.accumulate(), merged.accumulate())
+
+    def test_auc_pr_curve(self):
+        x = np.array([[0.1, 0.9], [0.2, 0.8], [0.7, 0.3], [0.8, 0.2]])
+        y = np.array([[1], [1], [0], [0]])
+        m = paddle.metric.Auc(curve='PR')
+        m.update(x, y)
+        # perfectly separated predictions
+        self.assertAlmostEqual(m.accumulate(), 1.0)
+
+        y = np.array([[0], [0], [1], [1]])
+        m.reset()
+        m.update(x, y)
+        self.assertLess(m.accumulate(), 0.5)
+
+        with self.assertRaises(AssertionError):
+            paddle.metric.Auc(curve='unknown')
+
+    def test_precision_recall_merge_state(self):
+        x = np.array([0.1, 0.5, 0.6, 0.7, 0.2])
+        y = np.array([1, 0, 1, 1, 1])
+        for metric_cls in [paddle.metric.Precision, paddle.metric.Recall]:
+            m = metric_cls()
+            m.update(x, y)
+            merged = metric_cls()
+            merged.merge_state(m.get_state())
+            merged.merge_state(m.get_state())
+            m.update(x, y)
+            self.assertEqual(m.get_state(), merged.get_state())
+            self.assertAlmostEqual(m.accumulate(), merged.accumulate())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -76,7 +76,7 @@ class MnistDataset(MNIST):
 
     def __getitem__(self, idx):
         img, label = self.images[idx], self.labels[idx]
-        img = np.reshape(img, [1, 28, 28])
+        img = np.reshape(img, [1, 28, 28]).astype('float32')
         if self.return_label:
             return img, np.array(self.labels[idx]).astype('int64')
         return img,
@@ -384,6 +384,44 @@ class TestModelFunction(unittest.TestCase):
             shutil.rmtree(path)
             fluid.disable_dygraph() if dynamic else None
 
+    def test_async_save_load(self):
+        path = tempfile.mkdtemp()
+        paddle.disable_static(paddle.set_device('cpu'))
+        net = MyModel()
+        inputs = [InputSpec([None, 20], 'float32', 'x')]
+        labels = [InputSpec([None, 1], 'int64', 'label')]
+        optim = fluid.optimizer.SGD(learning_rate=0.001,
+                                    parameter_list=net.parameters())
+        model = Model(net, inputs, labels)
+        model.prepare(optimizer=optim, loss=CrossEntropyLoss(reduction="sum"))
+        params = [p.numpy() for p in model.parameters()]
+        future = model.save(path + '/test', async_save=True)
+        # the parameters updated during saving are not saved
+        for p in model.parameters():
+            p.set_value(np.zeros(p.shape, dtype='float32'))
+        self.assertEqual(future.result(), [path + '/test.pdparams'])
+        self.assertTrue(future.done())
+
+        model.load(path + '/test')
+        for param, p in zip(params, model.parameters()):
+            np.testing.assert_allclose(param, p.numpy())
+
+        # the same checkpoint saved in background and then in place, the
+        # latter waits for the former and wins
+        future = model.save(path + '/test', async_save=True)
+        for p in model.parameters():
+            p.set_value(np.ones(p.shape, dtype='float32'))
+        model.save(path + '/test')
+        self.assertTrue(future.done())
+        self.assertEqual([f for f in os.listdir(path) if '.tmp' in f], [])
+        for p in model.parameters():
+            p.set_value(np.zeros(p.shape, dtype='float32'))
+        model.load(path + '/test')
+        for p in model.parameters():
+            np.testing.assert_allclose(p.numpy(), np.ones(p.shape))
+        shutil.rmtree(path)
+        paddle.enable_static()
+
     def test_dynamic_load(self):
         mnist_data = MnistDataset(mode='train')
         for new_optimizer in [True, False]:
@@ -0,0 +1,148 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+import paddle
+from paddle import Model
+from paddle.io import Dataset
+from paddle.static import InputSpec
+from paddle.nn.layer.loss import CrossEntropyLoss
+from paddle.metric import Accuracy
+from paddle.hapi.step_profiler import StepProfiler, merge_chrome_tracing
+
+
+class RandomDataset(Dataset):
+    def __init__(self, num_samples=64):
+        self.num_samples = num_samples
+
+    def __getitem__(self, idx):
+        return np.random.random([20]).astype('float32'), \
+            np.random.randint(0, 10, [1]).astype('int64')
+
+    def __len__(self):
+        return self.num_samples
+
+
+class TestStepProfiler(unittest.TestCase):
+    def setUp(self):
+        self.save_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.save_dir)
+
+    def run_steps(self, profiler, num_steps):
+        for step in range(num_steps):
+            profiler.begin_step('train', step)
+            with profiler.record('forward'):
+                pass
+            profiler.end_step()
+
+    def test_sampling(self):
+        profiler = StepProfiler(sample_freq=3, max_steps=2)
+        self.run_steps(profiler, 10)
+        # step 0, 3, 6, 9 are sampled, and the last 2 are kept
+        self.assertEqual([step['step'] for step in profiler.steps], [6, 9])
+        for step in profiler.steps:
+            self.assertEqual([event[0] for event in step['events']],
+                             ['forward'])
+
+        profiler.clear()
+        self.assertEqual(profiler.steps, [])
+        self.assertRaises(ValueError, StepProfiler, sample_freq=0)
+
+    def test_summary(self):
+        profiler = StepProfiler()
+        self.run_steps(profiler, 4)
+        lines = profiler.summary(sorted_key='calls').splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[1].startswith('step'))
+        self.assertTrue(lines[2].startswith('forward'))
+        self.assertRaises(ValueError, profiler.summary, sorted_key='name')
+
+    def test_export_and_merge(self):
+        profiler = StepProfiler()
+        self.run_steps(profiler, 2)
+        path = os.path.join(self.save_dir, 'step_trace.json')
+        profiler.export_chrome_tracing(path)
+        with open(path) as f:
+            events = json.load(f)['traceEvents']
+        self.assertEqual([event['name'] for event in events if event[
+            'ph'] == 'X'], ['train_step', 'forward', 'train_step', 'forward'])
+
+        # a timeline generated by tools/timeline.py
+        op_trace = {
+            'traceEvents': [{
+                'name': 'process_name',
+                'ph': 'M',
+                'pid': 0,
+                'args': {
+                    'name': 'trainer:cpu:0'
+                }
+            }, {
+                'name': 'mul',
+                'cat': 'Op',
+                'ph': 'X',
+                'pid': 0,
+                'tid': 0,
+                'ts': events[1]['ts'],
+                'dur': 1
+            }]
+        }
+        op_path = os.path.join(self.save_dir, 'timeline.json')
+        with open(op_path, 'w') as f:
+            json.dump(op_trace, f)
+        merged_path = os.path.join(self.save_dir, 'merged.json')
+        merge_chrome_tracing([path, op_path], merged_path)
+        with open(merged_path) as f:
+            merged = json.load(f)['traceEvents']
+        self.assertEqual(len(merged), len(events) + 2)
+        self.assertEqual(set(event['pid'] for event in merged), set([0, 1]))
+
+    def test_fit(self):
+        paddle.disable_static()
+        inputs = [InputSpec([None, 20], 'float32', 'x')]
+        labels = [InputSpec([None, 1], 'int64', 'label')]
+        net = paddle.nn.Linear(20, 10)
+        optim = paddle.optimizer.SGD(learning_rate=0.001,
+                                     parameters=net.parameters())
+        model = Model(net, inputs, labels)
+        model.prepare(optim, CrossEntropyLoss(), Accuracy())
+
+        profiler = StepProfiler(sample_freq=2)
+        model.set_step_profiler(profiler)
+        model.fit(RandomDataset(), batch_size=16, epochs=1, verbose=0)
+        self.assertEqual(len(profiler.steps), 2)
+        names = set(event[0] for event in profiler.steps[0]['events'])
+        for name in [
+                'data', 'flatten', 'train_batch', 'feed', 'forward',
+                'backward', 'optimizer', 'update:Accuracy',
+                'accumulate:Accuracy', 'ModelCheckpoint.on_train_batch_end'
+        ]:
+            self.assertIn(name, names)
+
+        model.set_step_profiler(None)
+        self.assertRaises(TypeError, model.set_step_profiler, 'profiler')
+        paddle.enable_static()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -229,6 +229,62 @@ class TestTransforms(unittest.TestCase):
             fake_img = np.random.rand(100, 120, 3).astype('float32')
             trans_gray(fake_img)
 
+    def test_batch_transforms(self):
+        fake_imgs = np.random.randint(0, 256, (4, 64, 48, 3), 'uint8')
+
+        center_crop = transforms.CenterCrop((32, 24))
+        crop_imgs = transforms.BatchCenterCrop((32, 24))(fake_imgs)
+        for img, crop_img in zip(fake_imgs, crop_imgs):
+            self.assertTrue(np.array_equal(center_crop(img), crop_img))
+
+        crop_imgs = transforms.BatchRandomCrop(32, padding=2)(fake_imgs)
+        self.assertEqual(crop_imgs.shape, (4, 32, 32, 3))
+        crop_imgs = transforms.BatchRandomCrop((64, 48))(fake_imgs)
+        self.assertTrue(np.array_equal(crop_imgs, fake_imgs))
+
+        flip_imgs = transforms.BatchRandomHorizontalFlip(1.0)(fake_imgs)
+        self.assertTrue(np.array_equal(flip_imgs, fake_imgs[:, :, ::-1]))
+        flip_imgs = transforms.BatchRandomVerticalFlip(1.0)(fake_imgs)
+        self.assertTrue(np.array_equal(flip_imgs, fake_imgs[:, ::-1]))
+        flip_imgs = transforms.BatchRandomVerticalFlip(0.0)(fake_imgs)
+        self.assertTrue(np.array_equal(flip_imgs, fake_imgs))
+
+        mean = [123.675, 116.28, 103.53]
+        std = [58.395, 57.120, 57.375]
+        trans = transforms.Compose([
+            transforms.Permute(mode='CHW', to_rgb=True),
+            transforms.Normalize(mean, std)
+        ])
+        norm_imgs = transforms.BatchNormalize(mean, std, to_rgb=True)(
+            fake_imgs)
+        self.assertEqual(norm_imgs.dtype, np.float32)
+        for img, norm_img in zip(fake_imgs, norm_imgs):
+            self.assertTrue(np.allclose(trans(img), norm_img, atol=1e-5))
+        norm_imgs = transforms.BatchNormalize(mean, std, mode='HWC')(
+            fake_imgs)
+        self.assertEqual(norm_imgs.shape, fake_imgs.shape)
+
+        samples = [(img, np.array([i])) for i, img in enumerate(fake_imgs)]
+        trans_batch = transforms.BatchCompose([
+            transforms.BatchRandomCrop(32),
+            transforms.BatchRandomHorizontalFlip(),
+            transforms.BatchNormalize(mean, std)
+        ])
+        images, labels = trans_batch(samples)
+        self.assertEqual(images.shape, (4, 3, 32, 32))
+        self.assertEqual(labels.shape, (4, 1))
+
+        with self.assertRaises(TypeError):
+            transforms.BatchCompose([
+                transforms.BatchRandomCrop(32), transforms.Resize(16)
+            ])(samples)
+
+        with self.assertRaises(ValueError):
+            transforms.BatchRandomCrop(128)(fake_imgs)
+
+        with self.assertRaises(ValueError):
+            transforms.BatchNormalize(mean, std)(fake_imgs[0])
+
     def test_info(self):
         str(transforms.Compose([transforms.Resize((224, 224))]))
         str(transforms.BatchCompose([transforms.Resize((224, 224))]))
@@ -14,6 +14,7 @@
 
 from __future__ import print_function
 
+import os
 import re
 import six
 import string
@@ -22,7 +23,7 @@ import numpy as np
 import collections
 
 from paddle.io import Dataset
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import _check_exists_and_download, _load_cached_arrays, _pack_sequences, _unpack_sequences
 
 __all__ = ['Imdb']
 
@@ -41,6 +42,10 @@ class Imdb(Dataset):
         cutoff(int): cutoff number for building word dictionary. Default 150.
         download(bool): whether to download dataset automatically if
             :attr:`data_file` is not set. Default True
+        cache_dir(str): directory to cache the word dictionary and the word
+            ids of the documents as `.npy` files, which are loaded by memory
+            mapping when the dataset is created again, e.g. in other
+            processes. Default None, not to cache.
 
     Returns:
         Dataset: instance of IMDB dataset
@@ -74,7 +79,12 @@ class Imdb(Dataset):
 
     """
 
-    def __init__(self, data_file=None, mode='train', cutoff=150, download=True):
+    def __init__(self,
+                 data_file=None,
+                 mode='train',
+                 cutoff=150,
+                 download=True,
+                 cache_dir=None):
         assert mode.lower() in ['train', 'test'], \
             "mode should be 'train', 'test', but got {}".format(mode)
         self.mode = mode.lower()
@@ -85,60 +95,97 @@ class Imdb(Dataset):
             self.data_file = _check_exists_and_download(data_file, URL, MD5,
                                                         'imdb', download)
 
-        # Build a word dictionary from the corpus
-        self.word_idx = self._build_work_dict(cutoff)
+        self.cutoff = cutoff
+        self.cache_dir = cache_dir
 
         # read dataset into memory
         self._load_anno()
 
-    def _build_work_dict(self, cutoff):
+    def _load_anno(self):
+        if self.cache_dir is None:
+            arrays = self._decode_dataset()
+        else:
+            cache_prefix = os.path.join(self.cache_dir, '{}.cutoff{}.{}'.format(
+                os.path.basename(self.data_file), self.cutoff, self.mode))
+            arrays = _load_cached_arrays(
+                cache_prefix, [self.data_file],
+                ['words', 'doc_ids', 'doc_offsets', 'labels'],
+                self._decode_dataset)
+
+        words = arrays['words'].tolist()
+        self.word_idx = dict(list(zip(words, six.moves.range(len(words)))))
+        self.word_idx['<unk>'] = len(words)
+
+        # word ids of all documents are kept in a flat int32 array, the
+        # i-th document is doc_ids[doc_offsets[i]:doc_offsets[i + 1]]
+        self.doc_ids = arrays['doc_ids']
+        self.doc_offsets = arrays['doc_offsets']
+        self._labels = arrays['labels']
+
+    @property
+    def docs(self):
+        # the word ids of every document as lists, kept for compatibility
+        return _unpack_sequences(self.doc_ids, self.doc_offsets)
+
+    @property
+    def labels(self):
+        return self._labels.tolist()
+
+    def _decode_dataset(self):
+        # NOTE: the archive is read and tokenized only once, the documents
+        #       of both modes are needed to build the word dictionary
+        pattern = re.compile(
+            "aclImdb/((train)|(test))/((pos)|(neg))/.*\.txt$")
+        pos_prefix = "aclImdb/{}/pos/".format(self.mode)
+        neg_prefix = "aclImdb/{}/neg/".format(self.mode)
+
         word_freq = collections.defaultdict(int)
-        pattern = re.compile("aclImdb/((train)|(test))/((pos)|(neg))/.*\.txt$")
-        for doc in self._tokenize(pattern):
+        pos_docs = []
+        neg_docs = []
+        for name, doc in self._tokenize(pattern):
             for word in doc:
                 word_freq[word] += 1
+            if name.startswith(pos_prefix):
+                pos_docs.append(doc)
+            elif name.startswith(neg_prefix):
+                neg_docs.append(doc)
 
         # Not sure if we should prune less-frequent words here.
-        word_freq = [x for x in six.iteritems(word_freq) if x[1] > cutoff]
+        word_freq = [x for x in six.iteritems(word_freq) if x[1] > self.cutoff]
 
         dictionary = sorted(word_freq, key=lambda x: (-x[1], x[0]))
-        words, _ = list(zip(*dictionary))
+        words = [word for word, _ in dictionary]
         word_idx = dict(list(zip(words, six.moves.range(len(words)))))
-        word_idx['<unk>'] = len(words)
-        return word_idx
+        UNK = len(words)
+
+        doc_ids, doc_offsets = _pack_sequences(
+            [[word_idx.get(w, UNK) for w in doc]
+             for doc in pos_docs + neg_docs])
+        labels = np.array(
+            [0] * len(pos_docs) + [1] * len(neg_docs), dtype='int64')
+        return {
+            'words': np.array(
+                words, dtype=bytes),
+            'doc_ids': doc_ids,
+            'doc_offsets': doc_offsets,
+            'labels': labels
+        }
 
     def _tokenize(self, pattern):
-        data = []
         with tarfile.open(self.data_file) as tarf:
             tf = tarf.next()
             while tf != None:
                 if bool(pattern.match(tf.name)):
                     # newline and punctuations removal and ad-hoc tokenization.
-                    data.append(
-                        tarf.extractfile(tf).read().rstrip(six.b("\n\r"))
-                        .translate(None, six.b(string.punctuation)).lower(
-                        ).split())
+                    yield tf.name, tarf.extractfile(tf).read().rstrip(
+                        six.b("\n\r")).translate(
+                            None, six.b(string.punctuation)).lower().split()
                 tf = tarf.next()
 
-        return data
-
-    def _load_anno(self):
-        pos_pattern = re.compile("aclImdb/{}/pos/.*\.txt$".format(self.mode))
-        neg_pattern = re.compile("aclImdb/{}/neg/.*\.txt$".format(self.mode))
-
-        UNK = self.word_idx['<unk>']
-
-        self.docs = []
-        self.labels = []
-        for doc in self._tokenize(pos_pattern):
-            self.docs.append([self.word_idx.get(w, UNK) for w in doc])
-            self.labels.append(0)
-        for doc in self._tokenize(neg_pattern):
-            self.docs.append([self.word_idx.get(w, UNK) for w in doc])
-            self.labels.append(1)
-
     def __getitem__(self, idx):
-        return (np.array(self.docs[idx]), np.array([self.labels[idx]]))
+        begin, end = self.doc_offsets[idx:idx + 2]
+        doc = np.array(self.doc_ids[begin:end], dtype='int64')
+        return (doc, np.array([self._labels[idx]]))
 
     def __len__(self):
-        return len(self.docs)
+        return len(self._labels)
@@ -14,6 +14,7 @@
 
 from __future__ import print_function
 
+import os
 import numpy as np
 import zipfile
 import re
@@ -24,7 +25,7 @@ import six
 import paddle
 from paddle.io import Dataset
 import paddle.compat as cpt
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import _check_exists_and_download, _load_cached_arrays, _pack_sequences, _unpack_sequences
 
 __all__ = ['Movielens']
 
@@ -98,6 +99,10 @@ class Movielens(Dataset):
         rand_seed(int): random seed. Default 0.
         download(bool): whether to download dataset automatically if
             :attr:`data_file` is not set. Default True
+        cache_dir(str): directory to cache the parsed samples as `.npy`
+            files, which are loaded by memory mapping when the dataset is
+            created again, e.g. in other processes. Default None, not to
+            cache.
 
     Returns:
         Dataset: instance of Movielens 1-M dataset
@@ -137,7 +142,8 @@ class Movielens(Dataset):
                  mode='train',
                  test_ratio=0.1,
                  rand_seed=0,
-                 download=True):
+                 download=True,
+                 cache_dir=None):
         assert mode.lower() in ['train', 'test'], \
             "mode should be 'train', 'test', but got {}".format(mode)
         self.mode = mode.lower()
@@ -150,6 +156,7 @@ class Movielens(Dataset):
 
         self.test_ratio = test_ratio
         self.rand_seed = rand_seed
+        self.cache_dir = cache_dir
 
         np.random.seed(rand_seed)
         self._load_meta_info()
@@ -162,38 +169,74 @@ class Movielens(Dataset):
         self.categories_dict = dict()
         self.user_info = dict()
         with zipfile.ZipFile(self.data_file) as package:
-            for info in package.infolist():
-                assert isinstance(info, zipfile.ZipInfo)
-                title_word_set = set()
-                categories_set = set()
-                with package.open('ml-1m/movies.dat') as movie_file:
-                    for i, line in enumerate(movie_file):
-                        line = cpt.to_text(line, encoding='latin')
-                        movie_id, title, categories = line.strip().split('::')
-                        categories = categories.split('|')
-                        for c in categories:
-                            categories_set.add(c)
-                        title = pattern.match(title).group(1)
-                        self.movie_info[int(movie_id)] = MovieInfo(
-                            index=movie_id, categories=categories, title=title)
-                        for w in title.split():
-                            title_word_set.add(w.lower())
-
-                for i, w in enumerate(title_word_set):
-                    self.movie_title_dict[w] = i
-
-                for i, c in enumerate(categories_set):
-                    self.categories_dict[c] = i
-
-                with package.open('ml-1m/users.dat') as user_file:
-                    for line in user_file:
-                        line = cpt.to_text(line, encoding='latin')
-                        uid, gender, age, job, _ = line.strip().split("::")
-                        self.user_info[int(uid)] = UserInfo(
-                            index=uid, gender=gender, age=age, job_id=job)
+            title_word_set = set()
+            categories_set = set()
+            with package.open('ml-1m/movies.dat') as movie_file:
+                for i, line in enumerate(movie_file):
+                    line = cpt.to_text(line, encoding='latin')
+                    movie_id, title, categories = line.strip().split('::')
+                    categories = categories.split('|')
+                    for c in categories:
+                        categories_set.add(c)
+                    title = pattern.match(title).group(1)
+                    self.movie_info[int(movie_id)] = MovieInfo(
+                        index=movie_id, categories=categories, title=title)
+                    for w in title.split():
+                        title_word_set.add(w.lower())
+
+            # NOTE: sort the words and categories to give them the same ids
+            #       in every process, which the cached data relies on
+            for i, w in enumerate(sorted(title_word_set)):
+                self.movie_title_dict[w] = i
+
+            for i, c in enumerate(sorted(categories_set)):
+                self.categories_dict[c] = i
+
+            with package.open('ml-1m/users.dat') as user_file:
+                for line in user_file:
+                    line = cpt.to_text(line, encoding='latin')
+                    uid, gender, age, job, _ = line.strip().split("::")
+                    self.user_info[int(uid)] = UserInfo(
+                        index=uid, gender=gender, age=age, job_id=job)
 
     def _load_data(self):
-        self.data = []
+        if self.cache_dir is None:
+            arrays = self._decode_dataset()
+        else:
+            cache_prefix = os.path.join(self.cache_dir, '{}.{}_{}.{}'.format(
+                os.path.basename(self.data_file), self.test_ratio,
+                self.rand_seed, self.mode))
+            arrays = _load_cached_arrays(cache_prefix, [self.data_file], [
+                'values', 'category_ids', 'category_offsets', 'title_ids',
+                'title_offsets', 'ratings'
+            ], self._decode_dataset)
+
+        # the user id, gender, age, job id and movie id of every sample
+        # are kept in an int64 array of shape [N, 5], the categories and
+        # title words in flat int32 arrays with offsets
+        self._values = arrays['values']
+        self._category_ids = arrays['category_ids']
+        self._category_offsets = arrays['category_offsets']
+        self._title_ids = arrays['title_ids']
+        self._title_offsets = arrays['title_offsets']
+        self._ratings = arrays['ratings']
+
+    @property
+    def data(self):
+        # the samples as nested lists, kept for compatibility
+        categories = _unpack_sequences(self._category_ids,
+                                       self._category_offsets)
+        titles = _unpack_sequences(self._title_ids, self._title_offsets)
+        return [[[v] for v in values] + [category, title, [rating]]
+                for values, category, title, rating in zip(
+                    self._values.tolist(), categories, titles,
+                    self._ratings.tolist())]
+
+    def _decode_dataset(self):
+        values = []
+        categories = []
+        titles = []
+        ratings = []
         is_test = self.mode == 'test'
         with zipfile.ZipFile(self.data_file) as package:
             with package.open('ml-1m/ratings.dat') as rating:
@@ -207,13 +250,37 @@ class Movielens(Dataset):
 
                         mov = self.movie_info[mov_id]
                         usr = self.user_info[uid]
-                        self.data.append(usr.value() + \
-                                         mov.value(self.categories_dict, self.movie_title_dict) + \
-                                         [[rating]])
+                        usr_value = usr.value()
+                        mov_value = mov.value(self.categories_dict,
+                                              self.movie_title_dict)
+                        values.append([v[0] for v in usr_value] +
+                                      mov_value[0])
+                        categories.append(mov_value[1])
+                        titles.append(mov_value[2])
+                        ratings.append(rating)
+
+        category_ids, category_offsets = _pack_sequences(categories)
+        title_ids, title_offsets = _pack_sequences(titles)
+        return {
+            'values': np.array(
+                values, dtype='int64').reshape([-1, 5]),
+            'category_ids': category_ids,
+            'category_offsets': category_offsets,
+            'title_ids': title_ids,
+            'title_offsets': title_offsets,
+            'ratings': np.array(
+                ratings, dtype='float32')
+        }
 
     def __getitem__(self, idx):
-        data = self.data[idx]
-        return tuple([np.array(d) for d in data])
+        values = [np.array([v]) for v in self._values[idx].tolist()]
+        cat_begin, cat_end = self._category_offsets[idx:idx + 2]
+        title_begin, title_end = self._title_offsets[idx:idx + 2]
+        categories = np.array(
+            self._category_ids[cat_begin:cat_end], dtype='int64')
+        title = np.array(self._title_ids[title_begin:title_end], dtype='int64')
+        rating = np.array([float(self._ratings[idx])])
+        return tuple(values + [categories, title, rating])
 
     def __len__(self):
-        return len(self.data)
+        return len(self._ratings)
@@ -14,13 +14,15 @@
 
 from __future__ import print_function
 
+import os
+import six
 import tarfile
 import numpy as np
 import gzip
 
 from paddle.io import Dataset
 import paddle.compat as cpt
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import _check_exists_and_download, _load_cached_arrays, _pack_sequences, _unpack_sequences
 
 __all__ = ['WMT14']
 
@@ -52,6 +54,10 @@ class WMT14(Dataset):
         dict_size(int): word dictionary size. Default -1.
         download(bool): whether to download dataset automatically if
             :attr:`data_file` is not set. Default True
+        cache_dir(str): directory to cache the word dictionaries and the
+            word ids of the sequences as `.npy` files, which are loaded by
+            memory mapping when the dataset is created again, e.g. in other
+            processes. Default None, not to cache.
 
     Returns:
         Dataset: instance of WMT14 dataset
@@ -90,7 +96,8 @@ class WMT14(Dataset):
                  data_file=None,
                  mode='train',
                  dict_size=-1,
-                 download=True):
+                 download=True,
+                 cache_dir=None):
         assert mode.lower() in ['train', 'test', 'gen'], \
             "mode should be 'train', 'test' or 'gen', but got {}".format(mode)
         self.mode = mode.lower()
@@ -104,38 +111,83 @@ class WMT14(Dataset):
         # read dataset into memory
         assert dict_size > 0, "dict_size should be set as positive number"
         self.dict_size = dict_size
+        self.cache_dir = cache_dir
         self._load_data()
 
     def _load_data(self):
-        def __to_dict(fd, size):
-            out_dict = dict()
+        if self.cache_dir is None:
+            arrays = self._decode_dataset()
+        else:
+            cache_prefix = os.path.join(
+                self.cache_dir, '{}.dict{}.{}'.format(
+                    os.path.basename(self.data_file), self.dict_size,
+                    self.mode))
+            arrays = _load_cached_arrays(cache_prefix, [self.data_file], [
+                'src_words', 'trg_words', 'src_ids', 'src_offsets', 'trg_ids',
+                'trg_offsets'
+            ], self._decode_dataset)
+
+        src_words = arrays['src_words'].tolist()
+        trg_words = arrays['trg_words'].tolist()
+        self.src_dict = dict(zip(src_words, range(len(src_words))))
+        self.trg_dict = dict(zip(trg_words, range(len(trg_words))))
+
+        # the word ids of all sequences are kept in flat int32 arrays, the
+        # target ids exclude the start and end marks, which are added in
+        # __getitem__
+        self._src_ids = arrays['src_ids']
+        self._src_offsets = arrays['src_offsets']
+        self._trg_ids = arrays['trg_ids']
+        self._trg_offsets = arrays['trg_offsets']
+
+    # the source and target sequences as lists, kept for compatibility
+    @property
+    def src_ids(self):
+        return _unpack_sequences(self._src_ids, self._src_offsets)
+
+    @property
+    def trg_ids(self):
+        return [[self.trg_dict[START]] + ids
+                for ids in _unpack_sequences(self._trg_ids, self._trg_offsets)]
+
+    @property
+    def trg_ids_next(self):
+        return [ids + [self.trg_dict[END]]
+                for ids in _unpack_sequences(self._trg_ids, self._trg_offsets)]
+
+    def _decode_dataset(self):
+        def __read_words(fd, size):
+            words = []
             for line_count, line in enumerate(fd):
                 if line_count < size:
-                    out_dict[cpt.to_text(line.strip())] = line_count
+                    words.append(cpt.to_text(line.strip()))
                 else:
                     break
-            return out_dict
+            return words
 
-        self.src_ids = []
-        self.trg_ids = []
-        self.trg_ids_next = []
+        src_seqs = []
+        trg_seqs = []
         with tarfile.open(self.data_file, mode='r') as f:
+            members = f.getmembers()
             names = [
-                each_item.name for each_item in f
+                each_item.name for each_item in members
                 if each_item.name.endswith("src.dict")
             ]
             assert len(names) == 1
-            self.src_dict = __to_dict(f.extractfile(names[0]), self.dict_size)
+            src_words = __read_words(f.extractfile(names[0]), self.dict_size)
             names = [
-                each_item.name for each_item in f
+                each_item.name for each_item in members
                 if each_item.name.endswith("trg.dict")
             ]
             assert len(names) == 1
-            self.trg_dict = __to_dict(f.extractfile(names[0]), self.dict_size)
+            trg_words = __read_words(f.extractfile(names[0]), self.dict_size)
+
+            src_dict = dict(zip(src_words, range(len(src_words))))
+            trg_dict = dict(zip(trg_words, range(len(trg_words))))
 
             file_name = "{}/{}".format(self.mode, self.mode)
             names = [
-                each_item.name for each_item in f
+                each_item.name for each_item in members
                 if each_item.name.endswith(file_name)
             ]
             for name in names:
@@ -145,32 +197,44 @@ class WMT14(Dataset):
                     if len(line_split) != 2:
                         continue
                     src_seq = line_split[0]  # one source sequence
-                    src_words = src_seq.split()
+                    src_words_seq = src_seq.split()
                     src_ids = [
-                        self.src_dict.get(w, UNK_IDX)
-                        for w in [START] + src_words + [END]
+                        src_dict.get(w, UNK_IDX)
+                        for w in [START] + src_words_seq + [END]
                     ]
 
                     trg_seq = line_split[1]  # one target sequence
-                    trg_words = trg_seq.split()
-                    trg_ids = [self.trg_dict.get(w, UNK_IDX) for w in trg_words]
+                    trg_words_seq = trg_seq.split()
+                    trg_ids = [trg_dict.get(w, UNK_IDX) for w in trg_words_seq]
 
                     # remove sequence whose length > 80 in training mode
                     if len(src_ids) > 80 or len(trg_ids) > 80:
                         continue
-                    trg_ids_next = trg_ids + [self.trg_dict[END]]
-                    trg_ids = [self.trg_dict[START]] + trg_ids
 
-                    self.src_ids.append(src_ids)
-                    self.trg_ids.append(trg_ids)
-                    self.trg_ids_next.append(trg_ids_next)
+                    src_seqs.append(src_ids)
+                    trg_seqs.append(trg_ids)
+
+        src_ids, src_offsets = _pack_sequences(src_seqs)
+        trg_ids, trg_offsets = _pack_sequences(trg_seqs)
+        return {
+            'src_words': np.array(src_words),
+            'trg_words': np.array(trg_words),
+            'src_ids': src_ids,
+            'src_offsets': src_offsets,
+            'trg_ids': trg_ids,
+            'trg_offsets': trg_offsets
+        }
 
     def __getitem__(self, idx):
-        return (np.array(self.src_ids[idx]), np.array(self.trg_ids[idx]),
-                np.array(self.trg_ids_next[idx]))
+        src_begin, src_end = self._src_offsets[idx:idx + 2]
+        trg_begin, trg_end = self._trg_offsets[idx:idx + 2]
+        src_ids = np.array(self._src_ids[src_begin:src_end], dtype='int64')
+        trg_ids = np.array(self._trg_ids[trg_begin:trg_end], dtype='int64')
+        return (src_ids, np.concatenate([[self.trg_dict[START]], trg_ids]),
+                np.concatenate([trg_ids, [self.trg_dict[END]]]))
 
     def __len__(self):
-        return len(self.src_ids)
+        return len(self._src_offsets) - 1
 
     def get_dict(self, reverse=False):
         """
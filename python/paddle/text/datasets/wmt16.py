@@ -25,7 +25,7 @@ from collections import defaultdict
 import paddle
 from paddle.io import Dataset
 import paddle.compat as cpt
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import _check_exists_and_download, _load_cached_arrays, _pack_sequences, _unpack_sequences
 
 __all__ = ['WMT16']
 
@@ -69,6 +69,10 @@ class WMT16(Dataset):
         lang(str): source language, 'en' or 'de'. Default 'en'.
         download(bool): whether to download dataset automatically if
             :attr:`data_file` is not set. Default True
+        cache_dir(str): directory to cache the word ids of the sequences as
+            `.npy` files, which are loaded by memory mapping when the
+            dataset is created again, e.g. in other processes. Default None,
+            not to cache.
 
     Returns:
         Dataset: instance of WMT16 dataset
@@ -109,7 +113,8 @@ class WMT16(Dataset):
                  src_dict_size=-1,
                  trg_dict_size=-1,
                  lang='en',
-                 download=True):
+                 download=True,
+                 cache_dir=None):
         assert mode.lower() in ['train', 'test', 'val'], \
             "mode should be 'train', 'test' or 'val', but got {}".format(mode)
         self.mode = mode.lower()
@@ -134,7 +139,8 @@ class WMT16(Dataset):
                                         trg_dict_size)
 
         # load data
-        self.data = self._load_data()
+        self.cache_dir = cache_dir
+        self._load_data()
 
     def _load_dict(self, lang, dict_size, reverse=False):
         dict_path = os.path.join(paddle.dataset.common.DATA_HOME,
@@ -179,6 +185,44 @@ class WMT16(Dataset):
                 fout.write(cpt.to_bytes('\n'))
 
     def _load_data(self):
+        if self.cache_dir is None:
+            arrays = self._decode_dataset()
+        else:
+            cache_prefix = os.path.join(
+                self.cache_dir, '{}.{}_{}_{}.{}'.format(
+                    os.path.basename(self.data_file), self.lang,
+                    self.src_dict_size, self.trg_dict_size, self.mode))
+            arrays = _load_cached_arrays(
+                cache_prefix, [self.data_file],
+                ['src_ids', 'src_offsets', 'trg_ids', 'trg_offsets'],
+                self._decode_dataset)
+
+        # the word ids of all sequences are kept in flat int32 arrays, the
+        # target ids exclude the start and end marks, which are added in
+        # __getitem__
+        self._src_ids = arrays['src_ids']
+        self._src_offsets = arrays['src_offsets']
+        self._trg_ids = arrays['trg_ids']
+        self._trg_offsets = arrays['trg_offsets']
+
+    # the source and target sequences as lists, kept for compatibility
+    @property
+    def src_ids(self):
+        return _unpack_sequences(self._src_ids, self._src_offsets)
+
+    @property
+    def trg_ids(self):
+        start_id = self.src_dict[START_MARK]
+        return [[start_id] + ids
+                for ids in _unpack_sequences(self._trg_ids, self._trg_offsets)]
+
+    @property
+    def trg_ids_next(self):
+        end_id = self.src_dict[END_MARK]
+        return [ids + [end_id]
+                for ids in _unpack_sequences(self._trg_ids, self._trg_offsets)]
+
+    def _decode_dataset(self):
         # the index for start mark, end mark, and unk are the same in source
         # language and target language. Here uses the source language
         # dictionary to determine their indices.
@@ -189,9 +233,8 @@ class WMT16(Dataset):
         src_col = 0 if self.lang == "en" else 1
         trg_col = 1 - src_col
 
-        self.src_ids = []
-        self.trg_ids = []
-        self.trg_ids_next = []
+        src_seqs = []
+        trg_seqs = []
         with tarfile.open(self.data_file, mode="r") as f:
             for line in f.extractfile("wmt16/{}".format(self.mode)):
                 line = cpt.to_text(line)
@@ -206,19 +249,30 @@ class WMT16(Dataset):
                 trg_words = line_split[trg_col].split()
                 trg_ids = [self.trg_dict.get(w, unk_id) for w in trg_words]
 
-                trg_ids_next = trg_ids + [end_id]
-                trg_ids = [start_id] + trg_ids
+                src_seqs.append(src_ids)
+                trg_seqs.append(trg_ids)
 
-                self.src_ids.append(src_ids)
-                self.trg_ids.append(trg_ids)
-                self.trg_ids_next.append(trg_ids_next)
+        src_ids, src_offsets = _pack_sequences(src_seqs)
+        trg_ids, trg_offsets = _pack_sequences(trg_seqs)
+        return {
+            'src_ids': src_ids,
+            'src_offsets': src_offsets,
+            'trg_ids': trg_ids,
+            'trg_offsets': trg_offsets
+        }
 
     def __getitem__(self, idx):
-        return (np.array(self.src_ids[idx]), np.array(self.trg_ids[idx]),
-                np.array(self.trg_ids_next[idx]))
+        start_id = self.src_dict[START_MARK]
+        end_id = self.src_dict[END_MARK]
+        src_begin, src_end = self._src_offsets[idx:idx + 2]
+        trg_begin, trg_end = self._trg_offsets[idx:idx + 2]
+        src_ids = np.array(self._src_ids[src_begin:src_end], dtype='int64')
+        trg_ids = np.array(self._trg_ids[trg_begin:trg_end], dtype='int64')
+        return (src_ids, np.concatenate([[start_id], trg_ids]),
+                np.concatenate([trg_ids, [end_id]]))
 
     def __len__(self):
-        return len(self.src_ids)
+        return len(self._src_offsets) - 1
 
     def get_dict(self, lang, reverse=False):
         """
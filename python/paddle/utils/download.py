@@ -20,7 +20,6 @@ import os
 import sys
 import os.path as osp
 import shutil
-import requests
 import hashlib
 import tarfile
 import zipfile
@@ -201,6 +200,9 @@ def _download(url, path, md5sum=None):
 
         logger.info("Downloading {} from {}".format(fname, url))
 
+        # NOTE: requests is imported on first download to keep
+        #       `import paddle` fast
+        import requests
         req = requests.get(url, stream=True)
         if req.status_code != 200:
             raise RuntimeError("Downloading from {} failed with code "
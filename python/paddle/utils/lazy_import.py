@@ -13,6 +13,7 @@
 # limitations under the License.
 """Lazy imports for heavy dependencies."""
 
+import types
 import importlib
 
 
@@ -32,3 +33,47 @@ def try_import(module_name):
             "manually installed (usually with `pip install {}`). ").format(
                 module_name, install_name)
         raise ImportError(err_msg)
+
+
+class LazyModule(types.ModuleType):
+    """
+    A proxy of the module `module_name`, which imports the module on the
+    first access of its attributes, and then replaces itself with the
+    module as `local_name` in the namespace `parent_globals`.
+
+    Args:
+        local_name(str): the name of the module in `parent_globals`.
+        parent_globals(dict): the namespace holding the proxy, usually the
+            `globals()` of the parent package.
+        module_name(str): the full name of the module to import.
+
+    Examples:
+        .. code-block:: python
+
+            from paddle.utils.lazy_import import LazyModule
+
+            # scipy is imported when scipy.sparse is accessed first
+            scipy = LazyModule('scipy', globals(), 'scipy')
+    """
+
+    def __init__(self, local_name, parent_globals, module_name):
+        super(LazyModule, self).__init__(module_name)
+        self._local_name = local_name
+        self._parent_globals = parent_globals
+
+    def _load(self):
+        module = importlib.import_module(self.__name__)
+        # NOTE: the parent package may have been bound to the module by
+        #       the import system already, and rebinding is harmless
+        self._parent_globals[self._local_name] = module
+        self.__dict__.update(module.__dict__)
+        return module
+
+    def __getattr__(self, item):
+        return getattr(self._load(), item)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        return "<LazyModule '{}'>".format(self.__name__)
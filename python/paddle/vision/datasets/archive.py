@@ -0,0 +1,199 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import os
+import bz2
+import gzip
+import mmap
+import shutil
+import tarfile
+import warnings
+import numpy as np
+
+from paddle.dataset.common import _load_cached_arrays
+
+__all__ = []
+
+_COMPRESSED_MAGICS = [(b'\x1f\x8b', gzip.open), (b'BZh', bz2.BZ2File)]
+
+
+def _compressed_opener(path):
+    with open(path, 'rb') as f:
+        magic = f.read(3)
+    for prefix, opener in _COMPRESSED_MAGICS:
+        if magic.startswith(prefix):
+            return opener
+    return None
+
+
+class TarArchive(object):
+    """
+    Random-access reader of the members of a tar archive.
+
+    An index of the offset and size of every regular file member is built
+    once and cached to :code:`<cache_dir>/<archive name>.{names,offsets,
+    sizes}.npy`, members are read with :code:`os.pread` (or from a memory
+    mapping of the archive) by the index later, which needs no seeking
+    through the archive and no shared file position, so that one archive
+    can be read concurrently by threads and by forked DataLoader workers.
+    A compressed (gzip or bz2) archive is unpacked to an uncompressed tar
+    file in :attr:`cache_dir` once, since it can not be read randomly.
+
+    If :attr:`cache_dir` is None, nothing is written to disk: the index is
+    built in memory, and the members of a compressed archive are read by
+    seeking through the decompressed stream as :code:`tarfile` does.
+
+    Args:
+        path(str): path of the tar archive.
+        cache_dir(str): directory to cache the index and the unpacked
+            archive. Default None, not to cache.
+        use_mmap(bool): whether to read members from a memory mapping of
+            the archive instead of :code:`os.pread`. Default False.
+    """
+
+    def __init__(self, path, cache_dir=None, use_mmap=False):
+        self.path = path
+        self.cache_dir = cache_dir
+        self.use_mmap = use_mmap
+        # decompressing opener of a compressed archive read as a stream
+        self._stream_opener = None
+
+        self._tar_path = self._unpack()
+        arrays = self._load_index()
+        self._offsets = arrays['offsets']
+        self._sizes = arrays['sizes']
+        self._name2idx = dict(
+            (name, i) for i, name in enumerate(arrays['names'].tolist()))
+
+        # opened lazily and reopened in every process
+        self._pid = None
+        self._file = None
+        self._mmap = None
+
+    def _cache_prefix(self):
+        return os.path.join(self.cache_dir, os.path.basename(self.path))
+
+    def _unpack(self):
+        opener = _compressed_opener(self.path)
+        if opener is None:
+            return self.path
+        if self.cache_dir is None:
+            self._stream_opener = opener
+            return self.path
+
+        tar_path = self._cache_prefix() + '.unpacked.tar'
+        if os.path.isfile(tar_path) and \
+                os.path.getmtime(tar_path) >= os.path.getmtime(self.path):
+            return tar_path
+
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        tmp_path = '{}.tmp{}'.format(tar_path, os.getpid())
+        with opener(self.path, 'rb') as src, open(tmp_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+        os.rename(tmp_path, tar_path)
+        return tar_path
+
+    def _build_index(self):
+        names = []
+        offsets = []
+        sizes = []
+        with tarfile.open(self._tar_path) as tar:
+            for member in tar:
+                if member.isfile():
+                    names.append(member.name)
+                    offsets.append(member.offset_data)
+                    sizes.append(member.size)
+        return {
+            'names': np.array(names),
+            'offsets': np.array(
+                offsets, dtype='int64'),
+            'sizes': np.array(
+                sizes, dtype='int64')
+        }
+
+    def _load_index(self):
+        if self.cache_dir is None:
+            return self._build_index()
+        try:
+            return _load_cached_arrays(
+                self._cache_prefix(), [self._tar_path],
+                ['names', 'offsets', 'sizes'], self._build_index)
+        except (IOError, OSError) as e:
+            warnings.warn("Failed to cache the index of {} in {}: {}, "
+                          "rebuild the index in memory.".format(
+                              self.path, self.cache_dir, e))
+            return self._build_index()
+
+    def _ensure_open(self):
+        if self._pid == os.getpid():
+            return
+        if self._stream_opener is not None:
+            self._file = self._stream_opener(self._tar_path, 'rb')
+        else:
+            self._file = open(self._tar_path, 'rb')
+        if self.use_mmap and self._stream_opener is None:
+            self._mmap = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._pid = os.getpid()
+
+    def names(self):
+        return list(self._name2idx.keys())
+
+    def read(self, name):
+        """
+        Read the content of the member `name` as bytes.
+        """
+        idx = self._name2idx.get(name, None)
+        if idx is None:
+            raise KeyError("{} is not found in archive {}".format(name,
+                                                                  self.path))
+        offset = int(self._offsets[idx])
+        size = int(self._sizes[idx])
+
+        self._ensure_open()
+        if self._mmap is not None:
+            return self._mmap[offset:offset + size]
+        if self._stream_opener is None and hasattr(os, 'pread'):
+            return os.pread(self._file.fileno(), size, offset)
+        # NOTE: no pread on Windows and Python 2 or on a decompressed
+        #       stream, seek and read is not thread safe, but is still
+        #       safe for worker processes
+        self._file.seek(offset)
+        return self._file.read(size)
+
+    def close(self):
+        if self._pid == os.getpid():
+            if self._mmap is not None:
+                self._mmap.close()
+            self._file.close()
+        self._pid = None
+        self._file = None
+        self._mmap = None
+
+    def __contains__(self, name):
+        return name in self._name2idx
+
+    def __len__(self):
+        return len(self._name2idx)
+
+    def __getstate__(self):
+        # opened file can not be pickled, reopen in the new process
+        state = self.__dict__.copy()
+        state['_pid'] = None
+        state['_file'] = None
+        state['_mmap'] = None
+        return state
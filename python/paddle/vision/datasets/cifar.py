@@ -14,6 +14,7 @@
 
 from __future__ import print_function
 
+import os
 import tarfile
 import numpy as np
 import six
@@ -21,7 +22,7 @@ from six.moves import cPickle as pickle
 
 import paddle
 from paddle.io import Dataset
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import _check_exists_and_download, _load_cached_arrays
 
 __all__ = ['Cifar10', 'Cifar100']
 
@@ -51,6 +52,9 @@ class Cifar10(Dataset):
         transform(callable): transform to perform on image, None for on transform.
         download(bool): whether to download dataset automatically if
             :attr:`data_file` is not set. Default True
+        cache_dir(str): directory to cache the decoded images and labels
+            as `.npy` files, which are loaded by memory mapping when the
+            dataset is created again. Default None, not to cache.
 
     Returns:
         Dataset: instance of cifar-10 dataset
@@ -96,7 +100,8 @@ class Cifar10(Dataset):
                  data_file=None,
                  mode='train',
                  transform=None,
-                 download=True):
+                 download=True,
+                 cache_dir=None):
         assert mode.lower() in ['train', 'test', 'train', 'test'], \
             "mode should be 'train10', 'test10', 'train100' or 'test100', but got {}".format(mode)
         self.mode = mode.lower()
@@ -110,6 +115,7 @@ class Cifar10(Dataset):
                 data_file, self.data_url, self.data_md5, 'cifar', download)
 
         self.transform = transform
+        self.cache_dir = cache_dir
 
         # read dataset into memory
         self._load_data()
@@ -122,7 +128,22 @@ class Cifar10(Dataset):
         self.flag = MODE_FLAG_MAP[self.mode + '10']
 
     def _load_data(self):
-        self.data = []
+        if self.cache_dir is None:
+            arrays = self._decode_data()
+        else:
+            cache_prefix = os.path.join(self.cache_dir, '{}.{}'.format(
+                os.path.basename(self.data_file), self.flag))
+            arrays = _load_cached_arrays(cache_prefix, [self.data_file],
+                                         ['images', 'labels'],
+                                         self._decode_data)
+        # images are kept as uint8 with shape [N, 3072], and labels as
+        # int64 with shape [N]
+        self.images = arrays['images']
+        self.labels = arrays['labels']
+
+    def _decode_data(self):
+        images = []
+        labels = []
         with tarfile.open(self.data_file, mode='r') as f:
             names = (each_item.name for each_item in f
                      if self.flag in each_item.name)
@@ -134,21 +155,25 @@ class Cifar10(Dataset):
                     batch = pickle.load(f.extractfile(name), encoding='bytes')
 
                 data = batch[six.b('data')]
-                labels = batch.get(
+                batch_labels = batch.get(
                     six.b('labels'), batch.get(six.b('fine_labels'), None))
-                assert labels is not None
-                for sample, label in six.moves.zip(data, labels):
-                    self.data.append((sample, label))
+                assert batch_labels is not None
+                images.append(np.asarray(data, dtype='uint8'))
+                labels.append(np.asarray(batch_labels, dtype='int64'))
+        return {
+            'images': np.concatenate(images),
+            'labels': np.concatenate(labels)
+        }
 
     def __getitem__(self, idx):
-        image, label = self.data[idx]
+        image, label = self.images[idx], self.labels[idx]
         image = np.reshape(image, [3, 32, 32])
         if self.transform is not None:
             image = self.transform(image)
         return image.astype(self.dtype), np.array(label).astype('int64')
 
     def __len__(self):
-        return len(self.data)
+        return len(self.labels)
 
 
 class Cifar100(Cifar10):
@@ -163,6 +188,9 @@ class Cifar100(Cifar10):
         transform(callable): transform to perform on image, None for on transform.
         download(bool): whether to download dataset automatically if
             :attr:`data_file` is not set. Default True
+        cache_dir(str): directory to cache the decoded images and labels
+            as `.npy` files, which are loaded by memory mapping when the
+            dataset is created again. Default None, not to cache.
 
     Returns:
         Dataset: instance of cifar-100 dataset
@@ -208,8 +236,10 @@ class Cifar100(Cifar10):
                  data_file=None,
                  mode='train',
                  transform=None,
-                 download=True):
-        super(Cifar100, self).__init__(data_file, mode, transform, download)
+                 download=True,
+                 cache_dir=None):
+        super(Cifar100, self).__init__(data_file, mode, transform, download,
+                                       cache_dir)
 
     def _init_url_md5_flag(self):
         self.data_url = CIFAR100_URL
@@ -16,7 +16,6 @@ from __future__ import print_function
 
 import os
 import io
-import tarfile
 import numpy as np
 import scipy.io as scio
 from PIL import Image
@@ -24,6 +23,7 @@ from PIL import Image
 import paddle
 from paddle.io import Dataset
 from paddle.dataset.common import _check_exists_and_download
+from .archive import TarArchive
 
 __all__ = ["Flowers"]
 
@@ -56,6 +56,11 @@ class Flowers(Dataset):
         transform(callable): transform to perform on image, None for on transform.
         download(bool): whether to download dataset automatically if
             :attr:`data_file` is not set. Default True
+        cache_dir(str): directory to cache the member index and the
+            unpacked copy of :attr:`data_file`, so that images can be
+            read randomly and concurrently in DataLoader workers. Default
+            None, not to cache, images are read from the compressed
+            :attr:`data_file` directly, which is slower.
 
     Examples:
         
@@ -77,7 +82,8 @@ class Flowers(Dataset):
                  setid_file=None,
                  mode='train',
                  transform=None,
-                 download=True):
+                 download=True,
+                 cache_dir=None):
         assert mode.lower() in ['train', 'valid', 'test'], \
                 "mode should be 'train', 'valid' or 'test', but got {}".format(mode)
         self.flag = MODE_FLAG_MAP[mode.lower()]
@@ -101,6 +107,7 @@ class Flowers(Dataset):
                 setid_file, SETID_URL, SETID_MD5, 'flowers', download)
 
         self.transform = transform
+        self.cache_dir = cache_dir
 
         # read dataset into memory
         self._load_anno()
@@ -108,10 +115,7 @@ class Flowers(Dataset):
         self.dtype = paddle.get_default_dtype()
 
     def _load_anno(self):
-        self.name2mem = {}
-        self.data_tar = tarfile.open(self.data_file)
-        for ele in self.data_tar.getmembers():
-            self.name2mem[ele.name] = ele
+        self.data_tar = TarArchive(self.data_file, self.cache_dir)
 
         self.labels = scio.loadmat(self.label_file)['labels'][0]
         self.indexes = scio.loadmat(self.setid_file)[self.flag][0]
@@ -120,8 +124,7 @@ class Flowers(Dataset):
         index = self.indexes[idx]
         label = np.array([self.labels[index - 1]])
         img_name = "jpg/image_%05d.jpg" % index
-        img_ele = self.name2mem[img_name]
-        image = self.data_tar.extractfile(img_ele).read()
+        image = self.data_tar.read(img_name)
         image = np.array(Image.open(io.BytesIO(image)))
 
         if self.transform is not None:
@@ -21,7 +21,7 @@ import numpy as np
 
 import paddle
 from paddle.io import Dataset
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import _check_exists_and_download, _load_cached_arrays
 
 __all__ = ["MNIST"]
 
@@ -48,6 +48,9 @@ class MNIST(Dataset):
         mode(str): 'train' or 'test' mode. Default 'train'.
         download(bool): whether to download dataset automatically if
             :attr:`image_path` :attr:`label_path` is not set. Default True
+        cache_dir(str): directory to cache the decoded images and labels
+            as `.npy` files, which are loaded by memory mapping when the
+            dataset is created again. Default None, not to cache.
 
     Returns:
         Dataset: MNIST Dataset.
@@ -71,7 +74,8 @@ class MNIST(Dataset):
                  label_path=None,
                  mode='train',
                  transform=None,
-                 download=True):
+                 download=True,
+                 cache_dir=None):
         assert mode.lower() in ['train', 'test'], \
                 "mode should be 'train' or 'test', but got {}".format(mode)
         self.mode = mode.lower()
@@ -92,60 +96,60 @@ class MNIST(Dataset):
                 label_path, label_url, label_md5, 'mnist', download)
 
         self.transform = transform
+        self.cache_dir = cache_dir
 
         # read dataset into memory
         self._parse_dataset()
 
         self.dtype = paddle.get_default_dtype()
 
-    def _parse_dataset(self, buffer_size=100):
-        self.images = []
-        self.labels = []
+    def _parse_dataset(self):
+        if self.cache_dir is None:
+            arrays = self._decode_dataset()
+        else:
+            cache_prefix = os.path.join(self.cache_dir,
+                                        os.path.basename(self.image_path))
+            arrays = _load_cached_arrays(
+                cache_prefix, [self.image_path, self.label_path],
+                ['images', 'labels'], self._decode_dataset)
+        # images are kept as uint8 with shape [N, rows * cols], and
+        # labels as int64 with shape [N, 1]
+        self.images = arrays['images']
+        self.labels = arrays['labels']
+
+    def _decode_dataset(self):
         with gzip.GzipFile(self.image_path, 'rb') as image_file:
             img_buf = image_file.read()
-            with gzip.GzipFile(self.label_path, 'rb') as label_file:
-                lab_buf = label_file.read()
-
-                step_label = 0
-                offset_img = 0
-                # read from Big-endian
-                # get file info from magic byte
-                # image file : 16B
-                magic_byte_img = '>IIII'
-                magic_img, image_num, rows, cols = struct.unpack_from(
-                    magic_byte_img, img_buf, offset_img)
-                offset_img += struct.calcsize(magic_byte_img)
-
-                offset_lab = 0
-                # label file : 8B
-                magic_byte_lab = '>II'
-                magic_lab, label_num = struct.unpack_from(magic_byte_lab,
-                                                          lab_buf, offset_lab)
-                offset_lab += struct.calcsize(magic_byte_lab)
-
-                while True:
-                    if step_label >= label_num:
-                        break
-                    fmt_label = '>' + str(buffer_size) + 'B'
-                    labels = struct.unpack_from(fmt_label, lab_buf, offset_lab)
-                    offset_lab += struct.calcsize(fmt_label)
-                    step_label += buffer_size
-
-                    fmt_images = '>' + str(buffer_size * rows * cols) + 'B'
-                    images_temp = struct.unpack_from(fmt_images, img_buf,
-                                                     offset_img)
-                    images = np.reshape(images_temp, (buffer_size, rows *
-                                                      cols)).astype('float32')
-                    offset_img += struct.calcsize(fmt_images)
-
-                    for i in range(buffer_size):
-                        self.images.append(images[i, :])
-                        self.labels.append(
-                            np.array([labels[i]]).astype('int64'))
+        with gzip.GzipFile(self.label_path, 'rb') as label_file:
+            lab_buf = label_file.read()
+
+        # read from Big-endian
+        # get file info from magic byte
+        # image file : 16B
+        magic_byte_img = '>IIII'
+        magic_img, image_num, rows, cols = struct.unpack_from(magic_byte_img,
+                                                              img_buf, 0)
+        # label file : 8B
+        magic_byte_lab = '>II'
+        magic_lab, label_num = struct.unpack_from(magic_byte_lab, lab_buf, 0)
+
+        images = np.frombuffer(
+            img_buf,
+            dtype=np.uint8,
+            count=image_num * rows * cols,
+            offset=struct.calcsize(magic_byte_img)).reshape(
+                [image_num, rows * cols])
+        labels = np.frombuffer(
+            lab_buf,
+            dtype=np.uint8,
+            count=label_num,
+            offset=struct.calcsize(magic_byte_lab)).astype('int64').reshape(
+                [label_num, 1])
+        return {'images': images, 'labels': labels}
 
     def __getitem__(self, idx):
         image, label = self.images[idx], self.labels[idx]
-        image = np.reshape(image, [1, 28, 28])
+        image = np.reshape(image, [1, 28, 28]).astype('float32')
         if self.transform is not None:
             image = self.transform(image)
         return image.astype(self.dtype), label.astype('int64')
@@ -15,13 +15,13 @@
 from __future__ import print_function
 
 import io
-import tarfile
 import numpy as np
 from PIL import Image
 
 import paddle
 from paddle.io import Dataset
 from paddle.dataset.common import _check_exists_and_download
+from .archive import TarArchive
 
 __all__ = ["VOC2012"]
 
@@ -48,6 +48,10 @@ class VOC2012(Dataset):
         mode(str): 'train', 'valid' or 'test' mode. Default 'train'.
         download(bool): whether to download dataset automatically if
             :attr:`data_file` is not set. Default True
+        cache_dir(str): directory to cache the member index of
+            :attr:`data_file`, so that samples can be read randomly
+            and concurrently in DataLoader workers. Default None, the
+            index is built in memory and not cached.
 
     Examples:
 
@@ -82,7 +86,8 @@ class VOC2012(Dataset):
                  data_file=None,
                  mode='train',
                  transform=None,
-                 download=True):
+                 download=True,
+                 cache_dir=None):
         assert mode.lower() in ['train', 'valid', 'test'], \
             "mode should be 'train', 'valid' or 'test', but got {}".format(mode)
         self.flag = MODE_FLAG_MAP[mode.lower()]
@@ -93,6 +98,7 @@ class VOC2012(Dataset):
             self.data_file = _check_exists_and_download(
                 data_file, VOC_URL, VOC_MD5, CACHE_DIR, download)
         self.transform = transform
+        self.cache_dir = cache_dir
 
         # read dataset into memory
         self._load_anno()
@@ -100,13 +106,10 @@ class VOC2012(Dataset):
         self.dtype = paddle.get_default_dtype()
 
     def _load_anno(self):
-        self.name2mem = {}
-        self.data_tar = tarfile.open(self.data_file)
-        for ele in self.data_tar.getmembers():
-            self.name2mem[ele.name] = ele
+        self.data_tar = TarArchive(self.data_file, self.cache_dir)
 
         set_file = SET_FILE.format(self.flag)
-        sets = self.data_tar.extractfile(self.name2mem[set_file])
+        sets = self.data_tar.read(set_file).splitlines()
 
         self.data = []
         self.labels = []
@@ -122,8 +125,8 @@ class VOC2012(Dataset):
         data_file = self.data[idx]
         label_file = self.labels[idx]
 
-        data = self.data_tar.extractfile(self.name2mem[data_file]).read()
-        label = self.data_tar.extractfile(self.name2mem[label_file]).read()
+        data = self.data_tar.read(data_file)
+        label = self.data_tar.read(label_file)
         data = Image.open(io.BytesIO(data))
         label = Image.open(io.BytesIO(label))
         data = np.array(data)
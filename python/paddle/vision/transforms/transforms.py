@@ -26,6 +26,7 @@ import warnings
 import traceback
 
 from paddle.utils import try_import
+from paddle.fluid.dataloader.collate import default_collate_fn
 from . import functional as F
 
 if sys.version_info < (3, 3):
@@ -57,6 +58,11 @@ __all__ = [
     "Pad",
     "RandomRotate",
     "Grayscale",
+    "BatchCenterCrop",
+    "BatchRandomCrop",
+    "BatchRandomHorizontalFlip",
+    "BatchRandomVerticalFlip",
+    "BatchNormalize",
 ]
 
 
@@ -119,9 +125,19 @@ class Compose(object):
 class BatchCompose(object):
     """Composes several batch transforms together
 
+    Transforms perform on the sample list by default. Batch transforms,
+    such as :code:`BatchRandomCrop` and :code:`BatchNormalize`, perform
+    on the whole image batch with (N, H, W, C) shape, the sample list will
+    be collated into batch fields before the first batch transform, and
+    the collated batch fields will be returned. Sample transforms can not
+    follow batch transforms.
+
     Args:
         transforms (list): List of transforms to compose.
                            these transforms perform on batch data.
+        image_field (int): Index of the image field in collated batch
+                           fields, which batch transforms perform on.
+                           Default: 0.
 
     Examples:
     
@@ -186,19 +202,37 @@ class BatchCompose(object):
                 break
     """
 
-    def __init__(self, transforms=[]):
+    def __init__(self, transforms=[], image_field=0):
         self.transforms = transforms
+        self.image_field = image_field
 
     def __call__(self, data):
+        collated = False
         for f in self.transforms:
             try:
-                data = f(data)
+                if isinstance(f, _BatchTransform):
+                    # collate samples into batch fields before the first
+                    # batch transform, which performs on the whole image
+                    # batch with shape (N, H, W, C)
+                    if not collated:
+                        data = default_collate_fn(data)
+                        collated = True
+                    data[self.image_field] = f(data[self.image_field])
+                elif collated:
+                    raise TypeError(
+                        "sample transform [{}] can not be performed after "
+                        "batch transforms".format(f))
+                else:
+                    data = f(data)
             except Exception as e:
                 stack_info = traceback.format_exc()
                 print("fail to perform batch transform [{}] with error: "
                       "{} and stack:\n{}".format(f, e, str(stack_info)))
                 raise e
 
+        if collated:
+            return data
+
         # sample list to batch data
         batch = list(zip(*data))
 
@@ -1177,3 +1211,249 @@ class Grayscale(object):
             numpy.ndarray: Randomly grayscaled image.
         """
         return F.to_grayscale(img, num_output_channels=self.output_channels)
+
+
+class _BatchTransform(object):
+    """
+    Base class of transforms performing on a batch of images with
+    (N, H, W, C) shape by vectorized numpy operations.
+    """
+
+    def _check_batch(self, batch):
+        if len(batch.shape) != 4:
+            raise ValueError(
+                "Expect image batch have 4 dims with (N, H, W, C) shape, "
+                "but got {} dims".format(len(batch.shape)))
+
+
+def _batch_crop(batch, top, left, size):
+    # gather crops of all images by one fancy indexing, index arrays
+    # are broadcasted to (N, th, tw)
+    th, tw = size
+    index = np.arange(batch.shape[0]).reshape((-1, 1, 1))
+    rows = (top.reshape((-1, 1)) + np.arange(th)).reshape((-1, th, 1))
+    cols = (left.reshape((-1, 1)) + np.arange(tw)).reshape((-1, 1, tw))
+    return batch[index, rows, cols]
+
+
+class BatchCenterCrop(_BatchTransform):
+    """Crops the given batch of images at the center.
+
+    Args:
+        output_size: Target size of output image, with (height, width) shape.
+    
+    Examples:
+    
+        .. code-block:: python
+
+            import numpy as np
+
+            from paddle.vision.transforms import BatchCenterCrop
+
+            transform = BatchCenterCrop(224)
+
+            fake_imgs = np.random.randint(0, 256, (4, 256, 256, 3), 'uint8')
+
+            fake_imgs = transform(fake_imgs)
+            print(fake_imgs.shape)
+    """
+
+    def __init__(self, output_size):
+        if isinstance(output_size, int):
+            self.output_size = (output_size, output_size)
+        else:
+            self.output_size = output_size
+
+    def __call__(self, batch):
+        self._check_batch(batch)
+        th, tw = self.output_size
+        _, h, w, _ = batch.shape
+        assert th <= h and tw <= w, "output size is bigger than image size"
+        x = int(round((w - tw) / 2.0))
+        y = int(round((h - th) / 2.0))
+        return batch[:, y:y + th, x:x + tw]
+
+
+class BatchRandomCrop(_BatchTransform):
+    """Crops each image of the given batch at a random location.
+
+    Args:
+        size (sequence|int): Desired output size of the crop. If size is an
+            int instead of sequence like (h, w), a square crop (size, size) is
+            made.
+        padding (int): Optional padding on each border of the images.
+            Default: 0.
+    
+    Examples:
+    
+        .. code-block:: python
+
+            import numpy as np
+
+            from paddle.vision.transforms import BatchRandomCrop
+
+            transform = BatchRandomCrop(224)
+
+            fake_imgs = np.random.randint(0, 256, (4, 256, 256, 3), 'uint8')
+
+            fake_imgs = transform(fake_imgs)
+            print(fake_imgs.shape)
+    """
+
+    def __init__(self, size, padding=0):
+        if isinstance(size, numbers.Number):
+            self.size = (int(size), int(size))
+        else:
+            self.size = size
+        self.padding = padding
+
+    def __call__(self, batch):
+        self._check_batch(batch)
+        if self.padding > 0:
+            p = self.padding
+            batch = np.pad(batch, ((0, 0), (p, p), (p, p), (0, 0)),
+                           'constant')
+        n, h, w, _ = batch.shape
+        th, tw = self.size
+        if th > h or tw > w:
+            raise ValueError("crop size {} is bigger than image size {}".format(
+                self.size, (h, w)))
+        top = np.random.randint(0, h - th + 1, size=n)
+        left = np.random.randint(0, w - tw + 1, size=n)
+        return _batch_crop(batch, top, left, self.size)
+
+
+class BatchRandomHorizontalFlip(_BatchTransform):
+    """Horizontally flip each image of the given batch randomly with a given
+    probability.
+
+    Args:
+        prob (float): Probability of the images being flipped. Default: 0.5
+
+    Examples:
+    
+        .. code-block:: python
+
+            import numpy as np
+
+            from paddle.vision.transforms import BatchRandomHorizontalFlip
+
+            transform = BatchRandomHorizontalFlip()
+
+            fake_imgs = np.random.randint(0, 256, (4, 256, 256, 3), 'uint8')
+
+            fake_imgs = transform(fake_imgs)
+            print(fake_imgs.shape)
+    """
+
+    def __init__(self, prob=0.5):
+        self.prob = prob
+
+    def __call__(self, batch):
+        self._check_batch(batch)
+        mask = np.random.random(batch.shape[0]) < self.prob
+        return np.where(mask[:, np.newaxis, np.newaxis, np.newaxis],
+                        batch[:, :, ::-1], batch)
+
+
+class BatchRandomVerticalFlip(_BatchTransform):
+    """Vertically flip each image of the given batch randomly with a given
+    probability.
+
+    Args:
+        prob (float): Probability of the images being flipped. Default: 0.5
+
+    Examples:
+    
+        .. code-block:: python
+
+            import numpy as np
+
+            from paddle.vision.transforms import BatchRandomVerticalFlip
+
+            transform = BatchRandomVerticalFlip()
+
+            fake_imgs = np.random.randint(0, 256, (4, 256, 256, 3), 'uint8')
+
+            fake_imgs = transform(fake_imgs)
+            print(fake_imgs.shape)
+    """
+
+    def __init__(self, prob=0.5):
+        self.prob = prob
+
+    def __call__(self, batch):
+        self._check_batch(batch)
+        mask = np.random.random(batch.shape[0]) < self.prob
+        return np.where(mask[:, np.newaxis, np.newaxis, np.newaxis],
+                        batch[:, ::-1], batch)
+
+
+class BatchNormalize(_BatchTransform):
+    """Normalize the given batch of images with mean and standard deviation,
+    and change the images to the target mode in the same pass.
+    Given mean: ``(M1,...,Mn)`` and std: ``(S1,..,Sn)`` for ``n`` channels,
+    ``output[channel] = (input[channel] - mean[channel]) / std[channel]``
+
+    The output is a float32 batch with (N, C, H, W) shape if :attr:`mode`
+    is "CHW", which is the same as performing :code:`Permute` and
+    :code:`Normalize` on each image, but the input batch (usually uint8)
+    is only read once and only the output batch is allocated.
+
+    Args:
+        mean (int|float|list): Sequence of means for each channel.
+        std (int|float|list): Sequence of standard deviations for each channel.
+        mode (str): Output mode of images, "CHW" or "HWC". Default: "CHW".
+        to_rgb (bool): Convert 'bgr' image to 'rgb'. Default: False.
+
+    Examples:
+    
+        .. code-block:: python
+
+            import numpy as np
+
+            from paddle.vision.transforms import BatchNormalize
+
+            normalize = BatchNormalize(mean=[123.675, 116.28, 103.53],
+                                       std=[58.395, 57.120, 57.375])
+
+            fake_imgs = np.random.randint(0, 256, (4, 224, 224, 3), 'uint8')
+
+            fake_imgs = normalize(fake_imgs)
+            print(fake_imgs.shape)
+    """
+
+    def __init__(self, mean=0.0, std=1.0, mode="CHW", to_rgb=False):
+        assert mode in [
+            "CHW", "HWC"
+        ], "Only support 'CHW' and 'HWC' mode, but received mode: {}".format(
+            mode)
+        if isinstance(mean, numbers.Number):
+            mean = [mean, mean, mean]
+
+        if isinstance(std, numbers.Number):
+            std = [std, std, std]
+
+        self.mode = mode
+        self.to_rgb = to_rgb
+        # (x - mean) / std is computed as x * scale + shift
+        std = np.array(std, dtype=np.float32)
+        self.scale = 1.0 / std
+        self.shift = -np.array(mean, dtype=np.float32) / std
+
+    def __call__(self, batch):
+        self._check_batch(batch)
+        if self.to_rgb:
+            batch = batch[..., ::-1]
+        if self.mode == "CHW":
+            n, h, w, c = batch.shape
+            batch = batch.transpose((0, 3, 1, 2))
+            scale = self.scale.reshape((c, 1, 1))
+            shift = self.shift.reshape((c, 1, 1))
+        else:
+            scale = self.scale
+            shift = self.shift
+        out = np.empty(batch.shape, dtype=np.float32)
+        np.multiply(batch, scale, out=out)
+        out += shift
+        return out
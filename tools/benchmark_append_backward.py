@@ -0,0 +1,96 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measure the time of `fluid.backward.append_backward` as the program grows.
+
+Usage:
+    python benchmark_append_backward.py [--sizes 100,200,400,800]
+                                        [--repeat 3] [--net shared_fc]
+
+Two kinds of programs are built for each size:
+    chain:     `size` fc layers stacked one after another.
+    shared_fc: `size` fc layers sharing the same input and parameters, whose
+               gradients are renamed and summed by backward.
+
+The median time of each size is printed, together with the ratio to the
+previous size, which stays close to the ratio of sizes if backward
+construction scales linearly.
+"""
+
+from __future__ import print_function
+
+import time
+import argparse
+
+import paddle
+import paddle.fluid as fluid
+
+NETS = ['chain', 'shared_fc']
+
+
+def build_net(net, size):
+    x = fluid.data(name='x', shape=[None, 16], dtype='float32')
+    if net == 'chain':
+        out = x
+        for _ in range(size):
+            out = fluid.layers.fc(out, size=16, act='relu')
+    else:
+        param_attr = fluid.ParamAttr(name='shared_w')
+        bias_attr = fluid.ParamAttr(name='shared_b')
+        out = fluid.layers.sums([
+            fluid.layers.fc(x,
+                            size=16,
+                            param_attr=param_attr,
+                            bias_attr=bias_attr) for _ in range(size)
+        ])
+    return fluid.layers.mean(out)
+
+
+def measure(net, size):
+    main_program = fluid.Program()
+    startup_program = fluid.Program()
+    with fluid.program_guard(main_program, startup_program):
+        with fluid.unique_name.guard():
+            loss = build_net(net, size)
+            num_ops = len(main_program.global_block().ops)
+            start = time.time()
+            fluid.backward.append_backward(loss)
+            return time.time() - start, num_ops
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=str, default='100,200,400,800')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--net', type=str, default=None, choices=NETS)
+    args = parser.parse_args()
+
+    paddle.enable_static()
+    sizes = [int(size) for size in args.sizes.split(',')]
+    for net in [args.net] if args.net else NETS:
+        print("{}:".format(net))
+        print("{:>8} {:>10} {:>12} {:>8}".format('size', 'forward ops',
+                                                 'backward(s)', 'ratio'))
+        prev = None
+        for size in sizes:
+            results = sorted(measure(net, size) for _ in range(args.repeat))
+            median, num_ops = results[len(results) // 2]
+            ratio = '-' if prev is None else '{:.2f}'.format(median / prev)
+            print("{:>8} {:>10} {:>12.3f} {:>8}".format(size, num_ops, median,
+                                                        ratio))
+            prev = median
+
+
+if __name__ == '__main__':
+    main()
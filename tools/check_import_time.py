@@ -0,0 +1,72 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measure the time of `import paddle` in fresh interpreters.
+
+Usage:
+    python check_import_time.py [--repeat 5] [--max_seconds 3.0]
+                                [--module paddle] [--eager]
+
+The median time is printed, and the script exits with 1 if it is larger
+than --max_seconds, so that it can guard startup time regressions in CI.
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import argparse
+import subprocess
+
+TIMING_CODE = """
+import time
+start = time.time()
+import {module}
+print(time.time() - start)
+"""
+
+
+def measure(module, eager=False):
+    env = dict(os.environ)
+    if eager:
+        env['PADDLE_LAZY_IMPORT'] = '0'
+    output = subprocess.check_output(
+        [sys.executable, '-c', TIMING_CODE.format(module=module)], env=env)
+    return float(output.decode().strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--module', type=str, default='paddle')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--max_seconds', type=float, default=None)
+    parser.add_argument(
+        '--eager',
+        action='store_true',
+        help='import with PADDLE_LAZY_IMPORT=0 for comparison')
+    args = parser.parse_args()
+
+    times = sorted(measure(args.module, args.eager) for _ in range(args.repeat))
+    median = times[len(times) // 2]
+    print("import {}: median {:.3f}s, min {:.3f}s, max {:.3f}s over {} runs".
+          format(args.module, median, times[0], times[-1], args.repeat))
+
+    if args.max_seconds is not None and median > args.max_seconds:
+        print("import {} takes {:.3f}s, which is longer than {:.3f}s".format(
+            args.module, median, args.max_seconds))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()